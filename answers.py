@@ -0,0 +1,150 @@
+"""
+Journal of learned question/answers backed by qa.csv.
+
+New answers are buffered in memory and written back in bulk, at the end of
+each application or after flush_interval seconds, instead of one append per
+question. A write-back takes an exclusive lock next to the file, merges in what
+other bot processes sharing it have written since, and rewrites it through a
+temp file and rename, so readers never see a partial file and questions that
+only differ in whitespace are stored once.
+"""
+from __future__ import annotations
+
+import csv
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+import csvstore
+
+log = logging.getLogger("easyapplybot.answers")
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def normalize_question(question) -> str:
+    return " ".join(str(question).split())
+
+
+@contextmanager
+def file_lock(path):
+    """
+    Holds an exclusive lock on `path`.lock for the duration of the block.
+    """
+    with open(str(path) + ".lock", "a+") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        else:
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+            else:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def read_normalized(path) -> dict:
+    if not os.path.isfile(path):
+        return {}
+    return {normalize_question(q): a for q, a in csvstore.read_answers(path).items()}
+
+
+def write_atomic(path, answers) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=".qa-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(csvstore.QA_COLUMNS)
+            writer.writerows(answers.items())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+class AnswerJournal:
+    def __init__(self, path="qa.csv", flush_interval=60, clock=time.monotonic):
+        self.path = str(path)
+        self.flush_interval = flush_interval
+        self._clock = clock
+        self._pending = {}
+        self._last_flush = clock()
+        # pipeline workers share the journal
+        self._lock = threading.Lock()
+        with file_lock(self.path):
+            self.answers = read_normalized(self.path)
+            # compacts whitespace duplicates left by older versions, and creates the file
+            write_atomic(self.path, self.answers)
+
+    def get(self, question):
+        return self.answers.get(normalize_question(question))
+
+    def __contains__(self, question) -> bool:
+        return normalize_question(question) in self.answers
+
+    def __len__(self) -> int:
+        return len(self.answers)
+
+    def add(self, question, answer) -> bool:
+        """
+        Buffers a newly learned answer. Returns False if the question is
+        already known. Flushes when flush_interval has passed since the last one.
+        """
+        key = normalize_question(question)
+        with self._lock:
+            if key in self.answers:
+                return False
+            self.answers[key] = answer
+            self._pending[key] = answer
+            due = self._clock() - self._last_flush >= self.flush_interval
+        if due:
+            self.flush()
+        return True
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def flush(self) -> None:
+        """
+        Merges the buffered answers into the file. Answers already on disk win,
+        including ones edited by hand or written by another process.
+        """
+        with self._lock:
+            self._last_flush = self._clock()
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        try:
+            with file_lock(self.path):
+                merged = read_normalized(self.path)
+                for key, answer in pending.items():
+                    merged.setdefault(key, answer)
+                write_atomic(self.path, merged)
+        except OSError as e:
+            log.error(f"Failed to write answers to {self.path}, keeping {len(pending)} in memory: {e}")
+            with self._lock:
+                for key, answer in pending.items():
+                    self._pending.setdefault(key, answer)
+            return
+        log.info(f"Saved {len(pending)} new answers to {self.path}")
+        with self._lock:
+            self.answers.update(merged)
+
+    def close(self) -> None:
+        self.flush()
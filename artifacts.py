@@ -0,0 +1,247 @@
+"""
+Sampled debug artifacts (screenshots, page sources, notes) written in the background.
+
+When a flow fails, e.g. no recruiter found or a form that cannot be sent,
+the bot asks the ArtifactStore for a capture. Only the first `sample_first`
+failures of each kind are captured, then one in `sample_every`. Captures
+that are sampled out cost nothing. A sampled capture fetches the screenshot
+and page source on the calling thread, because WebDriver is not thread-safe.
+Compressing and writing them happens on a worker thread. The directory is
+kept under `max_bytes` by evicting the least recently used artifacts.
+index.jsonl links every artifact to its job ID:
+
+    python artifacts.py list [--results out.csv]
+    python artifacts.py show JOB_ID
+"""
+from __future__ import annotations
+
+import argparse
+import collections
+import gzip
+import json
+import logging
+import os
+import queue
+import re
+import threading
+import time
+
+log = logging.getLogger("easyapplybot.artifacts")
+
+INDEX_FILE = "index.jsonl"
+
+
+def _safe(text) -> str:
+    return re.sub(r"[^\w-]+", "_", str(text))[:40]
+
+
+class ArtifactStore:
+    def __init__(self, directory="debug_artifacts", max_bytes=200 * 2 ** 20, sample_first=3, sample_every=20,
+                 queue_size=16):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.sample_first = sample_first
+        self.sample_every = max(1, sample_every or 1)
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._seen = collections.Counter()
+        self.captured = 0
+        self.sampled_out = 0
+        self.dropped = 0
+        self.evicted = 0
+        self._files = self._scan()
+        self._compact_index()
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._worker = threading.Thread(target=self._run, name="artifacts", daemon=True)
+        self._worker.start()
+
+    def _scan(self) -> dict:
+        """
+        Returns {path: (last use, size)} for the artifact files on disk.
+        """
+        files = {}
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name != INDEX_FILE:
+                stat = entry.stat()
+                files[entry.path] = (stat.st_mtime, stat.st_size)
+        return files
+
+    def _compact_index(self) -> None:
+        # drop index entries whose files were evicted in earlier runs
+        entries = [e for e in self.entries()
+                   if any(os.path.join(self.directory, f) in self._files for f in e["files"])]
+        path = os.path.join(self.directory, INDEX_FILE)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+        os.replace(path + ".tmp", path)
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return sum(size for _, size in self._files.values())
+
+    def sampled(self, kind) -> bool:
+        """
+        Counts a failure of `kind` and returns whether it should be captured.
+        """
+        with self._lock:
+            self._seen[kind] += 1
+            n = self._seen[kind]
+            keep = n <= self.sample_first or (n - self.sample_first) % self.sample_every == 0
+            if not keep:
+                self.sampled_out += 1
+            return keep
+
+    def capture(self, kind, job_id=None, browser=None, note=None, screenshot=True, page_source=True) -> str | None:
+        """
+        Captures an artifact if this failure is sampled, returning its name.
+        `note` is any JSON-serializable detail, or a callable returning one
+        that is only evaluated for sampled captures.
+        """
+        if not self.sampled(kind):
+            return None
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{_safe(kind)}-{_safe('none' if job_id is None else job_id)}"
+        parts = {}
+        try:
+            if callable(note):
+                note = note()
+            if browser is not None and screenshot:
+                parts["png"] = browser.get_screenshot_as_png()
+            if browser is not None and page_source:
+                parts["html"] = browser.page_source
+        except Exception as e:
+            log.debug(f"Capturing {kind} artifact failed: {e}")
+        if note is not None:
+            parts["note"] = note
+        if not parts:
+            return None
+        try:
+            self._queue.put_nowait((name, kind, job_id, parts))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return None
+        return name
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            except Exception as e:
+                log.warning(f"Writing debug artifact failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, name, kind, job_id, parts) -> None:
+        files = []
+        for part, data in parts.items():
+            if part == "png":
+                filename, payload = name + ".png", data
+            elif part == "html":
+                filename, payload = name + ".html.gz", gzip.compress(data.encode("utf-8"), compresslevel=6)
+            else:
+                filename = name + ".json.gz"
+                payload = gzip.compress(json.dumps(data, default=str).encode("utf-8"), compresslevel=6)
+            path = os.path.join(self.directory, filename)
+            with open(path, "wb") as f:
+                f.write(payload)
+            files.append(filename)
+            with self._lock:
+                self._files[path] = (time.time(), len(payload))
+        entry = {"name": name, "kind": kind, "job_id": None if job_id is None else str(job_id),
+                 "t": round(time.time(), 3), "files": files}
+        with open(os.path.join(self.directory, INDEX_FILE), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        with self._lock:
+            self.captured += 1
+        self._evict()
+
+    def _evict(self) -> None:
+        with self._lock:
+            total = sum(size for _, size in self._files.values())
+            if total <= self.max_bytes:
+                return
+            for path, (_, size) in sorted(self._files.items(), key=lambda item: item[1][0]):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                del self._files[path]
+                total -= size
+                self.evicted += 1
+
+    def entries(self) -> list:
+        path = os.path.join(self.directory, INDEX_FILE)
+        if not os.path.exists(path):
+            return []
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def for_job(self, job_id) -> list:
+        """
+        Returns the paths of a job's artifacts still on disk, marking them as recently used.
+        """
+        paths = []
+        for entry in self.entries():
+            if entry["job_id"] != str(job_id):
+                continue
+            for filename in entry["files"]:
+                path = os.path.join(self.directory, filename)
+                if os.path.exists(path):
+                    os.utime(path)
+                    with self._lock:
+                        if path in self._files:
+                            self._files[path] = (time.time(), self._files[path][1])
+                    paths.append(path)
+        return paths
+
+    def flush(self) -> None:
+        self._queue.join()
+
+    def summary(self) -> str:
+        return (f"{self.captured} captured, {self.sampled_out} sampled out, {self.dropped} dropped, "
+                f"{self.evicted} files evicted, {self.size / 2 ** 20:.1f} MiB on disk")
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._worker.join()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Debug artifact tools")
+    parser.add_argument("--directory", default="debug_artifacts")
+    commands = parser.add_subparsers(dest="command", required=True)
+    list_parser = commands.add_parser("list")
+    list_parser.add_argument("--results", default=None, help="output file to join the results from")
+    show_parser = commands.add_parser("show")
+    show_parser.add_argument("job_id")
+    args = parser.parse_args()
+
+    store = ArtifactStore(args.directory)
+    try:
+        if args.command == "list":
+            results = {}
+            if args.results:
+                import csvstore
+                results = {row["jobID"]: row for row in csvstore.iter_results(args.results)}
+            for entry in store.entries():
+                row = results.get(entry["job_id"])
+                outcome = f" {row['job']} | {row['company']} applied={row['result']}" if row else ""
+                files = [f for f in entry["files"] if os.path.exists(os.path.join(store.directory, f))]
+                print(f"{entry['name']}: {', '.join(files) or 'evicted'}{outcome}")
+            print(store.summary())
+        elif args.command == "show":
+            paths = store.for_job(args.job_id)
+            print("\n".join(paths) if paths else f"no artifacts for {args.job_id}")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Blacklist matching cost as the company and title lists grow.
+
+Generates synthetic blacklists and job cards, then times the compiled
+Matcher against the old per-entry substring scan for each list size. The
+scan's cost grows with the list. The Matcher's should stay about flat, and
+it is built once per config load.
+
+    python benchmarks/blacklist.py [--sizes 10,100,1000,10000] [--cards 2000]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from matchers import Matcher  # noqa: E402
+
+WORDS = ["senior", "junior", "lead", "staff", "python", "java", "data", "platform", "backend", "frontend",
+         "cloud", "security", "mobile", "react", "engineer", "developer", "analyst", "manager", "architect"]
+SUFFIXES = ["Ltd", "Group", "Technologies", "Partners", "Labs", "Consulting", "plc", "Solutions"]
+
+
+def random_word(rnd) -> str:
+    return "".join(rnd.choice(string.ascii_lowercase) for _ in range(rnd.randint(4, 9))).capitalize()
+
+
+def generate(size, cards, seed=5) -> tuple:
+    rnd = random.Random(seed)
+    companies = [f"{random_word(rnd)} {rnd.choice(SUFFIXES)}" for _ in range(size)]
+    titles = [" ".join(rnd.sample(WORDS, 2)) + " " + random_word(rnd) for _ in range(size)]
+    samples = []
+    for _ in range(cards):
+        company = rnd.choice(companies) if rnd.random() < 0.05 else f"{random_word(rnd)} {rnd.choice(SUFFIXES)}"
+        title = " ".join(w.capitalize() for w in rnd.sample(WORDS, 3))
+        if rnd.random() < 0.05:
+            title += " " + rnd.choice(titles).title()
+        samples.append((title, company))
+    return companies, titles, samples
+
+
+def scan(samples, companies, titles) -> int:
+    return sum(company in companies or any(word in title for word in titles) for title, company in samples)
+
+
+def compiled(samples, company_matcher, title_matcher) -> int:
+    return sum(company_matcher.search(company) is not None or title_matcher.search(title) is not None
+               for title, company in samples)
+
+
+def timed(fn, repeat) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10,100,1000,10000")
+    parser.add_argument("--cards", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'entries':>8} {'build ms':>9} {'scan us/card':>13} {'matcher us/card':>16} {'hits':>6}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        companies, titles, samples = generate(size, args.cards)
+        start = time.perf_counter()
+        company_matcher, title_matcher = Matcher(companies), Matcher(titles)
+        build = time.perf_counter() - start
+        scan_time = timed(lambda: scan(samples, companies, titles), args.repeat)
+        matcher_time = timed(lambda: compiled(samples, company_matcher, title_matcher), args.repeat)
+        hits = compiled(samples, company_matcher, title_matcher)
+        print(f"{size:>8} {build * 1000:>9.1f} {scan_time / len(samples) * 1e6:>13.1f} "
+              f"{matcher_time / len(samples) * 1e6:>16.1f} {hits:>6}")
+
+
+if __name__ == "__main__":
+    main()
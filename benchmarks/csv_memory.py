@@ -0,0 +1,97 @@
+"""
+Memory and time benchmark for reading applied job IDs from out.csv.
+
+Generates a large synthetic out.csv and, each in a fresh interpreter, loads
+the job IDs of the last two days with the streaming csvstore reader and (if
+installed) with the previous pandas implementation, reporting wall time and
+peak RSS.
+
+    python benchmarks/csv_memory.py [--rows 1000000]
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TITLES = ["Software Engineer", "0) Full Stack Engineer", "Python Developer",
+          "Senior Software Engineer", "Full-stack Engineer (TS, React, Node - focused on AI)"]
+COMPANIES = ["Oho Group Ltd", "Oliver Bernard", "Jobot", "Venture Up", "Templeton & Partners"]
+
+READERS = {
+    "csvstore": """
+import csvstore
+ids = [row['jobID'] for row in csvstore.iter_results(PATH, since=SINCE)]
+""",
+    "pandas": """
+import pandas as pd
+df = pd.read_csv(PATH, header=None, names=['timestamp', 'jobID', 'job', 'company', 'attempted', 'result'],
+                 lineterminator='\\n', encoding='utf-8')
+df['timestamp'] = pd.to_datetime(df['timestamp'], format="%Y-%m-%d %H:%M:%S")
+df = df[df['timestamp'] > SINCE]
+ids = list(df.jobID)
+""",
+}
+
+HARNESS = """
+import resource, sys, time
+from datetime import datetime, timedelta
+sys.path.insert(0, {root!r})
+PATH = {path!r}
+SINCE = datetime.now() - timedelta(days=2)
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(len(ids), elapsed, rss * (1 if sys.platform == "darwin" else 1024))
+"""
+
+
+def make_out_csv(path, rows) -> None:
+    now = datetime.now()
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        for i in range(rows):
+            timestamp = now - timedelta(minutes=rows - i)
+            writer.writerow([timestamp.strftime("%Y-%m-%d %H:%M:%S"), 3800000000 + i,
+                             random.choice(TITLES), random.choice(COMPANIES),
+                             random.random() > 0.3, random.random() > 0.5])
+
+
+def run(reader, path) -> tuple | None:
+    script = HARNESS.format(root=ROOT, path=path, body=READERS[reader])
+    proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+    if proc.returncode != 0:
+        return None
+    count, elapsed, rss = proc.stdout.split()
+    return int(count), float(elapsed), int(rss)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "out.csv")
+        make_out_csv(path, args.rows)
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"synthetic out.csv: {args.rows:,} rows, {size_mb:.1f} MB")
+        for reader in READERS:
+            result = run(reader, path)
+            if result is None:
+                print(f"  {reader:9s} not available")
+                continue
+            count, elapsed, rss = result
+            print(f"  {reader:9s} {elapsed:7.2f} s  peak RSS {rss / 1e6:7.1f} MB  ({count:,} recent IDs)")
+
+
+if __name__ == "__main__":
+    main()
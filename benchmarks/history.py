@@ -0,0 +1,96 @@
+"""
+Query time of the columnar history against streaming out.csv.
+
+Writes a synthetic out.csv with --rows rows into a temporary directory,
+compacts it into the history, then times the history queries and the same
+aggregations done by streaming the CSV with csvstore.
+
+    python benchmarks/history.py [--rows 1000000]
+"""
+from __future__ import annotations
+
+import argparse
+import collections
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import csvstore  # noqa: E402
+import history  # noqa: E402
+
+TITLES = ["Software Engineer", "0) Full Stack Engineer", "Senior Python Developer", "Data Engineer",
+          "Backend Engineer", "DevOps Engineer", "Machine Learning Engineer"]
+SEARCHES = ["Software Engineer: London", "Python Developer: London", "Python Developer: Remote",
+            "Backend Engineer: Manchester"]
+
+
+def write_synthetic(path, rows) -> None:
+    rnd = random.Random(3)
+    start = datetime(2024, 1, 1)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        for i in range(rows):
+            stamp = (start + timedelta(seconds=i * 30)).strftime(csvstore.TIMESTAMP_FORMAT)
+            attempted = rnd.random() < 0.7
+            row = [stamp, 3800000000 + i, rnd.choice(TITLES), f"Company {rnd.randint(1, 5000)}", attempted,
+                   attempted and rnd.random() < 0.8]
+            if i % 2:
+                row.append(rnd.choice(SEARCHES))
+            writer.writerow(row)
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"  {label:34s} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def csv_queries(path) -> tuple:
+    daily = collections.Counter()
+    companies = collections.defaultdict(lambda: [0, 0])
+    for row in csvstore.iter_results(path):
+        day = row["timestamp"][:10]
+        daily[day] += row["result"] == "True"
+        company = companies[row["company"]]
+        company[0] += row["attempted"] == "True"
+        company[1] += row["result"] == "True"
+    return daily, companies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    args = parser.parse_args()
+    if not history.available():
+        sys.exit("pyarrow is not installed: pip install pyarrow")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        source = os.path.join(workdir, "out.csv")
+        write_synthetic(source, args.rows)
+        print(f"out.csv: {args.rows} rows, {os.path.getsize(source) / 2 ** 20:.1f} MiB")
+        store = history.HistoryStore(os.path.join(workdir, "history"), source=source, job_cache_path=None)
+        timed("compact", store.compact)
+        size = sum(os.path.getsize(p) for p in store.parts())
+        print(f"history: {size / 2 ** 20:.1f} MiB in {len(store.parts())} parts")
+
+        print("history (Arrow):")
+        timed("applications per day", lambda: history.applications_per_day(
+            store.read(["timestamp", "attempted", "applied"])))
+        timed("success rate per company", lambda: history.by_group(
+            store.read(["company", "attempted", "applied"]), ["company"], top=20))
+        timed("success rate per search", lambda: history.by_group(
+            store.read(["position", "location", "attempted", "applied"]), ["position", "location"]))
+        timed("rejection breakdown", lambda: history.rejections(store.read(["applied", "verdict"])))
+        print("out.csv (csv module):")
+        timed("per day and per company", lambda: csv_queries(source))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Import-time benchmark for easyapplybot.
+
+Runs `python -X importtime -c "import easyapplybot"` in a fresh interpreter a
+few times and reports the total import time and the slowest top-level
+modules, plus how long chromedriver resolution takes from the local cache.
+
+    python benchmarks/import_time.py [--runs 5] [--top 15]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_profile(module) -> list:
+    """
+    Returns [(depth, module, cumulative microseconds)] for one fresh-interpreter import.
+    """
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name[1:]
+        # nested imports are indented two spaces per level
+        entries.append(((len(name) - len(name.lstrip())) // 2, name.strip(), int(cumulative_us)))
+    return entries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="easyapplybot")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    runs = [import_profile(args.module) for _ in range(args.runs)]
+    totals = [sum(us for depth, name, us in entries if name == args.module) / 1000 for entries in runs]
+    print(f"import {args.module}: median {statistics.median(totals):.1f} ms over {args.runs} runs "
+          f"(min {min(totals):.1f} ms, max {max(totals):.1f} ms)")
+
+    last = runs[-1]
+    direct = [(name, us) for depth, name, us in last if depth == 1]
+    print(f"\nslowest imports made by {args.module} (last run):")
+    for name, us in sorted(direct, key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    heavy = ["pandas", "pyautogui", "bs4", "lxml", "webdriver_manager"]
+    names = {name for _, name, _ in last}
+    loaded = [h for h in heavy if any(n == h or n.startswith(h + ".") for n in names)]
+    print(f"\nheavy modules loaded at import: {', '.join(loaded) if loaded else 'none'}")
+
+    sys.path.insert(0, ROOT)
+    from driver_cache import cached_driver_path
+    start = time.perf_counter()
+    path = cached_driver_path(os.path.join(ROOT, ".chromedriver_cache.json"))
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"chromedriver cache lookup: {elapsed:.1f} ms ({path or 'no cached driver'})")
+
+
+if __name__ == "__main__":
+    main()
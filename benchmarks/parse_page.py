@@ -0,0 +1,114 @@
+"""
+Parse-time and memory benchmark for job pages.
+
+Compares the old load_page path (a full BeautifulSoup "lxml" tree) with each
+available pageparse backend, both parsing the whole page and parsing only the
+job description subtree. Pass saved pages with --page, otherwise a synthetic
+LinkedIn-like job page is generated.
+
+    python benchmarks/parse_page.py [--page saved.html ...] [--repeat 20]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pageparse  # noqa: E402
+
+WORDS = ("python distributed systems engineer team product platform salary london hybrid "
+         "experience design build scale api cloud aws kubernetes mentor deliver").split()
+
+
+def synthetic_job_page(cards=120, paragraphs=40) -> str:
+    """
+    Roughly the shape of a rendered job page: a large navigation and job list
+    around a comparatively small description, plus inline scripts.
+    """
+    rnd = random.Random(7)
+
+    def sentence(n=18):
+        return " ".join(rnd.choice(WORDS) for _ in range(n)).capitalize() + "."
+
+    parts = ["<!DOCTYPE html><html><head><title>Software Engineer | Example Ltd | LinkedIn</title>"]
+    parts += [f"<script>window.__data{i} = {{\"payload\": \"{'x' * 2000}\"}};</script>" for i in range(30)]
+    parts.append("</head><body><header class='global-nav'>")
+    parts += [f"<a class='global-nav__link' href='/feed/{i}'><span>Nav {i}</span></a>" for i in range(60)]
+    parts.append("</header><main><ul class='jobs-search-results__list'>")
+    for i in range(cards):
+        parts.append(f"<li><div data-job-id='{3800000000 + i}' class='job-card-container'>"
+                     f"<div class='artdeco-entity-lockup__title'><a href='/jobs/view/{i}'>{sentence(4)}</a></div>"
+                     f"<div class='artdeco-entity-lockup__subtitle'><span>Company {i}</span></div>"
+                     f"<ul class='job-card-container__metadata-wrapper'><li>London, England, United Kingdom</li></ul>"
+                     f"</div></li>")
+    parts.append("</ul><div class='jobs-search__job-details'><div class='jobs-unified-top-card'>"
+                 "<h1 class='t-24'>Software Engineer</h1><span>£60,000/yr - £75,000/yr</span></div>")
+    parts.append("<div class='jobs-description__content jobs-description-content'>"
+                 "<div class='jobs-box__html-content' id='job-details'><div><p><strong>About the role</strong></p>")
+    parts += [f"<p>{sentence()}</p><ul><li>{sentence(8)}</li><li>{sentence(8)}</li></ul>" for _ in range(paragraphs)]
+    parts.append("<p>Salary: £65,000 per year</p></div></div></div>")
+    parts += [f"<section class='similar-jobs'><div>{sentence(30)}</div></section>" for _ in range(40)]
+    parts.append("</div></main></body></html>")
+    return "".join(parts)
+
+
+def measure(fn, repeat) -> tuple:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(times), peak
+
+
+def cases(html) -> list:
+    found = []
+    try:
+        from bs4 import BeautifulSoup
+        import lxml  # noqa: F401
+        found.append(("bs4 full tree (old load_page)", lambda: BeautifulSoup(html, "lxml")))
+    except ImportError:
+        pass
+    for name in pageparse.BACKENDS:
+        try:
+            backend = pageparse.get_backend(name)
+        except RuntimeError:
+            continue
+        if backend.name != name:
+            continue
+        found.append((f"{name} full page text", lambda b=backend: b.text(b.parse(html))))
+        found.append((f"{name} description only",
+                      lambda b=name: pageparse.LazyPage(html, backend=b).description()))
+    found.append(("lazy page, never read", lambda: pageparse.LazyPage(lambda: html)))
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--page", action="append", default=[])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    pages = [(path, open(path, encoding="utf-8").read()) for path in args.page]
+    if not pages:
+        pages = [("synthetic job page", synthetic_job_page())]
+
+    for name, html in pages:
+        print(f"{name}: {len(html) / 1024:.0f} KiB")
+        for label, fn in cases(html):
+            seconds, peak = measure(fn, args.repeat)
+            print(f"  {label:32s} {seconds * 1000:8.2f} ms  peak {peak / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Scoring cost of ranking the job cards of a search page.
+
+Builds a ranking profile from the given positions (and the successful
+applications in an output file, if present), then times ranking synthetic
+pages of job cards.
+
+    python benchmarks/rank_jobs.py [--cards 25] [--pages 1 4 10] [--output out.csv]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ranking import JobRanker  # noqa: E402
+
+TITLES = ["Software Engineer", "Senior Backend Engineer", "Frontend Developer", "Python Developer",
+          "Data Engineer", "Full Stack Engineer (React, Node)", "QA Tester", "Site Reliability Engineer",
+          "Machine Learning Engineer", "Java Software Engineer", "Product Manager", "DevOps Engineer"]
+COMPANIES = ["Oho Group Ltd", "Jobot", "Venture Up", "bet365", "Arrows", "Primis", "Radley James"]
+PLACES = ["London, England, United Kingdom (Hybrid)", "Manchester (On-site)", "United Kingdom (Remote)"]
+
+
+def card(rnd) -> str:
+    return "\n".join([rnd.choice(TITLES), rnd.choice(COMPANIES), rnd.choice(PLACES),
+                      f"£{rnd.randint(40, 110)}K/yr", "Easy Apply", f"{rnd.randint(1, 200)} applicants"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cards", type=int, default=25)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 4, 10])
+    parser.add_argument("--positions", nargs="+", default=["Software Engineer", "Python Developer"])
+    parser.add_argument("--output", default="out.csv")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rnd = random.Random(1)
+    ranker = JobRanker.from_config(args.positions, args.output)
+    print(f"profile: {len(ranker.profile_docs)} documents, {len(ranker.profile_tf)} terms")
+    for pages in args.pages:
+        cards = {str(3800000000 + i): card(rnd) for i in range(args.cards * pages)}
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            ranked = ranker.rank(cards)
+            times.append(time.perf_counter() - start)
+        per_page = statistics.median(times) / pages
+        print(f"{pages:3d} page(s), {len(cards):4d} cards: {statistics.median(times) * 1000:7.2f} ms total, "
+              f"{per_page * 1000:6.2f} ms per page")
+    best = ranked[0][0]
+    print(f"top card: {cards[best].splitlines()[0]!r} ({ranked[0][1]:.3f})")
+
+
+if __name__ == "__main__":
+    main()
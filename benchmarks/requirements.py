@@ -0,0 +1,123 @@
+"""
+Accuracy and speed of the job description requirements analyzer.
+
+Checks extraction against a small labelled set of requirement phrasings,
+then, when a corpus exists, times the analyzer over every stored job
+description and compares its verdicts with what happened while browsing:
+jobs skipped in the Easy Apply form for zero experience should be caught
+before the form, and jobs applied to should mostly still pass.
+
+    python benchmarks/requirements.py [--corpus corpus] [--config config.yaml] [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from requirements import RequirementsAnalyzer  # noqa: E402
+
+DEFAULT_PROFILE = {"years": 4, "skills": {"python": 5, "aws": 2, "docker": 2, "postgresql": 3, "django": 3}}
+
+# phrase -> expected {(years, skill)}, skill None for general experience
+LABELLED = {
+    "5+ years of professional experience in Python": {(5, "python")},
+    "At least three years' experience with AWS": {(3, "aws")},
+    "Minimum of 8 years experience in software engineering": {(8, None)},
+    "2-4 years of experience with Django and PostgreSQL": {(2, "django"), (2, "postgresql")},
+    "Java (7+ years)": {(7, "java")},
+    "Kubernetes: 3 years": {(3, "kubernetes")},
+    "You have 6 yrs of hands-on React.js development": {(6, "react")},
+    "3+ years building microservices in Go (golang)": {(3, "microservices"), (3, "go")},
+    "Over five years of commercial experience": {(5, None)},
+    "We have been trading for 25 years": set(),
+    "Founded ten years ago in London": set(),
+    "Enjoy 25 days holiday plus bank holidays": set(),
+    "1 year of C# / .NET experience": {(1, "c#")},
+    "Experience with Docker and Terraform": set(),
+    "10+ years experienced engineer": {(10, None)},
+    "Proven track record over 4 years with TypeScript": {(4, "typescript")},
+    "Experience: 6 years in software engineering": {(6, None)},
+    "Founded 10 years ago, our team uses Python and Go daily": set(),
+    "We offer 25 days holiday and a 2 year Java training": set(),
+    "Our platform has grown 3x in 2 years with Kubernetes": set(),
+    "In 5 years we want to spark change and react to what customers need": set(),
+    "Spring into a role where you go further, with 3 years of swift progression": set(),
+}
+
+
+def labelled_accuracy(analyzer) -> tuple:
+    true_positive = false_positive = false_negative = 0
+    misses = []
+    for phrase, expected in LABELLED.items():
+        requirements, _ = analyzer.extract(phrase)
+        found = {(r.years, r.skill) for r in requirements}
+        true_positive += len(found & expected)
+        false_positive += len(found - expected)
+        false_negative += len(expected - found)
+        if found != expected:
+            misses.append((phrase, sorted(found, key=str), sorted(expected, key=str)))
+    precision = true_positive / (true_positive + false_positive) if true_positive + false_positive else 1.0
+    recall = true_positive / (true_positive + false_negative) if true_positive + false_negative else 1.0
+    return precision, recall, misses
+
+
+def corpus_records(directory) -> list:
+    from corpus import CorpusStore, iter_segment
+
+    latest = {}
+    for path in CorpusStore(directory).segments():
+        for record in iter_segment(path):
+            latest[record["job_id"]] = record
+    return list(latest.values())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--corpus", default="corpus")
+    parser.add_argument("--config", default=None, help="config.yaml to take experience_profile from")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    profile = DEFAULT_PROFILE
+    if args.config:
+        import yaml
+        with open(args.config) as stream:
+            profile = (yaml.safe_load(stream) or {}).get("experience_profile") or profile
+    start = time.perf_counter()
+    analyzer = RequirementsAnalyzer.from_config(profile)
+    print(f"analyzer built in {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    precision, recall, misses = labelled_accuracy(analyzer)
+    print(f"labelled phrases: {len(LABELLED)}, precision {precision:.0%}, recall {recall:.0%}")
+    for phrase, found, expected in misses:
+        print(f"  {phrase!r}: found {found}, expected {expected}")
+
+    if not os.path.isdir(args.corpus):
+        print(f"no corpus at {args.corpus}, skipping the corpus run")
+        return
+    records = [r for r in corpus_records(args.corpus) if r.get("description")]
+    if not records:
+        print(f"corpus at {args.corpus} has no descriptions")
+        return
+    times, verdicts = [], {}
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        verdicts = {r["job_id"]: analyzer.analyze(r["description"]).met for r in records}
+        times.append(time.perf_counter() - start)
+    per_job = statistics.median(times) / len(records)
+    print(f"corpus: {len(records)} descriptions, {per_job * 1e6:.0f} µs per description, "
+          f"{sum(not met for met in verdicts.values())} would be skipped")
+    for verdict, label in (("experience", "skipped in the form for zero experience"), ("applied", "applied to")):
+        group = [r["job_id"] for r in records if r.get("verdict") == verdict]
+        if group:
+            skipped = sum(not verdicts[job_id] for job_id in group)
+            print(f"  {label}: {len(group)}, {skipped} ({skipped / len(group):.0%}) skipped before the form")
+
+
+if __name__ == "__main__":
+    main()
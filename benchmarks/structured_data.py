@@ -0,0 +1,139 @@
+"""
+Structured-data extraction versus DOM scraping, and pooled versus fresh HTTP fetches.
+
+Serves synthetic LinkedIn-like search and job pages from a local http.server
+and compares, per page:
+  - the DOM path: card text from the rendered list, salary via parse_salary
+    over the page source, description via pageparse;
+  - the structured path: structured.job_cards / job_details over the same source;
+  - fetching the job page with JobDataClient's pooled connection versus a new
+    connection per request.
+
+    python benchmarks/structured_data.py [--jobs 200] [--repeat 20]
+"""
+from __future__ import annotations
+
+import argparse
+import html
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import filters  # noqa: E402
+import pageparse  # noqa: E402
+import structured  # noqa: E402
+from benchmarks.parse_page import synthetic_job_page  # noqa: E402
+
+
+def search_payload(jobs) -> str:
+    included = []
+    for i in range(jobs):
+        job_id = 3800000000 + i
+        included.append({"$type": "com.linkedin.voyager.dash.jobs.JobPostingCard",
+                         "jobPostingUrn": f"urn:li:fsd_jobPosting:{job_id}",
+                         "jobPostingTitle": f"Software Engineer {i}",
+                         "primaryDescription": {"text": f"Company {i}"},
+                         "secondaryDescription": {"text": "London, England, United Kingdom (Hybrid)"}})
+    return html.escape(json.dumps({"data": {}, "included": included}))
+
+
+def synthetic_search_page(jobs) -> str:
+    page = synthetic_job_page(cards=jobs)
+    return page.replace("</body>", f"<code id='bpr-guid-1'>{search_payload(jobs)}</code></body>")
+
+
+def synthetic_details_page() -> str:
+    posting = {"@context": "http://schema.org", "@type": "JobPosting", "title": "Software Engineer",
+               "hiringOrganization": {"@type": "Organization", "name": "Example Ltd"},
+               "jobLocation": {"@type": "Place", "address": {"addressLocality": "London", "addressCountry": "GB"}},
+               "baseSalary": {"@type": "MonetaryAmount", "currency": "GBP",
+                              "value": {"@type": "QuantitativeValue", "minValue": 65000, "unitText": "YEAR"}},
+               "directApply": True, "description": "&lt;p&gt;Salary: £65,000 per year&lt;/p&gt;"}
+    block = f"<script type='application/ld+json'>{json.dumps(posting)}</script>"
+    return synthetic_job_page().replace("</head>", block + "</head>")
+
+
+def dom_cards(page) -> list:
+    tree = pageparse.LazyPage(page)
+    try:
+        return tree.css_text("div[data-job-id]")
+    except NotImplementedError:
+        # the html.parser backend can only give the text of the whole page
+        return tree.text().splitlines()
+
+
+def dom_details(page) -> tuple:
+    lazy = pageparse.LazyPage(page)
+    return filters.parse_salary(page), lazy.description()
+
+
+def measure(fn, repeat) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def serve(pages):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = pages.get(self.path.split("?")[0], "").encode("utf-8")
+            self.send_response(200 if body else 404)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    search = synthetic_search_page(args.jobs)
+    details = synthetic_details_page()
+    print(f"search page {len(search) / 1024:.0f} KiB with {args.jobs} jobs, job page {len(details) / 1024:.0f} KiB")
+    assert len(structured.job_cards(search)) == args.jobs
+    assert structured.job_details(details)["salary_yearly"] == 65000
+
+    rows = [
+        ("job list, DOM cards", measure(lambda: dom_cards(search), args.repeat)),
+        ("job list, structured", measure(lambda: structured.job_cards(search), args.repeat)),
+        ("job details, DOM", measure(lambda: dom_details(details), args.repeat)),
+        ("job details, structured", measure(lambda: structured.job_details(details), args.repeat)),
+    ]
+
+    server = serve({"/jobs/view/1/": details})
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    client = structured.JobDataClient([{"name": "li_at", "value": "x"}])
+    rows.append(("fetch + parse, pooled", measure(lambda: client.fetch_job(1, base_url=base), args.repeat)))
+    rows.append(("fetch + parse, new connection",
+                 measure(lambda: structured.job_details(urllib.request.urlopen(f"{base}/jobs/view/1/").read()
+                                                        .decode("utf-8")), args.repeat)))
+    server.shutdown()
+
+    for label, seconds in rows:
+        print(f"  {label:32s} {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Regression gate for the Easy Apply flows, replayed from reference traces.
+
+Replays every trace in benchmarks/webtrace against the budgets in
+benchmarks/webtrace/budgets.yaml, without a browser, and exits with status 1
+when a flow issues more WebDriver commands or takes longer than its budget.
+Run it after changing selectors, pacing or form logic:
+
+    python benchmarks/webtrace_reference.py
+
+easy_apply_submit.json.gz is one application that fills the phone number,
+clicks Next and submits. It was recorded with webtrace.TraceRecorder against
+a scripted driver serving a saved job page, so it is small and stable. Add
+traces recorded from real runs (`webtrace_dir` in config.yaml) next to it to
+widen the gate.
+"""
+from __future__ import annotations
+
+import glob
+import logging
+import os
+import sys
+
+import yaml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import easyapplybot  # noqa: E402,F401  configures the bot's logging on import
+import webtrace  # noqa: E402
+
+DIRECTORY = os.path.join(ROOT, "benchmarks", "webtrace")
+
+
+def main() -> None:
+    logging.getLogger("easyapplybot").setLevel(logging.WARNING)
+    paths = sorted(glob.glob(os.path.join(DIRECTORY, "*.json.gz")))
+    if not paths:
+        sys.exit(f"No reference traces in {DIRECTORY}")
+    with open(os.path.join(DIRECTORY, "budgets.yaml")) as stream:
+        budgets = yaml.safe_load(stream)
+    failures = webtrace.check(paths, budgets)
+    print(f"{failures} flows over budget in {len(paths)} reference traces")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Reloading config.yaml while the bot runs.
+
+The watcher stats the config file at most every `check_interval` seconds.
+When the file's mtime or size changes, it loads and validates the file.
+A config that fails validation is logged and ignored until the file changes
+again. A valid one becomes the new `parameters` under a new `version`.
+Bots compare versions between jobs and apply the reloadable settings
+(filters, budgets, pacing). Everything else, such as the account, the
+searches and the output files, still needs a restart.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+
+from pacing import get_profile
+
+log = logging.getLogger("easyapplybot.configwatch")
+
+# settings a running bot can take over, with the types they must have
+RELOADABLE = {
+    "blacklist": list,
+    "blackListTitles": list,
+    "min_salary_yearly": (int, float),
+    "min_salary_hourly": (int, float),
+    "max_applications": int,
+    "experience_level": list,
+    "skip_zero_experience": bool,
+    "send_recruiter_invites": bool,
+    "apply_deadline": (int, float),
+    "apply_max_steps": int,
+    "experience_profile": dict,
+    "min_apply_interval": (int, float),
+    "max_applications_per_hour": int,
+    "pacing_profile": str,
+}
+
+
+def validate_reloadable(parameters) -> None:
+    """
+    Raises ValueError if a reloadable setting has the wrong type.
+    """
+    for key, types in RELOADABLE.items():
+        value = parameters.get(key)
+        if value is None:
+            continue
+        if isinstance(value, bool) and types is not bool:
+            raise ValueError(f"{key} should be a number, got {value!r}")
+        if not isinstance(value, types):
+            raise ValueError(f"{key} has the wrong type: {value!r}")
+    experience_level = parameters.get("experience_level") or []
+    if any(level not in range(1, 7) for level in experience_level):
+        raise ValueError(f"experience_level entries should be 1 to 6, got {experience_level}")
+    if parameters.get("pacing_profile") is not None:
+        get_profile(parameters["pacing_profile"])
+
+
+class ConfigWatcher:
+    def __init__(self, path, load, parameters=None, check_interval=5, now=time.monotonic):
+        """
+        `load` reads and validates the file, raising on an invalid config.
+        `parameters` is the config the bot was started with.
+        """
+        self.path = path
+        self.load = load
+        self.parameters = parameters
+        self.check_interval = check_interval
+        self.version = 0
+        self._now = now
+        self._lock = threading.Lock()
+        self._checked_at = now()
+        self._signature = self._stat()
+
+    def _stat(self) -> tuple | None:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def poll(self) -> int:
+        """
+        Reloads the file if it changed, returning the current version.
+        """
+        with self._lock:
+            if self._now() - self._checked_at < self.check_interval:
+                return self.version
+            self._checked_at = self._now()
+            signature = self._stat()
+            if signature is None or signature == self._signature:
+                return self.version
+            self._signature = signature
+            try:
+                parameters = self.load(self.path)
+                validate_reloadable(parameters)
+            except Exception as e:
+                log.warning(f"Ignoring the changed {self.path}, it is not valid: {e}")
+                return self.version
+            previous = self.parameters or {}
+            changed = sorted(k for k in set(parameters) | set(previous) if previous.get(k) != parameters.get(k))
+            fixed = [k for k in changed if k not in RELOADABLE]
+            changed = [k for k in changed if k in RELOADABLE]
+            if fixed:
+                log.warning(f"{', '.join(fixed)} changed in {self.path}, these take effect after a restart")
+            self.parameters = parameters
+            if not changed:
+                return self.version
+            self.version += 1
+            log.info(f"Reloaded {self.path}: {', '.join(changed)} changed")
+            return self.version
@@ -0,0 +1,293 @@
+"""
+Append-only store of visited job descriptions, and batch re-scoring.
+
+Every job page the bot opens is saved with its description text and metadata
+into compressed JSONL segments (zstd when the zstandard package is installed,
+gzip otherwise) plus a job-ID index. Changing min_salary_yearly or the
+blacklists can then be evaluated against everything seen so far without
+browsing:
+
+    python corpus.py stats
+    python corpus.py rescore --config config.yaml [--workers 4] [--show-changes]
+    python corpus.py show JOB_ID
+"""
+from __future__ import annotations
+
+import argparse
+import collections
+import glob
+import gzip
+import io
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import filters
+from matchers import Matcher
+from requirements import RequirementsAnalyzer
+
+log = logging.getLogger("easyapplybot.corpus")
+
+INDEX_FILE = "index.jsonl"
+SEGMENT_BYTES = 16 * 2 ** 20
+
+# verdicts that do not depend on the filter settings
+FIXED_VERDICTS = {"applied", "already_applied", "no_easy_apply"}
+
+
+class _Codec:
+    def __init__(self, name):
+        self.name = name
+        if name == "zst":
+            import zstandard
+            self._zstd = zstandard
+            self._compressor = zstandard.ZstdCompressor(level=10)
+
+    def compress(self, data) -> bytes:
+        if self.name == "zst":
+            return self._compressor.compress(data)
+        return gzip.compress(data, compresslevel=6)
+
+    def decompress(self, data) -> bytes:
+        if self.name == "zst":
+            # a frame written by compress() carries its content size
+            return self._zstd.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def open_stream(self, path):
+        if self.name == "zst":
+            reader = self._zstd.ZstdDecompressor().stream_reader(open(path, "rb"), read_across_frames=True,
+                                                                 closefd=True)
+            return io.TextIOWrapper(reader, encoding="utf-8")
+        return gzip.open(path, "rt", encoding="utf-8")
+
+
+def default_codec() -> str:
+    try:
+        import zstandard  # noqa: F401
+        return "zst"
+    except ImportError:
+        return "gz"
+
+
+def _codec_for(path) -> _Codec:
+    return _Codec("zst" if path.endswith(".zst") else "gz")
+
+
+class CorpusStore:
+    """
+    Records are buffered and written as one compressed frame per flush, so a
+    segment is a concatenation of independently decompressible frames. The
+    index maps each job ID to the segment, offset and length of its frame.
+    """
+
+    def __init__(self, directory="corpus", flush_every=20, codec=None):
+        self.directory = directory
+        self.flush_every = flush_every
+        self.codec = _Codec(codec or default_codec())
+        self._buffer = []
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._segment = self._current_segment()
+
+    def _segments(self) -> list:
+        return sorted(glob.glob(os.path.join(self.directory, "segment-*.jsonl.*")))
+
+    def _current_segment(self) -> str:
+        segments = [s for s in self._segments() if s.endswith("." + self.codec.name)]
+        if segments and os.path.getsize(segments[-1]) < SEGMENT_BYTES:
+            return segments[-1]
+        return self._new_segment()
+
+    def _new_segment(self) -> str:
+        number = len(self._segments()) + 1
+        return os.path.join(self.directory, f"segment-{number:06d}.jsonl.{self.codec.name}")
+
+    def append(self, job_id, description, **metadata) -> None:
+        record = {"job_id": str(job_id), "visited_at": time.strftime("%Y-%m-%d %H:%M:%S")}
+        record.update(metadata)
+        record["description"] = description
+        with self._lock:
+            self._buffer.append(record)
+            if len(self._buffer) >= self.flush_every:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        payload = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in self._buffer).encode("utf-8")
+        frame = self.codec.compress(payload)
+        if os.path.exists(self._segment) and os.path.getsize(self._segment) >= SEGMENT_BYTES:
+            self._segment = self._new_segment()
+        with open(self._segment, "ab") as f:
+            offset = f.tell()
+            f.write(frame)
+        segment = os.path.basename(self._segment)
+        with open(os.path.join(self.directory, INDEX_FILE), "a", encoding="utf-8") as f:
+            for record in self._buffer:
+                f.write(json.dumps({"job_id": record["job_id"], "segment": segment,
+                                    "offset": offset, "length": len(frame)}) + "\n")
+        self._buffer = []
+
+    def index(self) -> dict:
+        """
+        Returns {job_id: (segment, offset, length)} for the latest copy of each job.
+        """
+        entries = {}
+        path = os.path.join(self.directory, INDEX_FILE)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    entry = json.loads(line)
+                    entries[entry["job_id"]] = (entry["segment"], entry["offset"], entry["length"])
+        return entries
+
+    def get(self, job_id) -> dict | None:
+        entry = self.index().get(str(job_id))
+        if entry is None:
+            return None
+        segment, offset, length = entry
+        path = os.path.join(self.directory, segment)
+        with open(path, "rb") as f:
+            f.seek(offset)
+            frame = f.read(length)
+        found = None
+        for line in _codec_for(path).decompress(frame).decode("utf-8").splitlines():
+            record = json.loads(line)
+            if record["job_id"] == str(job_id):
+                found = record
+        return found
+
+    def segments(self) -> list:
+        self.flush()
+        return self._segments()
+
+    def close(self) -> None:
+        self.flush()
+
+
+def iter_segment(path):
+    with _codec_for(path).open_stream(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def filter_settings(parameters) -> dict:
+    return {
+        "min_salary_yearly": parameters.get("min_salary_yearly", 60000),
+        "min_salary_hourly": parameters.get("min_salary_hourly", 32),
+        "blacklist": Matcher(parameters.get("blacklist")),
+        "blackListTitles": Matcher(parameters.get("blackListTitles")),
+        "requirements": RequirementsAnalyzer.from_config(parameters.get("experience_profile")),
+    }
+
+
+def evaluate(record, settings) -> str:
+    """
+    Returns the verdict the current filter settings give a stored job.
+    """
+    if record.get("verdict") in FIXED_VERDICTS:
+        return record["verdict"]
+    if settings["blacklist"].search(record.get("company")):
+        return "blacklist"
+    yearly, hourly = filters.parse_salary(record.get("description") or "")
+    if yearly is None and hourly is None:
+        yearly, hourly = record.get("salary_yearly"), record.get("salary_hourly")
+    if not filters.meets_salary(yearly, hourly, settings["min_salary_yearly"], settings["min_salary_hourly"]):
+        return "salary"
+    if filters.title_blacklisted(record.get("title"), settings["blackListTitles"]):
+        return "title"
+    analyzer = settings.get("requirements")
+    if analyzer is not None and not analyzer.analyze(record.get("description") or "").met:
+        return "requirements"
+    return "eligible"
+
+
+def _score_segment(path, settings) -> dict:
+    """
+    Returns {job_id: (verdict, change)} for the latest copy of each job in a
+    segment, where change is set when the job's eligibility differs from the
+    verdict recorded while browsing.
+    """
+    latest = {}
+    for record in iter_segment(path):
+        latest[record["job_id"]] = record
+    scored = {}
+    for job_id, record in latest.items():
+        verdict = evaluate(record, settings)
+        old = record.get("verdict")
+        was_eligible = old not in ("salary", "title", "blacklist", "experience", "requirements")
+        change = None
+        if old not in FIXED_VERDICTS and (verdict == "eligible") != was_eligible:
+            change = (job_id, record.get("title"), record.get("company"), old, verdict)
+        scored[job_id] = (verdict, change)
+    return scored
+
+
+def rescore(directory, parameters, workers=None) -> tuple:
+    """
+    Re-evaluates the whole corpus with a process pool, one segment per task.
+    Returns (verdict counts, changed jobs). A job stored in several segments is
+    counted once, from its latest segment.
+    """
+    settings = filter_settings(parameters)
+    segments = CorpusStore(directory).segments()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_score_segment, segments, [settings] * len(segments)))
+    merged = {}
+    for scored in reversed(results):
+        for job_id, result in scored.items():
+            merged.setdefault(job_id, result)
+    verdicts = collections.Counter(verdict for verdict, _ in merged.values())
+    changes = [change for _, change in merged.values() if change is not None]
+    return verdicts, changes
+
+
+def main() -> None:
+    import yaml
+
+    parser = argparse.ArgumentParser(description="Job description corpus tools")
+    parser.add_argument("--corpus", default="corpus")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats")
+    rescore_parser = commands.add_parser("rescore")
+    rescore_parser.add_argument("--config", default="config.yaml")
+    rescore_parser.add_argument("--workers", type=int, default=None)
+    rescore_parser.add_argument("--show-changes", action="store_true")
+    show_parser = commands.add_parser("show")
+    show_parser.add_argument("job_id")
+    args = parser.parse_args()
+
+    if args.command == "stats":
+        store = CorpusStore(args.corpus)
+        segments = store.segments()
+        size = sum(os.path.getsize(s) for s in segments)
+        print(f"{len(store.index())} jobs in {len(segments)} segments, {size / 2 ** 20:.1f} MiB compressed")
+    elif args.command == "show":
+        record = CorpusStore(args.corpus).get(args.job_id)
+        print(json.dumps(record, indent=2, ensure_ascii=False) if record else f"{args.job_id} not in corpus")
+    elif args.command == "rescore":
+        with open(args.config) as stream:
+            parameters = yaml.safe_load(stream)
+        start = time.perf_counter()
+        verdicts, changes = rescore(args.corpus, parameters, args.workers)
+        elapsed = time.perf_counter() - start
+        print(f"Re-scored {sum(verdicts.values())} jobs in {elapsed:.2f}s")
+        for verdict, count in verdicts.most_common():
+            print(f"  {verdict:16s} {count}")
+        print(f"{len(changes)} jobs change eligibility with these settings")
+        if args.show_changes:
+            for job_id, title, company, old, new in changes:
+                print(f"  {job_id} {old or '-'} -> {new}: {title} | {company}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Streaming readers and a lightweight appender for the bot's CSV files.
+
+out.csv is a headerless six-column file written by write_to_file. Newer rows
+carry the "position: location" search as a seventh column and the outcome,
+e.g. "Did not apply: timed out at step 14 (form) after 180s", as an eighth.
+qa.csv is a Question,Answer file with a header. Both are plain CSV, so they
+are read row by row with the csv module instead of being loaded into a
+DataFrame.
+"""
+from __future__ import annotations
+
+import csv
+import logging
+import os
+from datetime import datetime
+from typing import Iterator
+
+log = logging.getLogger("easyapplybot.csvstore")
+
+RESULT_COLUMNS = ['timestamp', 'jobID', 'job', 'company', 'attempted', 'result']
+QA_COLUMNS = ["Question", "Answer"]
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def iter_rows(filename, encoding='utf-8') -> Iterator[list]:
+    with open(filename, 'r', newline='', encoding=encoding) as f:
+        yield from csv.reader(f)
+
+
+def iter_results(filename, since=None, until=None) -> Iterator[dict]:
+    """
+    Streams the rows of an output file as dicts keyed by RESULT_COLUMNS.
+    When since/until are given, rows outside the (since, until] window are
+    dropped while streaming, and so are rows whose timestamp does not parse.
+    """
+    windowed = since is not None or until is not None
+    # timestamps are zero-padded, so the string comparison rejects most rows without parsing them
+    since_str = since.strftime(TIMESTAMP_FORMAT) if since is not None else None
+    until_str = until.strftime(TIMESTAMP_FORMAT) if until is not None else None
+    for row in iter_rows(filename):
+        if len(row) < len(RESULT_COLUMNS):
+            continue
+        if windowed:
+            stamp = row[0]
+            if since_str is not None and stamp <= since_str:
+                continue
+            if until_str is not None and stamp > until_str:
+                continue
+            try:
+                timestamp = datetime.fromisoformat(stamp)
+            except ValueError:
+                continue
+            record = dict(zip(RESULT_COLUMNS, row))
+            record['timestamp'] = timestamp
+        else:
+            record = dict(zip(RESULT_COLUMNS, row))
+        yield record
+
+
+def read_answers(filename) -> dict:
+    """
+    Returns {question: answer} from a Question,Answer file.
+    """
+    answers = {}
+    rows = iter_rows(filename)
+    header = next(rows, None)
+    if header is None:
+        return answers
+    if header != QA_COLUMNS:
+        # no header, the first line is already a question
+        rows = _prepend(header, rows)
+    for row in rows:
+        if len(row) >= 2:
+            answers[row[0]] = row[1]
+    return answers
+
+
+def _prepend(first, rest) -> Iterator[list]:
+    yield first
+    yield from rest
+
+
+def append_row(filename, row, encoding='utf-8') -> None:
+    with open(filename, 'a', newline='', encoding=encoding) as f:
+        csv.writer(f).writerow(row)
+
+
+def ensure_file(filename, header=None) -> None:
+    """
+    Creates the file, with an optional header row, if it does not exist yet.
+    """
+    if os.path.isfile(filename):
+        return
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        if header is not None:
+            csv.writer(f).writerow(header)
@@ -0,0 +1,131 @@
+"""
+Per-application time and step budgets for the Easy Apply flow.
+
+A form with validation errors the bot cannot fix, or a run of questions it
+has no answer for, can keep one application busy for minutes. An
+ApplyDeadline is started when the Easy Apply button is clicked. send_resume
+and process_questions count their form steps against it and check it before
+every wait. Once the time or step budget is spent, DeadlineExceeded unwinds
+to apply_to_job, which discards the application and moves on to the next job.
+"""
+from __future__ import annotations
+
+import collections
+import logging
+import threading
+import time
+
+log = logging.getLogger("easyapplybot.deadline")
+
+
+class DeadlineExceeded(Exception):
+    def __init__(self, step, stage, elapsed):
+        self.step = step
+        self.stage = stage
+        self.elapsed = elapsed
+        super().__init__(f"timed out at step {step} ({stage}) after {elapsed:.0f}s")
+
+
+class ApplyDeadline:
+    """
+    The budget of the application in progress. `seconds` or `max_steps` of 0
+    or None disables that limit. Outside an application every check passes.
+    """
+
+    def __init__(self, seconds=180, max_steps=25, now=time.monotonic):
+        self.seconds = seconds or None
+        self.max_steps = max_steps or None
+        self._now = now
+        self.started_at = None
+        self.steps = 0
+        self.stage = None
+
+    @property
+    def active(self) -> bool:
+        return self.started_at is not None
+
+    @property
+    def elapsed(self) -> float:
+        return self._now() - self.started_at if self.active else 0.0
+
+    def remaining(self) -> float:
+        if not self.active or self.seconds is None:
+            return float("inf")
+        return max(0.0, self.seconds - self.elapsed)
+
+    def start(self) -> None:
+        self.started_at = self._now()
+        self.steps = 0
+        self.stage = "start"
+
+    def stop(self) -> float:
+        """
+        Ends the application, returning how long it took.
+        """
+        elapsed = self.elapsed
+        self.started_at = None
+        return elapsed
+
+    def expired(self) -> bool:
+        if not self.active:
+            return False
+        return (self.seconds is not None and self.elapsed >= self.seconds) or \
+               (self.max_steps is not None and self.steps > self.max_steps)
+
+    def check(self, stage=None) -> None:
+        """
+        Raises DeadlineExceeded if the application is over its budget.
+        """
+        if stage is not None:
+            self.stage = stage
+        if self.expired():
+            raise DeadlineExceeded(self.steps, self.stage, self.elapsed)
+
+    def step(self, stage) -> None:
+        """
+        Counts one form step, then checks the budget.
+        """
+        if self.active:
+            self.steps += 1
+        self.check(stage)
+
+    def timeout(self, default) -> float:
+        """
+        Caps a wait so it ends no later than the deadline.
+        """
+        return min(default, self.remaining())
+
+
+class DeadlineStats:
+    """
+    Budget use over a run, shared by the bots of a pipeline.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.applications = 0
+        self.overruns = 0
+        self.by_stage = collections.Counter()
+        self.overrun_seconds = 0.0
+        self.longest = 0.0
+        self.timed_out = []
+
+    def record(self, jobID, elapsed, exceeded=None) -> None:
+        with self._lock:
+            self.applications += 1
+            self.longest = max(self.longest, elapsed)
+            if exceeded is not None:
+                self.overruns += 1
+                self.by_stage[exceeded.stage] += 1
+                self.overrun_seconds += elapsed
+                self.timed_out.append((jobID, str(exceeded)))
+
+    def summary(self) -> str:
+        with self._lock:
+            if not self.applications:
+                return "no applications started"
+            text = f"{self.overruns} of {self.applications} applications over budget"
+            if self.overruns:
+                stages = ", ".join(f"{n} at {stage}" for stage, n in self.by_stage.most_common())
+                text += f" ({stages}), {self.overrun_seconds:.0f}s spent in them"
+            return text + f"; longest application {self.longest:.0f}s"
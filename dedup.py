@@ -0,0 +1,90 @@
+"""
+Run-wide deduplication of jobs across position/location searches.
+
+The same posting shows up under several searches, and recruiters repost the
+same role under new job IDs. Jobs are remembered by ID in a compact set of
+integers, and by a normalized (company, title, location) fingerprint in a
+Bloom filter, so memory stays small and fixed for very large runs.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import re
+
+log = logging.getLogger("easyapplybot.dedup")
+
+_PARENS_RE = re.compile(r"\([^)]*\)")
+_NON_WORD_RE = re.compile(r"[^a-z0-9+#]+")
+
+
+def normalize(text) -> str:
+    if not text:
+        return ""
+    text = _PARENS_RE.sub(" ", text.lower())
+    return " ".join(_NON_WORD_RE.sub(" ", text).split())
+
+
+def fingerprint(company, title, location) -> str:
+    """
+    Location work-type suffixes like "(Hybrid)" and punctuation are dropped,
+    so a repost with cosmetic differences gets the same fingerprint.
+    """
+    return "|".join(normalize(part) for part in (company, title, location))
+
+
+class BloomFilter:
+    def __init__(self, capacity=100_000, error_rate=1e-4):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key) -> bool:
+        """
+        Adds a key; returns True if it was (probably) already present.
+        """
+        present = True
+        for position in self._positions(key):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                present = False
+                self.bits[byte] |= 1 << bit
+        return present
+
+    def __contains__(self, key) -> bool:
+        return all(self.bits[p // 8] & (1 << (p % 8)) for p in self._positions(key))
+
+
+class JobDeduplicator:
+    def __init__(self, capacity=100_000, error_rate=1e-4):
+        self._ids = set()
+        self._fingerprints = BloomFilter(capacity, error_rate)
+        self.duplicate_ids = 0
+        self.reposts = 0
+
+    def check(self, job_id, company=None, title=None, location=None) -> str | None:
+        """
+        Records a job and returns "duplicate" if its ID was already seen in this
+        run, "repost" if another ID with the same fingerprint was, else None.
+        """
+        key = int(job_id) if str(job_id).isdigit() else str(job_id)
+        if key in self._ids:
+            self.duplicate_ids += 1
+            return "duplicate"
+        self._ids.add(key)
+        if company and title:
+            if self._fingerprints.add(fingerprint(company, title, location)):
+                self.reposts += 1
+                return "repost"
+        return None
+
+    @property
+    def skipped(self) -> int:
+        return self.duplicate_ids + self.reposts
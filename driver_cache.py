@@ -0,0 +1,113 @@
+"""
+Resolve the chromedriver binary once and remember it.
+
+ChromeDriverManager().install() may hit the network on every start. The
+resolved path is cached in a small JSON file together with the driver
+version; on the next start the cached binary is used as long as it still
+exists and its major version matches the installed Chrome.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import platform
+import re
+import subprocess
+
+log = logging.getLogger("easyapplybot.driver_cache")
+
+CACHE_FILE = ".chromedriver_cache.json"
+
+CHROME_COMMANDS = {
+    "linux": [["google-chrome", "--version"], ["google-chrome-stable", "--version"],
+              ["chromium", "--version"], ["chromium-browser", "--version"]],
+    "darwin": [["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"]],
+    "windows": [["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"]],
+}
+
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)\.(\d+)")
+
+
+def _run_version(command) -> str | None:
+    try:
+        output = subprocess.run(command, capture_output=True, text=True, timeout=5).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = _VERSION_RE.search(output)
+    return match.group(0) if match else None
+
+
+def chrome_version() -> str | None:
+    for command in CHROME_COMMANDS.get(platform.system().lower(), []):
+        version = _run_version(command)
+        if version:
+            return version
+    return None
+
+
+def driver_version(path) -> str | None:
+    return _run_version([path, "--version"])
+
+
+def _major(version) -> str | None:
+    return version.split(".")[0] if version else None
+
+
+def _load_cache(cache_file) -> dict:
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache_file, entry) -> None:
+    tmp = cache_file + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, cache_file)
+    except OSError as e:
+        log.debug(f"Could not write chromedriver cache: {e}")
+
+
+def cached_driver_path(cache_file=CACHE_FILE) -> str | None:
+    """
+    Returns the cached chromedriver path if it is still usable, else None.
+    """
+    entry = _load_cache(cache_file)
+    path = entry.get("path")
+    if not path or not os.path.isfile(path) or not os.access(path, os.X_OK):
+        return None
+    version = driver_version(path)
+    if version is None or version != entry.get("driver_version"):
+        log.debug(f"Cached chromedriver {path} reports {version}, expected {entry.get('driver_version')}")
+        return None
+    browser = chrome_version()
+    if browser is not None and _major(browser) != _major(version):
+        log.info(f"Chrome {browser} does not match cached chromedriver {version}, resolving again")
+        return None
+    return path
+
+
+def resolve_driver_path(cache_file=CACHE_FILE) -> str:
+    """
+    Returns a chromedriver path, from the cache when possible and otherwise
+    from ChromeDriverManager (which is only imported on that path).
+    """
+    path = cached_driver_path(cache_file)
+    if path is not None:
+        log.debug(f"Using cached chromedriver {path}")
+        return path
+
+    import webdriver_manager.chrome as ChromeDriverManager
+    path = ChromeDriverManager.ChromeDriverManager().install()
+    remember_driver_path(path, cache_file)
+    return path
+
+
+def remember_driver_path(path, cache_file=CACHE_FILE) -> None:
+    version = driver_version(path)
+    if version is not None:
+        _save_cache(cache_file, {"path": os.path.abspath(path), "driver_version": version})
@@ -0,0 +1,241 @@
+"""
+Browser health monitoring and automatic driver recycling.
+
+Long runs accumulate Chrome memory growth, leaked tabs and stale sessions.
+The DriverSupervisor tracks the RSS of the chromedriver process tree, the
+number of consecutive WebDriver failures and the latency of a cheap command,
+and when a threshold is exceeded it replaces the Chrome instance, restoring
+the session cookies and the page the bot was on. If a new browser cannot be
+started, it retries with exponential backoff and raises BrowserUnavailable
+after recycle_attempts tries.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import time
+
+log = logging.getLogger("easyapplybot.driverhealth")
+
+LINKEDIN_HOME = "https://www.linkedin.com"
+
+
+def _proc_children() -> dict:
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # the command name may contain spaces, fields after it are fixed
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def _proc_rss_kb(pid) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def process_tree_rss_mb(pid) -> float | None:
+    """
+    Returns the summed RSS of a process and all its descendants, or None if it
+    cannot be measured on this platform.
+    """
+    try:
+        import psutil
+        try:
+            root = psutil.Process(pid)
+            processes = [root] + root.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes if p.is_running()) / 2 ** 20
+        except psutil.Error:
+            return None
+    except ImportError:
+        pass
+    if not os.path.isdir("/proc"):
+        return None
+    children = _proc_children()
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        total += _proc_rss_kb(current)
+        stack.extend(children.get(current, []))
+    return total / 1024
+
+
+def restore_session(browser, cookies) -> None:
+    """
+    Logs a fresh browser into LinkedIn with cookies taken from another one.
+    """
+    browser.get(LINKEDIN_HOME)
+    for cookie in cookies:
+        cookie = dict(cookie)
+        if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+            cookie.pop("sameSite", None)
+        try:
+            browser.add_cookie(cookie)
+        except Exception as e:
+            log.debug(f"Could not restore cookie {cookie.get('name')}: {e}")
+
+
+class BrowserUnavailable(Exception):
+    def __init__(self, reason, attempts, error):
+        self.reason = reason
+        self.attempts = attempts
+        self.error = error
+        super().__init__(f"could not start a new browser after {attempts} attempts ({reason}): {error}")
+
+
+class DriverSupervisor:
+    """
+    Watches the bot's browser and recycles it when it looks unhealthy.
+    """
+
+    def __init__(self, bot, max_rss_mb=3000, max_failures=3, max_latency=10.0,
+                 command_timeout=15, check_interval=60, recycle_attempts=4, recycle_backoff=5.0):
+        self.bot = bot
+        self.max_rss_mb = max_rss_mb
+        self.max_failures = max_failures
+        self.max_latency = max_latency
+        self.command_timeout = command_timeout
+        self.check_interval = check_interval
+        self.recycle_attempts = recycle_attempts
+        self.recycle_backoff = recycle_backoff
+        self.consecutive_failures = 0
+        self.recycles = 0
+        self.last_latency = None
+        self.last_rss_mb = None
+        self._cookies = []
+        self._last_check = 0.0
+
+    def apply_timeouts(self, browser) -> None:
+        """
+        Bounds page loads, scripts and the driver HTTP client so that a hung
+        page fails after command_timeout seconds instead of stalling the bot.
+        """
+        try:
+            browser.set_page_load_timeout(self.command_timeout)
+            browser.set_script_timeout(self.command_timeout)
+        except Exception as e:
+            log.debug(f"Could not set browser timeouts: {e}")
+        try:
+            browser.command_executor.set_timeout(self.command_timeout * 2)
+        except Exception:
+            try:
+                browser.command_executor._client_config.timeout = self.command_timeout * 2
+            except Exception as e:
+                log.debug(f"Could not set driver command timeout: {e}")
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+
+    def record_failure(self, error) -> None:
+        self.consecutive_failures += 1
+        log.warning(f"WebDriver failure {self.consecutive_failures}/{self.max_failures}: {error}")
+
+    def measure(self) -> None:
+        browser = self.bot.browser
+        start = time.monotonic()
+        browser.execute_script("return 1")
+        self.last_latency = time.monotonic() - start
+        try:
+            pid = browser.service.process.pid
+        except AttributeError:
+            pid = None
+        self.last_rss_mb = process_tree_rss_mb(pid) if pid else None
+
+    def close_extra_tabs(self) -> None:
+        browser = self.bot.browser
+        handles = browser.window_handles
+        if len(handles) > 1:
+            log.info(f"Closing {len(handles) - 1} leaked tabs")
+            for handle in handles[1:]:
+                browser.switch_to.window(handle)
+                browser.close()
+            browser.switch_to.window(handles[0])
+
+    def unhealthy_reason(self, force=False) -> str | None:
+        """
+        Returns why the browser should be recycled, or None if it looks healthy.
+        The latency/RSS probe runs at most once per check_interval unless forced.
+        """
+        if self.consecutive_failures >= self.max_failures:
+            return f"{self.consecutive_failures} consecutive WebDriver failures"
+        if not force and time.monotonic() - self._last_check < self.check_interval:
+            return None
+        self._last_check = time.monotonic()
+        try:
+            self.measure()
+            self.close_extra_tabs()
+            self._cookies = self.bot.browser.get_cookies()
+        except Exception as e:
+            return f"browser did not respond: {e}"
+        if self.last_latency > self.max_latency:
+            return f"command latency {self.last_latency:.1f}s over {self.max_latency}s"
+        if self.last_rss_mb is not None and self.last_rss_mb > self.max_rss_mb:
+            return f"browser RSS {self.last_rss_mb:.0f} MB over {self.max_rss_mb} MB"
+        log.debug(f"Browser healthy: latency {self.last_latency:.2f}s, RSS {self.last_rss_mb} MB")
+        return None
+
+    def recycle(self, reason, url=None) -> None:
+        """
+        Replaces the browser, restoring cookies and navigating back to `url`.
+        Raises BrowserUnavailable when no new browser could be started.
+        """
+        log.warning(f"Recycling the browser: {reason}")
+        old = self.bot.browser
+        try:
+            self._cookies = old.get_cookies() or self._cookies
+        except Exception:
+            pass
+        try:
+            old.quit()
+        except Exception as e:
+            log.debug(f"Old browser did not quit cleanly: {e}")
+
+        for attempt in range(1, self.recycle_attempts + 1):
+            browser = None
+            try:
+                browser = self.bot.create_browser()
+                self.apply_timeouts(browser)
+                restore_session(browser, self._cookies)
+                break
+            except Exception as e:
+                log.warning(f"Could not start a new browser (attempt {attempt}/{self.recycle_attempts}): {e}")
+                if browser is not None:
+                    try:
+                        browser.quit()
+                    except Exception:
+                        pass
+                if attempt == self.recycle_attempts:
+                    raise BrowserUnavailable(reason, attempt, e) from e
+                self.bot.clock.sleep(self.recycle_backoff * 2 ** (attempt - 1), "recycle", scale=False)
+        self.bot.set_browser(browser)
+        if url:
+            try:
+                browser.get(url)
+            except Exception as e:
+                log.warning(f"New browser could not reopen {url}: {e}")
+        self.recycles += 1
+        self.consecutive_failures = 0
+        self._last_check = time.monotonic()
+        self.bot.metrics.browser_recycles.inc()
+
+    def check(self, url=None) -> bool:
+        """
+        Recycles the browser if it is unhealthy. Returns True if it was recycled.
+        """
+        reason = self.unhealthy_reason()
+        if reason is None:
+            return False
+        self.recycle(reason, url)
+        return True
@@ -1,22 +1,20 @@
 from __future__ import annotations
 
+import copy
 import json
-import csv
 import logging
 import os
 import platform
 import random
 import re
 import stat
+import threading
 import time
 from datetime import datetime, timedelta
 import getpass
 from pathlib import Path
 
-import pandas as pd
-import pyautogui
 import yaml
-from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
@@ -27,11 +25,35 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from selenium.webdriver.chrome.service import Service as ChromeService
-import webdriver_manager.chrome as ChromeDriverManager
-ChromeDriverManager = ChromeDriverManager.ChromeDriverManager
 
-
-log = logging.getLogger(__name__)
+import csvstore
+import filters
+import structured
+from driver_cache import remember_driver_path, resolve_driver_path
+from answers import AnswerJournal
+from artifacts import ArtifactStore
+from corpus import CorpusStore
+from deadline import ApplyDeadline, DeadlineExceeded, DeadlineStats
+from dedup import JobDeduplicator
+from configwatch import ConfigWatcher
+from driverhealth import BrowserUnavailable, DriverSupervisor, restore_session
+from formfiller import FormFiller
+from history import HistoryStore, available as history_available
+from jobcache import FINAL_VERDICTS, JobCache
+from jobqueue import JobQueue
+from matchers import Matcher
+from pacing import Clock, get_profile
+from pageparse import LazyPage
+from pagination import PAGE_SIZE, RESULT_COUNT_JS, PagePlan, parse_result_count
+from ranking import JobRanker
+from ratelimit import RateLimiter
+from requirements import RequirementsAnalyzer
+from uploads import UploadManager
+from webtrace import REPLAY_CONTEXT, TraceRecorder, traced
+from metrics import BotMetrics, MetricsExporter
+
+
+log = logging.getLogger("easyapplybot")
 
 
 def setupLogger() -> None:
@@ -51,6 +73,23 @@ def setupLogger() -> None:
     log.addHandler(c_handler)
 
 
+def split_browser_title(browserTitle) -> tuple:
+    """
+    Returns (job, company) from a job page title like "Software Engineer | Company | LinkedIn".
+    """
+    def re_extract(text, pattern):
+        target = re.search(pattern, text)
+        if target:
+            target = target.group(1)
+        return target
+
+    parts = browserTitle.split(' | ')
+    # tab titles start with a notification count like "(12) " when there are unread messages
+    job = re_extract(parts[0], r"(?:\(\d+\)\s*)?(\w.*)")
+    company = re_extract(parts[1], r"(\w.*)") if len(parts) > 1 else None
+    return job, company
+
+
 class EasyApplyBot:
     setupLogger()
     # MAX_SEARCH_TIME is 10 hours by default, feel free to modify it
@@ -60,7 +99,6 @@ class EasyApplyBot:
                  username,
                  password,
                  phone_number,
-                 # profile_path,
                  salary,
                  rate,
                  uploads={},
@@ -73,7 +111,35 @@ class EasyApplyBot:
                  min_salary_hourly=32,
                  send_recruiter_invites=True,
                  skip_zero_experience=True,
-                 use_linkedin_resume=True
+                 use_linkedin_resume=True,
+                 metrics=None,
+                 job_cache=None,
+                 html_parser=None,
+                 profile_path=None,
+                 qa_file="qa.csv",
+                 answers_flush_interval=60,
+                 rate_limiter=None,
+                 command_timeout=15,
+                 max_browser_rss_mb=3000,
+                 max_driver_failures=3,
+                 corpus=None,
+                 rank_jobs=True,
+                 rank_pages=1,
+                 profile_keywords=[],
+                 clock=None,
+                 tracer=None,
+                 browser=None,
+                 job_queue=None,
+                 apply_workers=1,
+                 structured_data=True,
+                 http_client=False,
+                 apply_deadline=180,
+                 apply_max_steps=25,
+                 experience_profile=None,
+                 artifacts=None,
+                 history=None,
+                 config_watcher=None,
+                 upload_manager=None
                  ) -> None:
 
         log.info("Welcome to Easy Apply Bot")
@@ -95,47 +161,71 @@ class EasyApplyBot:
             log.info("Applying for all experience levels")
         
 
+        self.metrics = metrics if metrics is not None else BotMetrics()
+        self.job_cache = job_cache if job_cache is not None else JobCache()
+        self.corpus = corpus
+        self.rank_jobs_enabled = rank_jobs
+        self.rank_pages = max(1, rank_pages)
+        self.profile_keywords = profile_keywords
+        self.ranker = None
+        self.dedup = JobDeduplicator()
+        self.job_queue = job_queue
+        self.structured_data = structured_data
+        self.use_http_client = http_client
+        self.http_client = None
+        self.apply_workers = max(1, apply_workers)
+        self.html_parser = html_parser
+        self.job_page = None
         self.uploads = uploads
+        self.upload_manager = upload_manager if upload_manager is not None else UploadManager(uploads, registry_path=None)
+        self.sent_documents = set()
         self.salary = salary
         self.rate = rate
-        # self.profile_path = profile_path
+        self.profile_path = profile_path
+        self.clock = clock if clock is not None else Clock()
+        self.apply_deadline = apply_deadline
+        self.apply_max_steps = apply_max_steps
+        self.deadline = ApplyDeadline(apply_deadline, apply_max_steps, now=self.clock.now)
+        self.deadline_stats = DeadlineStats()
+        self.experience_profile = experience_profile
+        self.requirements = RequirementsAnalyzer.from_config(experience_profile)
+        self.artifacts = artifacts
+        self.history = history
+        self.current_job = None
+        self.current_search = None
+        self.config_watcher = config_watcher
+        self.config_version = config_watcher.version if config_watcher is not None else 0
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
         past_ids: list | None = self.get_appliedIDs(filename)
         self.appliedJobIDs: list = past_ids if past_ids != None else []
         self.filename: str = filename
         self.options = self.browser_options()
-        try:
-            # Try to use ChromeDriverManager first
-            self.browser = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=self.options)
-        except Exception as e:
-            log.warning(f"ChromeDriverManager failed: {e}")
-            try:
-                # Try using system ChromeDriver
-                self.browser = webdriver.Chrome(options=self.options)
-            except Exception as e2:
-                log.error(f"System ChromeDriver also failed: {e2}")
-                # Try using the local assets ChromeDriver
-                system = platform.system().lower()
-                if system == "darwin":
-                    chromedriver_path = "./assets/chromedriver_darwin"
-                elif system == "linux":
-                    chromedriver_path = "./assets/chromedriver_linux"
-                else:
-                    chromedriver_path = "./assets/chromedriver_windows"
-                
-                # Make it executable
-                if os.path.exists(chromedriver_path):
-                    os.chmod(chromedriver_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
-                    self.browser = webdriver.Chrome(service=ChromeService(chromedriver_path), options=self.options)
-                else:
-                    raise Exception("No valid ChromeDriver found")
-        self.wait = WebDriverWait(self.browser, 30)
+        self.command_timeout = command_timeout
+        self.search_url = None
+        self.health = DriverSupervisor(self,
+                                       max_rss_mb=max_browser_rss_mb,
+                                       max_failures=max_driver_failures,
+                                       command_timeout=command_timeout)
+        # an already logged-in browser can be passed in, e.g. a replay driver
+        self.browser = browser if browser is not None else self.create_browser()
+        self.tracer = tracer
+        if self.tracer is not None:
+            self.tracer.context = self.replay_context
+            self.tracer.attach(self.browser)
+        self.health.apply_timeouts(self.browser)
+        self.wait = WebDriverWait(self.browser, command_timeout)
         self.blacklist = blacklist
         self.blackListTitles = blackListTitles
-        self.start_linkedin(username, password)
+        self.company_matcher = Matcher(blacklist)
+        self.title_matcher = Matcher(blackListTitles)
+        if browser is None:
+            self.start_linkedin(username, password)
         self.phone_number = phone_number
         self.experience_level = experience_level
         self.max_applications = max_applications
         self.applications_count = 0
+        self.metrics.max_applications.set(max_applications)
+        self.metrics.applications_count.set(0)
         self.min_salary_yearly = min_salary_yearly
         self.min_salary_hourly = min_salary_hourly
         self.send_recruiter_invites = send_recruiter_invites
@@ -152,6 +242,7 @@ class EasyApplyBot:
             "upload_cv": (By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-cover-letter')]"),
             "follow": (By.CSS_SELECTOR, "label[for='follow-company-checkbox']"),
             "upload": (By.NAME, "file"),
+            "uploaded_documents": (By.CSS_SELECTOR, ".jobs-document-upload-redesign-card__container"),
             "search": (By.CLASS_NAME, "jobs-search-results-list"),
             "links": ("xpath", '//div[@data-job-id]'),
             "fields": (By.CLASS_NAME, "jobs-easy-apply-form-section__grouping"),
@@ -159,42 +250,110 @@ class EasyApplyBot:
             "multi_select": (By.XPATH, "//*[contains(@id, 'text-entity-list-form-component')]"),
             "text_select": (By.CLASS_NAME, "artdeco-text-input--input"),
             "2fa_oneClick": (By.ID, 'reset-password-submit-button'),
-            "easy_apply_button": (By.XPATH, '//button[contains(@class, "jobs-apply-button")]')
+            "easy_apply_button": (By.XPATH, '//button[contains(@class, "jobs-apply-button")]'),
+            "dismiss": (By.CSS_SELECTOR, "button[aria-label='Dismiss']"),
+            "discard": (By.CSS_SELECTOR, "button[data-control-name='discard_application_confirm_btn']")
 
         }
 
-        #initialize questions and answers file
-        self.qa_file = Path("qa.csv")
-        self.answers = {}
+        self.form_filler = FormFiller(self.browser, self.ans_question, clock=self.clock)
 
-        #if qa file does not exist, create it
-        if self.qa_file.is_file():
-            df = pd.read_csv(self.qa_file)
-            for index, row in df.iterrows():
-                self.answers[row['Question']] = row['Answer']
-        #if qa file does exist, load it
-        else:
-            df = pd.DataFrame(columns=["Question", "Answer"])
-            df.to_csv(self.qa_file, index=False, encoding='utf-8')
+        #load the questions and answers file, creating it if it does not exist
+        self.qa_file = Path(qa_file)
+        self.answers = AnswerJournal(self.qa_file, flush_interval=answers_flush_interval)
 
 
     def get_appliedIDs(self, filename) -> list | None:
         try:
-            df = pd.read_csv(filename,
-                             header=None,
-                             names=['timestamp', 'jobID', 'job', 'company', 'attempted', 'result'],
-                             lineterminator='\n',
-                             encoding='utf-8')
-
-            df['timestamp'] = pd.to_datetime(df['timestamp'], format="%Y-%m-%d %H:%M:%S")
-            df = df[df['timestamp'] > (datetime.now() - timedelta(days=2))]
-            jobIDs: list = list(df.jobID)
+            since = datetime.now() - timedelta(days=2)
+            jobIDs: list = [row['jobID'] for row in csvstore.iter_results(filename, since=since)]
             log.info(f"{len(jobIDs)} jobIDs found")
             return jobIDs
         except Exception as e:
             log.info(str(e) + "   jobIDs could not be loaded from CSV {}".format(filename))
             return None
 
+    def create_browser(self):
+        try:
+            # Try the cached chromedriver first, then ChromeDriverManager
+            return webdriver.Chrome(service=ChromeService(resolve_driver_path()), options=self.options)
+        except Exception as e:
+            log.warning(f"ChromeDriverManager failed: {e}")
+            try:
+                # Try using system ChromeDriver
+                return webdriver.Chrome(options=self.options)
+            except Exception as e2:
+                log.error(f"System ChromeDriver also failed: {e2}")
+                # Try using the local assets ChromeDriver
+                system = platform.system().lower()
+                if system == "darwin":
+                    chromedriver_path = "./assets/chromedriver_darwin"
+                elif system == "linux":
+                    chromedriver_path = "./assets/chromedriver_linux"
+                else:
+                    chromedriver_path = "./assets/chromedriver_windows"
+
+                # Make it executable
+                if os.path.exists(chromedriver_path):
+                    os.chmod(chromedriver_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
+                    browser = webdriver.Chrome(service=ChromeService(chromedriver_path), options=self.options)
+                    remember_driver_path(chromedriver_path)
+                    return browser
+                else:
+                    raise Exception("No valid ChromeDriver found")
+
+    def set_browser(self, browser) -> None:
+        self.browser = browser
+        if self.tracer is not None:
+            self.tracer.attach(browser)
+        self.wait = WebDriverWait(browser, self.command_timeout)
+        self.form_filler.browser = browser
+
+    def reload_config(self) -> None:
+        """
+        Takes over the settings of a changed config.yaml. Called between jobs,
+        so a job is always filtered and budgeted with one consistent config.
+        """
+        if self.config_watcher is None or self.config_watcher.poll() == self.config_version:
+            return
+        self.config_version = self.config_watcher.version
+        self.apply_settings(self.config_watcher.parameters)
+
+    def apply_settings(self, parameters) -> None:
+        """
+        Applies the reloadable settings (see configwatch.RELOADABLE) of a
+        validated config, rebuilding what is derived from them once.
+        """
+        requirements = RequirementsAnalyzer.from_config(parameters.get('experience_profile'))
+        self.blacklist = parameters.get('blacklist') or []
+        self.blackListTitles = parameters.get('blackListTitles') or []
+        self.company_matcher = Matcher(self.blacklist)
+        self.title_matcher = Matcher(self.blackListTitles)
+        self.min_salary_yearly = parameters.get('min_salary_yearly', 60000)
+        self.min_salary_hourly = parameters.get('min_salary_hourly', 32)
+        self.max_applications = parameters.get('max_applications', 50)
+        self.experience_level = parameters.get('experience_level') or []
+        self.skip_zero_experience = parameters.get('skip_zero_experience', True)
+        self.send_recruiter_invites = parameters.get('send_recruiter_invites', True)
+        self.experience_profile = parameters.get('experience_profile')
+        self.requirements = requirements
+        self.apply_deadline = parameters.get('apply_deadline', 180)
+        self.apply_max_steps = parameters.get('apply_max_steps', 25)
+        self.deadline.seconds = self.apply_deadline or None
+        self.deadline.max_steps = self.apply_max_steps or None
+        self.rate_limiter.min_interval = parameters.get('min_apply_interval', 0) or 0
+        self.rate_limiter.max_per_hour = parameters.get('max_applications_per_hour')
+        self.clock.profile = get_profile(parameters.get('pacing_profile'))
+        self.metrics.max_applications.set(self.max_applications)
+
+    def replay_context(self) -> dict:
+        """
+        The settings and saved answers a recorded application is replayed with.
+        """
+        context = {key: getattr(self, key) for key in REPLAY_CONTEXT}
+        context["answers"] = dict(self.answers.answers)
+        return context
+
     def browser_options(self):
         options = webdriver.ChromeOptions()
         options.add_argument("--start-maximized")
@@ -209,7 +368,8 @@ class EasyApplyBot:
         options.add_argument("--disable-blink-features=AutomationControlled")
 
         # Load user profile
-        #options.add_argument(r"--user-data-dir={}".format(self.profile_path))
+        if self.profile_path:
+            options.add_argument(r"--user-data-dir={}".format(os.path.abspath(self.profile_path)))
         return options
 
     def start_linkedin(self, username, password) -> None:
@@ -217,7 +377,7 @@ class EasyApplyBot:
         self.browser.get("https://www.linkedin.com/login?trk=guest_homepage-basic_nav-header-signin")
         try:
             # Wait for page to load
-            time.sleep(3)
+            self.clock.sleep(3, "login")
             
             user_field = self.browser.find_element(By.ID, "username")
             pw_field = self.browser.find_element(By.ID, "password")
@@ -245,12 +405,12 @@ class EasyApplyBot:
             user_field.clear()
             user_field.send_keys(username)
             user_field.send_keys(Keys.TAB)
-            time.sleep(2)
+            self.clock.sleep(2, "login")
             pw_field.clear()
             pw_field.send_keys(password)
-            time.sleep(2)
+            self.clock.sleep(2, "login")
             login_button.click()
-            time.sleep(15)
+            self.clock.sleep(15, "login")
             # if self.is_present(self.locator["2fa_oneClick"]):
             #     oneclick_auth = self.browser.find_element(by='id', value='reset-password-submit-button')
             #     if oneclick_auth is not None:
@@ -270,6 +430,10 @@ class EasyApplyBot:
         self.fill_data()
         self.positions = positions
         self.locations = locations
+        if self.rank_jobs_enabled:
+            self.ranker = JobRanker.from_config(positions, self.filename, self.profile_keywords)
+        if self.use_http_client:
+            self.http_client = structured.JobDataClient.from_browser(self.browser)
         combos: list = []
         while len(combos) < len(positions) * len(locations):
             position = positions[random.randint(0, len(positions) - 1)]
@@ -277,38 +441,125 @@ class EasyApplyBot:
             combo: tuple = (position, location)
             if combo not in combos:
                 combos.append(combo)
-                log.info(f"Applying to {position}: {location}")
-                location = "&location=" + location
-                self.applications_loop(position, location)
             if len(combos) > 500:
                 break
+        if self.job_queue is not None:
+            self.run_pipeline(combos)
+        else:
+            for position, location in combos:
+                log.info(f"Applying to {position}: {location}")
+                self.current_search = f"{position}: {location}"
+                self.applications_loop(position, "&location=" + location)
+        log.info(f"Run finished in {(time.time() - start) / 60:.1f} minutes: "
+                 f"{self.applications_count} applications, {self.dedup.skipped} duplicate jobs skipped "
+                 f"({self.dedup.duplicate_ids} seen in another search, {self.dedup.reposts} reposts)")
+        log.info(f"Application budgets: {self.deadline_stats.summary()}")
 
     # self.finish_apply() --> this does seem to cause more harm than good, since it closes the browser which we usually don't want, other conditions will stop the loop and just break out
 
     def applications_loop(self, position, location):
+        for cards in self.crawl(position, location):
+            try:
+                self.apply_loop(self.rank_jobs(cards))
+            except Exception as e:
+                log.error(f"Error in the applications loop: {e}")
+                self.health.record_failure(e)
 
-        count_application = 0
-        count_job = 0
-        jobs_per_page = 0
+        if self.applications_count >= self.max_applications:
+            log.info(f"Application limit reached! Successfully submitted {self.applications_count} applications.")
+        else:
+            log.info(f"Search completed. Total applications submitted: {self.applications_count}")
+
+    def consider_card(self, jobID, card_text, pending_cards) -> None:
+        """
+        Adds a search result to pending_cards unless it is already applied to,
+        blacklisted, a duplicate or known from the job cache to be ineligible.
+        """
+        self.metrics.jobs_seen.inc()
+        if 'Applied' in card_text: #checking if applied already
+            self.metrics.jobs_filtered.inc(reason="already_applied")
+            return
+        if jobID == "search":
+            log.debug("Job ID not found, search keyword found instead? {}".format(card_text))
+            return
+        title, company, job_location = filters.parse_card(card_text)
+        if self.company_matcher.search(company): #checking if blacklisted
+            self.metrics.jobs_filtered.inc(reason="blacklist")
+            return
+        if filters.title_blacklisted(title, self.title_matcher):
+            self.metrics.jobs_filtered.inc(reason="title")
+            return
+        duplicate = self.dedup.check(jobID, company, title, job_location)
+        if duplicate is not None:
+            log.debug(f"Skipping job {jobID}: {duplicate} of a job already seen this run")
+            self.metrics.jobs_filtered.inc(reason=duplicate)
+            return
+        skip_reason = self.cached_skip_reason(jobID)
+        if skip_reason is not None:
+            log.debug(f"Skipping job {jobID} from cache: {skip_reason}")
+            self.metrics.jobs_filtered.inc(reason="cached_" + skip_reason)
+        else:
+            pending_cards[jobID] = card_text
+
+    def structured_cards(self, page) -> dict | None:
+        """
+        Returns {Job id: card text} from the search page's embedded data for the
+        cards shown in the results list, or None to fall back to the DOM. The
+        payload is only trusted if it describes most of the cards on screen, as
+        it can be stale after in-page pagination.
+        """
+        if not self.structured_data:
+            return None
+        try:
+            cards = structured.job_cards(page.html)
+            if not cards:
+                return None
+            shown = self.browser.execute_script(
+                "return Array.from(document.querySelectorAll('[data-job-id]'), e => e.getAttribute('data-job-id'))")
+        except Exception as e:
+            log.debug(f"Structured job list unavailable: {e}")
+            return None
+        matched = {jobID: cards[jobID] for jobID in shown or [] if jobID in cards}
+        if not shown or len(matched) * 2 < len(shown):
+            return None
+        return matched
+
+    def search_stopped(self) -> bool:
+        if self.job_queue is not None and self.job_queue.stopped():
+            return True
+        return self.applications_count >= self.max_applications
+
+    def crawl(self, position, location):
+        """
+        Walks the results of one search and yields {Job id: card text} for the
+        jobs worth opening, once every rank_pages pages.
+        """
+        jobs_per_page = None
+        plan = PagePlan()
         start_time: float = time.time()
+        pending_cards = {} #{Job id: card text}, collected over rank_pages pages
+        pages_buffered = 0
 
         log.info("Looking for jobs.. Please wait..")
 
         self.browser.set_window_position(1, 1)
         self.browser.maximize_window()
-        self.browser, _ = self.next_jobs_page(position, location, jobs_per_page, experience_level=self.experience_level)
+        self.browser, jobs_per_page = self.next_jobs_page(position, location, jobs_per_page,
+                                                          experience_level=self.experience_level, plan=plan)
         log.info("Looking for jobs.. Please wait..")
 
-        while time.time() - start_time < self.MAX_SEARCH_TIME and self.applications_count < self.max_applications:
+        while (jobs_per_page is not None and time.time() - start_time < self.MAX_SEARCH_TIME
+               and not self.search_stopped()):
             try:
+                self.health.check(url=self.search_url)
+                self.reload_config()
                 log.info(f"{(self.MAX_SEARCH_TIME - (time.time() - start_time)) // 60} minutes left in this search")
                 log.info(f"Applications submitted: {self.applications_count}/{self.max_applications}")
 
                 # sleep to make sure everything loads, add random to make us look human.
-                randoTime: float = random.uniform(2.0, 4.5)
-                log.debug(f"Sleeping for {round(randoTime, 1)}")
-                time.sleep(randoTime)
-                self.load_page(sleep=0.5)
+                randoTime: float = self.clock.pause("search", 2.0, 4.5)
+                log.debug(f"Slept for {round(randoTime, 1)}")
+                page = self.load_page(sleep=0.5)
 
                 # LinkedIn displays the search results in a scrollable <div> on the left side, we have to scroll to its bottom
 
@@ -332,40 +583,163 @@ class EasyApplyBot:
                 #     '//div[@data-job-id]'
                 # )
 
-                    jobIDs = {} #{Job id: processed_status}
-                
-                    # children selector is the container of the job cards on the left
-                    for link in links:
-                            if 'Applied' not in link.text: #checking if applied already
-                                if link.text not in self.blacklist: #checking if blacklisted
-                                    jobID = link.get_attribute("data-job-id")
-                                    if jobID == "search":
-                                        log.debug("Job ID not found, search keyword found instead? {}".format(link.text))
-                                        continue
-                                    else:
-                                        jobIDs[jobID] = "To be processed"
-                    if len(jobIDs) > 0:
-                        self.apply_loop(jobIDs)
+                    # the cards from the page's structured data cost one read instead of two commands per card
+                    structured_cards = self.structured_cards(page)
+                    if structured_cards is not None:
+                        for jobID, card_text in structured_cards.items():
+                            self.consider_card(jobID, card_text, pending_cards)
+                    else:
+                        # children selector is the container of the job cards on the left
+                        for link in links:
+                            card_text = link.text
+                            jobID = link.get_attribute("data-job-id") if 'Applied' not in card_text else None
+                            self.consider_card(jobID, card_text, pending_cards)
+                    pages_buffered += 1
+                    if len(pending_cards) > 0 and pages_buffered >= self.rank_pages:
+                        yield pending_cards
+                        pending_cards = {}
+                        pages_buffered = 0
                     self.browser, jobs_per_page = self.next_jobs_page(position,
                                                                       location,
-                                                                      jobs_per_page, 
-                                                                      experience_level=self.experience_level)
+                                                                      jobs_per_page,
+                                                                      experience_level=self.experience_level,
+                                                                      plan=plan)
                 else:
                     self.browser, jobs_per_page = self.next_jobs_page(position,
                                                                       location,
-                                                                      jobs_per_page, 
-                                                                      experience_level=self.experience_level)
+                                                                      jobs_per_page,
+                                                                      experience_level=self.experience_level,
+                                                                      plan=plan)
+                self.health.record_success()
 
 
+            except BrowserUnavailable:
+                raise
             except Exception as e:
-                print(e)
-        
-        if self.applications_count >= self.max_applications:
-            log.info(f"Application limit reached! Successfully submitted {self.applications_count} applications.")
-        else:
-            log.info(f"Search completed. Total applications submitted: {self.applications_count}")
+                log.error(f"Error in the applications loop: {e}")
+                self.health.record_failure(e)
+
+        if len(pending_cards) > 0 and not self.search_stopped():
+            yield pending_cards
+        log.info(f"Page plan for {position}: {plan.summary()}")
+
+    def spawn(self):
+        """
+        Returns a copy of the bot that drives its own browser, logged in with
+        this browser's cookies. Caches, filters, answers, metrics and the rate
+        limiter stay shared with this bot.
+        """
+        clone = copy.copy(self)
+        clone.tracer = None
+        clone.applications_count = 0
+        clone.job_page = None
+        clone.health = DriverSupervisor(clone,
+                                        max_rss_mb=self.health.max_rss_mb,
+                                        max_failures=self.health.max_failures,
+                                        command_timeout=self.command_timeout)
+        clone.form_filler = FormFiller(None, clone.ans_question, clock=self.clock)
+        clone.deadline = ApplyDeadline(self.apply_deadline, self.apply_max_steps, now=self.clock.now)
+        browser = self.create_browser()
+        clone.health.apply_timeouts(browser)
+        restore_session(browser, self.browser.get_cookies())
+        clone.set_browser(browser)
+        return clone
+
+    def run_pipeline(self, combos) -> None:
+        """
+        Searches in a crawler thread with its own browser while apply workers,
+        this bot first, take the jobs it finds from the job queue.
+        """
+        queue = self.job_queue
+        queue.start()
+        crawler = self.spawn()
+        workers = [self] + [self.spawn() for _ in range(self.apply_workers - 1)]
+
+        def crawl_all():
+            try:
+                for position, location in combos:
+                    if queue.stopped():
+                        break
+                    log.info(f"Crawling {position}: {location}")
+                    for cards in crawler.crawl(position, "&location=" + location):
+                        for jobID in crawler.rank_jobs(cards):
+                            if not queue.put(jobID, cards[jobID], f"{position}: {location}") and queue.stopped():
+                                return
+            except Exception as e:
+                log.error(f"Crawler failed: {e}")
+            finally:
+                queue.finish_crawl()
+                log.info(f"Crawler finished: {queue.counts()}")
+
+        threads = [threading.Thread(target=crawl_all, name="crawler", daemon=True)]
+        threads += [threading.Thread(target=worker.apply_worker, args=(queue, f"worker-{i}"), name=f"worker-{i}",
+                                     daemon=True) for i, worker in enumerate(workers) if worker is not self]
+        for thread in threads:
+            thread.start()
+        self.apply_worker(queue, "worker-0")
+        for thread in threads:
+            thread.join()
+        for clone in [crawler] + workers[1:]:
+            try:
+                clone.browser.quit()
+            except Exception as e:
+                log.debug(f"Spawned browser did not quit cleanly: {e}")
+        self.applications_count = queue.applied()
+        log.info(f"Pipeline finished: {self.applications_count} applications, queue {queue.counts()}")
+
+    def apply_worker(self, queue, name) -> None:
+        """
+        Applies to queued jobs until the crawl is exhausted or the queue is stopped.
+        """
+        while True:
+            job = queue.get(worker=name)
+            if job is None:
+                break
+            jobID = job["job_id"]
+            self.current_search = job["search"]
+            self.reload_config()
+            try:
+                result = self.apply_to_job(jobID)
+                self.health.record_success()
+            except Exception as e:
+                log.error(f"{name} failed on job {jobID}: {e}")
+                self.health.record_failure(e)
+                result = "error"
+                try:
+                    self.health.check()
+                except BrowserUnavailable as e:
+                    # chromedriver is unlikely to work for the other workers either
+                    log.error(f"{name} stopping the pipeline: {e}")
+                    queue.done(jobID, result)
+                    queue.stop()
+                    break
+            queue.done(jobID, "applied" if result is True else result)
+            if result is True:
+                applied = queue.applied()
+                self.metrics.applications_count.set(applied)
+                if applied >= self.max_applications:
+                    log.info(f"Application limit reached with {applied} applications, stopping the pipeline")
+                    queue.stop()
+
+    def rank_jobs(self, cards) -> dict:
+        """
+        Orders the collected jobs so the best matches are applied to first.
+        Returns {Job id: processed_status} in application order.
+        """
+        if self.ranker is None:
+            return {jobID: "To be processed" for jobID in cards}
+        start = time.perf_counter()
+        ranked = self.ranker.rank(cards)
+        log.debug(f"Ranked {len(ranked)} jobs in {(time.perf_counter() - start) * 1000:.1f} ms")
+        for jobID, score in ranked[:5]:
+            log.debug(f"  {score:.3f} {jobID}: {cards[jobID].splitlines()[0] if cards[jobID] else ''}")
+        return {jobID: "To be processed" for jobID, _ in ranked}
+
     def apply_loop(self, jobIDs):
         for jobID in jobIDs:
+            self.reload_config()
+            if self.applications_count >= self.max_applications:
+                break
             if jobIDs[jobID] == "To be processed":
                 applied = self.apply_to_job(jobID)
                 if applied:
@@ -374,61 +748,32 @@ class EasyApplyBot:
                     log.info(f"Failed to apply to {jobID}")
                 jobIDs[jobID] == applied
 
+    def cached_skip_reason(self, jobID) -> str | None:
+        """
+        Returns why a job can be skipped without opening it, based on what the job
+        cache learned about it earlier and the current filter settings, or None.
+        """
+        record = self.job_cache.get(jobID)
+        if record is None:
+            return None
+        verdict = record["verdict"]
+        if verdict in FINAL_VERDICTS:
+            return verdict
+        if verdict == "experience" and self.skip_zero_experience:
+            return verdict
+        if not filters.meets_salary(record["salary_yearly"], record["salary_hourly"],
+                                    self.min_salary_yearly, self.min_salary_hourly):
+            return "salary"
+        if filters.title_blacklisted(record["title"], self.title_matcher):
+            return "title"
+        return None
+
     def parse_salary(self, job_description):
         """
         Parse salary information from job description text.
         Returns (yearly_salary, hourly_salary) or (None, None) if not found.
         """
-        # Convert to lowercase for easier matching
-        text = job_description.lower()
-        
-        # Patterns for yearly salary (£60,000, £60000, £60k)
-        yearly_patterns = [
-            r'£\s*(\d{1,3}(?:,\d{3})*)\s*(?:per\s+year|annually|/year|p\.a\.)',
-            r'£\s*(\d{2,3})k\s*(?:per\s+year|annually|/year|p\.a\.)',
-            r'(\d{1,3}(?:,\d{3})*)\s*£\s*(?:per\s+year|annually|/year|p\.a\.)',
-            r'salary.*?£\s*(\d{1,3}(?:,\d{3})*)',
-            r'£\s*(\d{1,3}(?:,\d{3})*)\s*-\s*£\s*(\d{1,3}(?:,\d{3})*)',  # range
-        ]
-        
-        # Patterns for hourly salary (£32/hour, £32 per hour)
-        hourly_patterns = [
-            r'£\s*(\d{1,3}(?:\.\d{2})?)\s*(?:per\s+hour|/hour|hourly)',
-            r'(\d{1,3}(?:\.\d{2})?)\s*£\s*(?:per\s+hour|/hour|hourly)',
-        ]
-        
-        # Check yearly patterns
-        for pattern in yearly_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                try:
-                    if isinstance(matches[0], tuple):  # salary range
-                        # Take the lower bound of the range
-                        salary_str = matches[0][0]
-                    else:
-                        salary_str = matches[0]
-                    
-                    # Handle 'k' notation
-                    if 'k' in text and salary_str.isdigit():
-                        yearly_salary = int(salary_str) * 1000
-                    else:
-                        yearly_salary = int(salary_str.replace(',', ''))
-                    
-                    return yearly_salary, None
-                except (ValueError, IndexError):
-                    continue
-        
-        # Check hourly patterns
-        for pattern in hourly_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                try:
-                    hourly_salary = float(matches[0])
-                    return None, hourly_salary
-                except (ValueError, IndexError):
-                    continue
-        
-        return None, None
+        return filters.parse_salary(job_description)
 
     def meets_salary_requirements(self, yearly_salary, hourly_salary):
         """
@@ -451,98 +796,219 @@ class EasyApplyBot:
         
         return True
 
+    @traced("apply_to_job")
     def apply_to_job(self, jobID):
         # #self.avoid_lock() # annoying
+        apply_start = time.monotonic()
+        self.current_job = jobID
+        self.clock.mark("job", job=jobID)
+
+        # check the job over HTTP first, skipping it without rendering when it is filtered out
+        if self.http_client is not None and self.prefetch_skip(jobID):
+            self.metrics.apply_seconds.observe(time.monotonic() - apply_start, result="filtered")
+            return False
 
         # get job page
         self.get_job_page(jobID)
 
         # let page load with human-like delay
-        time.sleep(random.uniform(1.5, 3.0))
+        self.clock.pause("apply", 1.5, 3.0)
         
-        # Check salary requirements
-        job_description = self.browser.page_source
-        yearly_salary, hourly_salary = self.parse_salary(job_description)
+        # Check salary requirements, from the page's structured data when it has them
+        job_description = self.job_page.html
+        details = structured.job_details(job_description, jobID) if self.structured_data else None
+        if details is not None and (details["salary_yearly"] is not None or details["salary_hourly"] is not None):
+            yearly_salary, hourly_salary = details["salary_yearly"], details["salary_hourly"]
+        else:
+            yearly_salary, hourly_salary = self.parse_salary(job_description)
+        job, company = split_browser_title(self.browser.title)
+        if details is not None:
+            job, company = details["title"] or job, details["company"] or company
         
         if not self.meets_salary_requirements(yearly_salary, hourly_salary):
             log.info(f"Skipping job {jobID}: salary below requirements")
             self.write_to_file(False, jobID, self.browser.title, False, "* Salary below requirements")
+            self.metrics.jobs_filtered.inc(reason="salary")
+            self.remember_job(jobID, job, company, yearly_salary, hourly_salary, None, "salary")
+            self.metrics.apply_seconds.observe(time.monotonic() - apply_start, result="filtered")
             return False
 
+        # skip jobs asking for more experience than the profile has, before opening the form
+        if self.requirements is not None:
+            analysis = self.requirements.analyze(self.job_page.description())
+            if not analysis.met:
+                log.info(f"Skipping job {jobID}: {analysis}")
+                self.write_to_file(False, jobID, self.browser.title, False, "* Requirements not met")
+                self.metrics.jobs_filtered.inc(reason="requirements")
+                self.remember_job(jobID, job, company, yearly_salary, hourly_salary, None, "requirements")
+                self.metrics.apply_seconds.observe(time.monotonic() - apply_start, result="filtered")
+                return False
+
         # get easy apply button
         button = self.get_easy_apply_button()
 
 
         # word filter to skip positions not wanted
-        if button is not False:
-            if any(word in self.browser.title for word in blackListTitles):
+        if button is not False and button is not None:
+            if filters.title_blacklisted(job, self.title_matcher):
                 log.info('skipping this application, a blacklisted keyword was found in the job position')
                 string_easy = "* Contains blacklisted keyword"
                 result = False
+                verdict = "title"
+                self.metrics.jobs_filtered.inc(reason="title")
             else:
                 string_easy = "* has Easy Apply Button"
+                self.clock.mark("submit", job=jobID)
+                self.rate_limiter.wait()
                 log.info("Clicking the EASY apply button")
                 button.click()
                 clicked = True
-                time.sleep(random.uniform(1.5, 2.5))
-                self.fill_out_fields()
-                result = self.send_resume()
+                exceeded = None
+                self.deadline.start()
+                try:
+                    self.clock.pause("apply", 1.5, 2.5)
+                    self.fill_out_fields()
+                    result = self.send_resume()
+                except DeadlineExceeded as e:
+                    exceeded = e
+                    result = "timed_out"
+                    log.warning(f"Giving up on job {jobID}: {e}")
+                    self.metrics.apply_overruns.inc(stage=e.stage)
+                    self.capture_artifact("timeout_" + e.stage)
+                    self.discard_application()
+                self.deadline_stats.record(jobID, self.deadline.stop(), exceeded)
                 if result is True:
                     string_easy = "*Applied: Sent Resume"
+                    verdict = "applied"
                     self.applications_count += 1
+                    self.rate_limiter.record()
+                    self.clock.mark("applied", job=jobID)
+                    self.metrics.applications.inc(result="applied")
+                    self.metrics.applications_count.set(self.applications_count)
                     log.info(f"Application submitted! Total applications: {self.applications_count}")
                     
                     # Try to connect with recruiter after successful application
                     if self.send_recruiter_invites:
-                        time.sleep(random.uniform(2, 4))  # Human-like delay
+                        self.clock.pause("apply", 2, 4)  # Human-like delay
                         self.try_connect_with_recruiter(jobID)
+                elif result == "timed_out":
+                    string_easy = f"*Did not apply: {exceeded}"
+                    result = False
+                    verdict = "timed_out"
+                    self.metrics.applications.inc(result="timed_out")
                 elif result == "skipped_experience":
                     string_easy = "*Skipped: Zero experience in required skills"
                     result = False
+                    verdict = "experience"
+                    self.metrics.jobs_filtered.inc(reason="experience")
                 else:
                     string_easy = "*Did not apply: Failed to send Resume"
                     result = False
-        elif "You applied on" in self.browser.page_source:
+                    verdict = "failed"
+                    self.metrics.applications.inc(result="failed")
+        elif "You applied on" in self.job_page:
             log.info("You have already applied to this position.")
             string_easy = "* Already Applied"
             result = False
+            verdict = "already_applied"
+            self.metrics.jobs_filtered.inc(reason="already_applied")
+        elif button is None:
+            log.info("Could not check the job page for an Easy Apply button.")
+            string_easy = "* Easy Apply button check failed"
+            result = False
+            verdict = "page_error"
+            self.metrics.jobs_filtered.inc(reason="page_error")
         else:
             log.info("The Easy apply button does not exist.")
             string_easy = "* Doesn't have Easy Apply Button"
             result = False
+            verdict = "no_easy_apply"
+            self.metrics.jobs_filtered.inc(reason="no_easy_apply")
 
 
         # position_number: str = str(count_job + jobs_per_page)
         log.info(f"\nPosition {jobID}:\n {self.browser.title} \n {string_easy} \n")
 
-        self.write_to_file(button, jobID, self.browser.title, result)
+        self.write_to_file(button, jobID, self.browser.title, result, string_easy)
+        easy_apply = None if button is None else button is not False
+        self.remember_job(jobID, job, company, yearly_salary, hourly_salary, easy_apply, verdict)
+        self.answers.flush()
+        if self.history is not None:
+            self.history.maybe_compact()
+        self.metrics.apply_seconds.observe(time.monotonic() - apply_start,
+                                           result="applied" if result is True else "not_applied")
         return result
 
-    def write_to_file(self, button, jobID, browserTitle, result, reason=None) -> None:
-        def re_extract(text, pattern):
-            target = re.search(pattern, text)
-            if target:
-                target = target.group(1)
-            return target
+    def prefetch_skip(self, jobID) -> bool:
+        """
+        Fetches a job page over HTTP and, if its structured data shows it would be
+        filtered out, records the verdict and returns True without opening it.
+        """
+        page_html = self.http_client.fetch(f"https://www.linkedin.com/jobs/view/{jobID}/")
+        details = structured.job_details(page_html, jobID) if page_html else None
+        if details is None:
+            return False
+        yearly_salary, hourly_salary = details["salary_yearly"], details["salary_hourly"]
+        if yearly_salary is None and hourly_salary is None and details["description"]:
+            yearly_salary, hourly_salary = filters.parse_salary(details["description"])
+        if details["easy_apply"] is False:
+            verdict = "no_easy_apply"
+        elif not filters.meets_salary(yearly_salary, hourly_salary, self.min_salary_yearly, self.min_salary_hourly):
+            verdict = "salary"
+        elif filters.title_blacklisted(details["title"], self.title_matcher):
+            verdict = "title"
+        elif self.requirements is not None and not self.requirements.analyze(details["description"]).met:
+            verdict = "requirements"
+        else:
+            return False
+        log.info(f"Skipping job {jobID} without opening it: {verdict}")
+        self.job_page = LazyPage(page_html, backend=self.html_parser)
+        self.write_to_file(False, jobID, f"{details['title'] or ''} | {details['company'] or ''} | LinkedIn", False,
+                           f"Skipped before opening: {verdict}")
+        self.metrics.jobs_filtered.inc(reason=verdict)
+        self.remember_job(jobID, details["title"], details["company"], yearly_salary, hourly_salary,
+                          details["easy_apply"], verdict)
+        return True
+
+    def remember_job(self, jobID, job, company, yearly_salary, hourly_salary, easy_apply, verdict) -> None:
+        """
+        Records what was learned about a job in the job cache and, when enabled,
+        saves its description to the corpus for offline re-scoring.
+        """
+        self.job_cache.record(jobID, title=job, company=company, salary_yearly=yearly_salary,
+                              salary_hourly=hourly_salary, easy_apply=easy_apply, verdict=verdict)
+        if self.corpus is not None and self.job_page is not None:
+            try:
+                self.corpus.append(jobID, self.job_page.description(), title=job, company=company,
+                                   salary_yearly=yearly_salary, salary_hourly=hourly_salary,
+                                   easy_apply=easy_apply, verdict=verdict)
+            except Exception as e:
+                log.warning(f"Could not save job {jobID} to the corpus: {e}")
 
+    def write_to_file(self, button, jobID, browserTitle, result, reason=None) -> None:
         timestamp: str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        attempted: bool = False if button == False else True
-        job = re_extract(browserTitle.split(' | ')[0], r"\(?\d?\)?\s?(\w.*)")
-        company = re_extract(browserTitle.split(' | ')[1], r"(\w.*)")
+        attempted: bool = button is not False and button is not None
+        job, company = split_browser_title(browserTitle)
 
         toWrite: list = [timestamp, jobID, job, company, attempted, result]
-        with open(self.filename, 'a+') as f:
-            writer = csv.writer(f)
-            writer.writerow(toWrite)
+        if self.current_search is not None or reason:
+            toWrite.append(self.current_search or "")
+        if reason:
+            toWrite.append(reason.lstrip("* "))
+        csvstore.append_row(self.filename, toWrite)
 
     def get_job_page(self, jobID):
 
         job: str = 'https://www.linkedin.com/jobs/view/' + str(jobID)
         self.browser.get(job)
-        self.job_page = self.load_page(sleep=0.5)
+        self.job_page = self.load_page(sleep=0.5, page="job")
         return self.job_page
 
     def get_easy_apply_button(self):
+        """
+        Returns the Easy Apply button, False if the job page has none, or None
+        if looking for it failed, so the job is not recorded as having none.
+        """
         EasyApplyButton = False
         try:
             buttons = self.get_elements("easy_apply_button")
@@ -556,9 +1022,9 @@ class EasyApplyBot:
                 else:
                     log.debug("Easy Apply button not found")
             
-        except Exception as e: 
-            print("Exception:",e)
-            log.debug("Easy Apply button not found")
+        except Exception as e:
+            log.debug(f"Could not look for the Easy Apply button: {e}")
+            return None
 
 
         return EasyApplyButton
@@ -587,6 +1053,7 @@ class EasyApplyBot:
         return len(self.browser.find_elements(locator[0],
                                               locator[1])) > 0
 
+    @traced("send_resume")
     def send_resume(self) -> bool:
         """
         Handle the application submission process.
@@ -614,32 +1081,29 @@ class EasyApplyBot:
             submitted = False
             loop = 0
             while loop < 2:
-                time.sleep(1)
+                self.deadline.step("form")
+                self.clock.sleep(1, "resume")
                 # Upload resume - only if use_linkedin_resume is False
                 if is_present(upload_resume_locator):
-                    if not self.use_linkedin_resume and "Resume" in self.uploads:
-                        #upload_locator = self.browser.find_element(By.NAME, "file")
+                    if not self.use_linkedin_resume and self.upload_manager.has("Resume"):
                         try:
-                            resume_locator = self.browser.find_element(By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-resume')]")
-                            resume = self.uploads["Resume"]
-                            resume_locator.send_keys(resume)
-                            log.info("Uploaded local resume file")
+                            self.send_document("Resume", self.locator["upload_resume"])
+                        except DeadlineExceeded:
+                            raise
                         except Exception as e:
                             log.error(e)
                             log.error("Resume upload failed")
                             log.debug("Resume: " + str(self.uploads.get("Resume", "None")))
-                            log.debug("Resume Locator: " + str(resume_locator))
                     else:
                         log.info("Skipping resume upload - using LinkedIn resume")
                         
                 # Upload cover letter if possible - only if use_linkedin_resume is False
                 if is_present(upload_cv_locator):
-                    if not self.use_linkedin_resume and "Cover Letter" in self.uploads:
+                    if not self.use_linkedin_resume and self.upload_manager.has("Cover Letter"):
                         try:
-                            cv = self.uploads["Cover Letter"]
-                            cv_locator = self.browser.find_element(By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-cover-letter')]")
-                            cv_locator.send_keys(cv)
-                            log.info("Uploaded local cover letter file")
+                            self.send_document("Cover Letter", self.locator["upload_cv"])
+                        except DeadlineExceeded:
+                            raise
                         except Exception as e:
                             log.error(f"Cover letter upload failed: {e}")
                     else:
@@ -649,13 +1113,13 @@ class EasyApplyBot:
                 elif len(self.get_elements("follow")) > 0:
                     elements = self.get_elements("follow")
                     for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
+                        button = self.wait_until(EC.element_to_be_clickable(element))
                         button.click()
 
                 if len(self.get_elements("submit")) > 0:
                     elements = self.get_elements("submit")
                     for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
+                        button = self.wait_until(EC.element_to_be_clickable(element))
                         button.click()
                         log.info("Application Submitted")
                         submitted = True
@@ -676,11 +1140,13 @@ class EasyApplyBot:
                                 return "skipped_experience"
                             
                         while len(elements) > 0:
+                            self.deadline.step("validation")
                             log.info("Please answer the questions, waiting 5 seconds...")
-                            time.sleep(5)
+                            self.clock.sleep(5, "resume")
                             elements = self.get_elements("error")
 
-                            for element in elements:
+                            # one pass fills every field of the step, not one pass per error
+                            if len(elements) > 0:
                                 self.process_questions()
 
                             if "application was sent" in self.browser.page_source:
@@ -696,86 +1162,133 @@ class EasyApplyBot:
                     
                     else:
                         log.info("Application not submitted")
-                        time.sleep(2)
+                        self.capture_artifact("not_submitted")
+                        self.clock.sleep(2, "resume")
                         break
                     # self.process_questions()
 
                 elif len(self.get_elements("next")) > 0:
                     elements = self.get_elements("next")
                     for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
+                        button = self.wait_until(EC.element_to_be_clickable(element))
                         button.click()
 
                 elif len(self.get_elements("review")) > 0:
                     elements = self.get_elements("review")
                     for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
+                        button = self.wait_until(EC.element_to_be_clickable(element))
                         button.click()
 
                 elif len(self.get_elements("follow")) > 0:
                     elements = self.get_elements("follow")
                     for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
+                        button = self.wait_until(EC.element_to_be_clickable(element))
                         button.click()
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             log.error(e)
             log.error("cannot apply to this job")
-            pass
+            self.capture_artifact("send_resume_error", note={"error": repr(e)})
             #raise (e)
 
         return submitted
-    def process_questions(self):
-        time.sleep(1)
-        form = self.get_elements("fields") #self.browser.find_elements(By.CLASS_NAME, "jobs-easy-apply-form-section__grouping")
-        
-        if not form:
-            log.info("No form fields found - LinkedIn may have remembered all answers")
+
+    def uploaded_document_card(self, document) -> WebElement | None:
+        """
+        Returns the form's card for a previously uploaded file named like
+        `document`, or None unless exactly one card has that name.
+        """
+        cards = []
+        for card in self.get_elements("uploaded_documents"):
+            names = card.find_elements(By.CSS_SELECTOR, ".jobs-document-upload-redesign-card__file-name")
+            if names and names[0].text.strip() == document.filename:
+                cards.append(card)
+        return cards[0] if len(cards) == 1 else None
+
+    def send_document(self, kind, input_locator) -> None:
+        """
+        Sends the variant of `kind` chosen for the current search position,
+        selecting it among the previously uploaded documents when LinkedIn
+        already has this content and uploading the file otherwise.
+        """
+        position = (self.current_search or "").rpartition(": ")[0]
+        document = self.upload_manager.choose(kind, position)
+        if document is None or (self.current_job, kind, document.digest) in self.sent_documents:
             return
-            
-        log.info(f"Processing {len(form)} form fields")
-        for field in form:
-            question = field.text
-            answer = self.ans_question(question.lower())
-            #radio button
-            if self.is_present(self.locator["radio_select"]):
-                try:
-                    input = field.find_element(By.CSS_SELECTOR, "input[type='radio'][value={}]".format(answer))
-                    input.execute_script("arguments[0].click();", input)
-                except Exception as e:
-                    log.error(e)
-                    continue
-            #multi select
-            elif self.is_present(self.locator["multi_select"]):
-                try:
-                    input = field.find_element(self.locator["multi_select"])
-                    input.send_keys(answer)
-                except Exception as e:
-                    log.error(e)
-                    continue
-            # text box
-            elif self.is_present(self.locator["text_select"]):
-                try:
-                    input = field.find_element(self.locator["text_select"])
-                    input.send_keys(answer)
-                except Exception as e:
-                    log.error(e)
-                    continue
+        listed = self.get_elements("uploaded_documents")
+        card = self.uploaded_document_card(document) if listed and self.upload_manager.known(document) else None
+        if card is not None:
+            if "--selected" not in (card.get_attribute("class") or ""):
+                card.click()
+            self.sent_documents.add((self.current_job, kind, document.digest))
+            self.upload_manager.record_reuse(document)
+            self.metrics.uploads.inc(result="reused")
+            self.metrics.upload_bytes_saved.inc(document.size)
+            log.info(f"Selected the previously uploaded {kind.lower()} {document.filename}")
+            return
+        start = time.monotonic()
+        self.browser.find_element(*input_locator).send_keys(document.path)
+        if listed:
+            # the upload is done once LinkedIn lists the new document
+            try:
+                self.wait_until(lambda browser: len(self.get_elements("uploaded_documents")) > len(listed))
+            except TimeoutException:
+                log.debug(f"The uploaded {kind.lower()} {document.filename} was not listed in time")
+        self.sent_documents.add((self.current_job, kind, document.digest))
+        self.upload_manager.record_upload(document, time.monotonic() - start)
+        self.metrics.uploads.inc(result="uploaded")
+        log.info(f"Uploaded the {document.name} {kind.lower()} {document.filename}")
+
+    def wait_until(self, condition):
+        """
+        self.wait.until, giving up no later than the application's deadline.
+        """
+        timeout = self.deadline.timeout(self.command_timeout)
+        wait = self.wait if timeout >= self.command_timeout else WebDriverWait(self.browser, timeout)
+        try:
+            return wait.until(condition)
+        except TimeoutException:
+            self.deadline.check()
+            raise
+
+    def capture_artifact(self, kind, note=None) -> None:
+        """
+        Saves a sampled screenshot and page source of the current job for debugging.
+        """
+        if self.artifacts is None:
+            return
+        name = self.artifacts.capture(kind, self.current_job, self.browser, note=note)
+        if name is not None:
+            log.debug(f"Saving debug artifact {name}")
 
-            elif self.is_present(self.locator["text_select"]):
-               pass
+    def discard_application(self) -> None:
+        """
+        Closes the Easy Apply modal and discards the draft application.
+        """
+        try:
+            for name in ("dismiss", "discard"):
+                for element in self.get_elements(name):
+                    element.click()
+                    self.clock.sleep(1, "apply")
+                    break
+        except Exception as e:
+            log.debug(f"Could not discard the application: {e}")
 
-            if "Yes" or "No" in answer: #radio button
-                try: #debug this
-                    input = form.find_element(By.CSS_SELECTOR, "input[type='radio'][value={}]".format(answer))
-                    form.execute_script("arguments[0].click();", input)
-                except:
-                    pass
+    @traced("process_questions")
+    def process_questions(self):
+        self.deadline.check("questions")
+        self.clock.sleep(1, "question")
+        report = self.form_filler.fill()
 
+        if report.fields == 0:
+            log.info("No form fields found - LinkedIn may have remembered all answers")
+            return report
 
-            else:
-                input = form.find_element(By.CLASS_NAME, "artdeco-text-input--input")
-                input.send_keys(answer)
+        log.info(f"Processed form: {report}")
+        self.metrics.form_fill_seconds.observe(report.total_seconds)
+        return report
 
     def ans_question(self, question): #refactor this to an ans.yaml file
         log.debug(f"Processing question: {question}")
@@ -787,8 +1300,8 @@ class EasyApplyBot:
             log.warning(f"🔍 VISA QUESTION DETECTED: {question}")
         
         # First check if we have a specific answer in our CSV file
-        if question in self.answers:
-            answer = self.answers[question]
+        answer = self.answers.get(question)
+        if answer is not None:
             log.info(f"Using saved answer for: {question} -> {answer}")
             return answer
         
@@ -840,24 +1353,18 @@ class EasyApplyBot:
             except Exception as e:
                 log.error(f"Failed to log unhandled question: {e}")
                 
-            time.sleep(15)
+            self.deadline.check("question")
+            self.clock.sleep(min(15, self.deadline.remaining()), "question")
 
             # df = pd.DataFrame(self.answers, index=[0])
             # df.to_csv(self.qa_file, encoding="utf-8")
         
         log.info("Answering question: " + question + " with answer: " + answer)
 
-        # Always append new questions to CSV for future reference
-        # (even if we found an answer through hardcoded logic)
-        if question not in self.answers:
-            self.answers[question] = answer
-            try:
-                # Append a new question-answer pair to the CSV file
-                new_data = pd.DataFrame({"Question": [question], "Answer": [answer]})
-                new_data.to_csv(self.qa_file, mode='a', header=False, index=False, encoding='utf-8')
-                log.info(f"Appended to QA file: '{question}' with answer: '{answer}'.")
-            except Exception as e:
-                log.error(f"Failed to append to QA file: {e}")
+        # Always remember new questions for future reference
+        # (even if we found an answer through hardcoded logic), they are written to the CSV in bulk
+        if self.answers.add(question, answer):
+            log.info(f"Learned answer: '{question}' with answer: '{answer}'.")
         else:
             log.debug(f"Question already exists in answers dictionary: {question}")
 
@@ -895,6 +1402,8 @@ class EasyApplyBot:
                         
             return False
             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             log.error(f"Error checking experience requirements: {e}")
             # If we can't check, don't skip the job
@@ -907,9 +1416,11 @@ class EasyApplyBot:
         try:
             log.info(f"Looking for recruiter information for job {jobID}")
             
-            # Go back to job page to find recruiter info
-            self.get_job_page(jobID)
-            time.sleep(2)
+            # Go back to job page to find recruiter info, keeping self.job_page on the
+            # page already read: the corpus saves its description after this step
+            self.browser.get('https://www.linkedin.com/jobs/view/' + str(jobID))
+            self.load_page(sleep=0.5, page="job")
+            self.clock.sleep(2, "recruiter")
             
             # Look for recruiter information in various places
             recruiter_info = self.find_recruiter_info()
@@ -922,7 +1433,7 @@ class EasyApplyBot:
                 success = self.send_connection_invite(recruiter_name, recruiter_url, position_title)
                 if success:
                     log.info(f"Successfully sent connection invite to {recruiter_name}")
-                    time.sleep(random.uniform(3, 6))  # Delay after connection
+                    self.clock.pause("recruiter", 3, 6)  # Delay after connection
                 else:
                     log.info(f"Failed to send connection invite to {recruiter_name}")
             else:
@@ -931,6 +1442,7 @@ class EasyApplyBot:
         except Exception as e:
             log.error(f"Error connecting with recruiter: {e}")
 
+    @traced("find_recruiter_info")
     def find_recruiter_info(self):
         """
         Find recruiter information on the job page.
@@ -1023,31 +1535,10 @@ class EasyApplyBot:
                     log.debug(f"Error with fallback selector {selector}: {e}")
                     continue
             
-            # Debug: Log all links on the page for troubleshooting
-            try:
-                all_links = self.browser.find_elements(By.CSS_SELECTOR, "a[href*='/in/']")
-                log.debug(f"Found {len(all_links)} LinkedIn profile links on page")
-                for i, link in enumerate(all_links[:5]):  # Log first 5 for debugging
-                    href = link.get_attribute('href')
-                    text = link.text.strip()
-                    aria_label = link.get_attribute('aria-label')
-                    log.debug(f"Link {i+1}: href={href}, text='{text}', aria-label='{aria_label}'")
-            except Exception as e:
-                log.debug(f"Debug logging failed: {e}")
-            
             log.warning("No recruiter information found with any method")
-            
-            # Take a screenshot for debugging (if enabled in debug mode)
-            try:
-                import os
-                if not os.path.exists("debug_screenshots"):
-                    os.makedirs("debug_screenshots")
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                screenshot_path = f"debug_screenshots/no_recruiter_{timestamp}.png"
-                self.browser.save_screenshot(screenshot_path)
-                log.debug(f"Saved debug screenshot: {screenshot_path}")
-            except Exception as e:
-                log.debug(f"Failed to save debug screenshot: {e}")
+
+            # the profile links on the page are only collected for sampled captures
+            self.capture_artifact("no_recruiter", note=self.profile_links)
             
             return None
             
@@ -1055,6 +1546,14 @@ class EasyApplyBot:
             log.error(f"Error finding recruiter info: {e}")
             return None
 
+    def profile_links(self, limit=5) -> list:
+        """
+        Returns the first profile links on the page, for troubleshooting recruiter selectors.
+        """
+        links = self.browser.find_elements(By.CSS_SELECTOR, "a[href*='/in/']")
+        return [{"href": link.get_attribute('href'), "text": link.text.strip(),
+                 "aria-label": link.get_attribute('aria-label')} for link in links[:limit]]
+
     def send_connection_invite(self, recruiter_name, recruiter_url, position_title):
         """
         Send a connection invite to the recruiter with a personalized message.
@@ -1062,7 +1561,7 @@ class EasyApplyBot:
         try:
             # Navigate to recruiter profile
             self.browser.get(recruiter_url)
-            time.sleep(random.uniform(2, 4))
+            self.clock.pause("recruiter", 2, 4)
             
             # Look for Connect button
             connect_button = None
@@ -1078,7 +1577,7 @@ class EasyApplyBot:
                 try:
                     more_button = self.browser.find_element(By.XPATH, "//button[contains(text(), 'More') or @aria-label='More actions']")
                     more_button.click()
-                    time.sleep(1)
+                    self.clock.sleep(1, "recruiter")
                     connect_button = self.browser.find_element(By.XPATH, "//div[@role='menu']//button[contains(text(), 'Connect')]")
                 except:
                     pass
@@ -1089,13 +1588,13 @@ class EasyApplyBot:
             
             # Click Connect button
             connect_button.click()
-            time.sleep(2)
+            self.clock.sleep(2, "recruiter")
             
             # Look for "Add a note" button and click it
             try:
                 add_note_button = self.browser.find_element(By.XPATH, "//button[contains(text(), 'Add a note')]")
                 add_note_button.click()
-                time.sleep(1)
+                self.clock.sleep(1, "recruiter")
                 
                 # Find message text area and enter personalized message
                 message_area = self.browser.find_element(By.CSS_SELECTOR, "textarea[name='message']")
@@ -1109,12 +1608,12 @@ class EasyApplyBot:
                 
                 message_area.clear()
                 message_area.send_keys(message)
-                time.sleep(1)
+                self.clock.sleep(1, "recruiter")
                 
                 # Send the invite
                 send_button = self.browser.find_element(By.XPATH, "//button[contains(text(), 'Send') or contains(text(), 'Send invitation')]")
                 send_button.click()
-                time.sleep(2)
+                self.clock.sleep(2, "recruiter")
                 
                 log.info(f"Connection invite sent to {recruiter_name} with message: {message}")
                 return True
@@ -1125,7 +1624,7 @@ class EasyApplyBot:
                 try:
                     send_button = self.browser.find_element(By.XPATH, "//button[contains(text(), 'Send') or contains(text(), 'Send invitation')]")
                     send_button.click()
-                    time.sleep(2)
+                    self.clock.sleep(2, "recruiter")
                     log.info(f"Connection invite sent to {recruiter_name} without note")
                     return True
                 except:
@@ -1136,62 +1635,121 @@ class EasyApplyBot:
             log.error(f"Error sending connection invite to {recruiter_name}: {e}")
             return False
 
-    def load_page(self, sleep=1):
+    def load_page(self, sleep=1, page="other"):
+        load_start = time.monotonic()
         scroll_page = 0
         while scroll_page < 4000:
             self.browser.execute_script("window.scrollTo(0," + str(scroll_page) + " );")
             scroll_page += 500
-            time.sleep(sleep)
+            self.clock.sleep(sleep, "scroll")
 
         if sleep != 1:
             self.browser.execute_script("window.scrollTo(0,0);")
-            time.sleep(sleep)
+            self.clock.sleep(sleep, "scroll")
 
-        page = BeautifulSoup(self.browser.page_source, "lxml")
-        return page
+        self.metrics.page_load_seconds.observe(time.monotonic() - load_start, page=page)
+        # the source is only fetched, and only parsed, if a consumer asks for it
+        return LazyPage(lambda: self.browser.page_source, backend=self.html_parser)
 
     def avoid_lock(self) -> None:
+        # pyautogui needs a display, so it is only imported when actually used
+        import pyautogui
         x, _ = pyautogui.position()
         pyautogui.moveTo(x + 200, pyautogui.position().y, duration=1.0)
         pyautogui.moveTo(x, pyautogui.position().y, duration=0.5)
         pyautogui.keyDown('ctrl')
         pyautogui.press('esc')
         pyautogui.keyUp('ctrl')
-        time.sleep(0.5)
+        self.clock.sleep(0.5, "lock")
         pyautogui.press('esc')
 
-    def next_jobs_page(self, position, location, jobs_per_page, experience_level=[]):
+    def next_jobs_page(self, position, location, jobs_per_page, experience_level=[], plan=None):
+        """
+        Loads the results page after the one at offset `jobs_per_page`, or the
+        first page when it is None. Returns (browser, offset), where offset is
+        None once the plan has no pages left.
+        """
+        plan = plan if plan is not None else PagePlan()
+        next_page = plan.next_offset(jobs_per_page)
+        if next_page is None:
+            log.info(f"No more results after offset {jobs_per_page}")
+            return (self.browser, None)
+
         # Construct the experience level part of the URL
         experience_level_str = ",".join(map(str, experience_level)) if experience_level else ""
         experience_level_param = f"&f_E={experience_level_str}" if experience_level_str else ""
         # Add filter for jobs posted in last 7 days (604800 seconds)
         date_filter = "&f_TPR=r604800"
-        
-        # Increment jobs_per_page to go to next page (LinkedIn shows 25 jobs per page)
-        next_page = jobs_per_page + 25
-        
+
         url = ("https://www.linkedin.com/jobs/search/?f_LF=f_AL&keywords=" +
                position + location + "&start=" + str(next_page) + experience_level_param + date_filter)
-        
+        self.search_url = url
+
+        if jobs_per_page is not None and self.goto_results_page(next_page):
+            log.info(f"Moved to job page {next_page} in place")
+            plan.record(in_page=True)
+            self.load_page(page="search")
+            return (self.browser, next_page)
+
         log.info(f"Loading next job page: {next_page}")
         log.debug(f"Full URL: {url}")
         self.browser.get(url)
         #self.avoid_lock()
-        self.load_page()
+        self.load_page(page="search")
+        plan.record(in_page=False)
+        if plan.total is None:
+            plan.set_total(self.result_count())
+            log.info(f"Search has {plan.total if plan.total is not None else 'an unknown number of'} results, "
+                     f"{len(plan.offsets())} pages planned")
         return (self.browser, next_page)
 
+    def result_count(self) -> int | None:
+        """
+        Reads the count from the results header only. Elsewhere on the page
+        "N results" can belong to something else, and None leaves the plan
+        open-ended.
+        """
+        try:
+            return parse_result_count(self.browser.execute_script(RESULT_COUNT_JS))
+        except Exception as e:
+            log.debug(f"Could not read the results header: {e}")
+            return None
+
+    def goto_results_page(self, offset) -> bool:
+        """
+        Clicks the results pagination button for `offset` when the browser is
+        still on the search results. Returns False if a full load is needed.
+        """
+        try:
+            if not self.browser.current_url.startswith("https://www.linkedin.com/jobs/search"):
+                return False
+            page_number = offset // PAGE_SIZE + 1
+            buttons = self.browser.find_elements(By.CSS_SELECTOR, f"button[aria-label='Page {page_number}']")
+            cards = self.browser.find_elements(*self.locator["links"])
+            if not buttons or not cards:
+                return False
+            buttons[0].click()
+            WebDriverWait(self.browser, 10).until(EC.staleness_of(cards[0]))
+            return True
+        except Exception as e:
+            log.debug(f"In-page pagination to offset {offset} failed: {e}")
+            return False
+
     # def finish_apply(self) -> None:
     #     self.browser.close()
 
 
-if __name__ == '__main__':
-
-    with open("config.yaml", 'r') as stream:
+def load_config(path="config.yaml") -> dict:
+    with open(path, 'r') as stream:
         try:
             parameters = yaml.safe_load(stream)
         except yaml.YAMLError as exc:
             raise exc
+    validate_config(parameters)
+    return parameters
 
+
+def validate_config(parameters) -> None:
     assert len(parameters['positions']) > 0
     assert len(parameters['locations']) > 0
     assert parameters['username'] is not None
@@ -1204,37 +1762,144 @@ if __name__ == '__main__':
                         " while should be dict. Try removing '-' from line containing" +
                         " filename & path")
 
+    uploads = {} if parameters.get('uploads', {}) is None else parameters.get('uploads', {})
+    for key in uploads.keys():
+        assert uploads[key] is not None
+
+
+def build_bot(parameters, metrics=None, config_path=None) -> EasyApplyBot:
     log.info({k: parameters[k] for k in parameters.keys() if k not in ['username', 'password']})
 
-    output_filename: list = [f for f in parameters.get('output_filename', ['output.csv']) if f is not None]
+    output_filename = parameters.get('output_filename', ['output.csv'])
+    if isinstance(output_filename, str):
+        output_filename = [output_filename]
+    output_filename: list = [f for f in output_filename if f is not None]
     output_filename: list = output_filename[0] if len(output_filename) > 0 else 'output.csv'
     blacklist = parameters.get('blacklist', [])
     blackListTitles = parameters.get('blackListTitles', [])
 
     uploads = {} if parameters.get('uploads', {}) is None else parameters.get('uploads', {})
-    for key in uploads.keys():
-        assert uploads[key] is not None
+    upload_manager = UploadManager(uploads,
+                                   variants=parameters.get('upload_variants'),
+                                   positions=parameters.get('position_uploads'),
+                                   registry_path=parameters.get('upload_registry', 'upload_registry.json'))
+
+    metrics = metrics if metrics is not None else BotMetrics()
+    job_cache = JobCache(parameters.get('job_cache', 'job_cache.db'),
+                         ttl_days=parameters.get('job_cache_ttl_days', 7))
+    corpus_dir = parameters.get('corpus', 'corpus')
+    corpus = CorpusStore(corpus_dir) if corpus_dir else None
+    clock = Clock(profile=parameters.get('pacing_profile'), trace_path=parameters.get('pacing_trace'))
+    job_queue = None
+    if parameters.get('pipeline'):
+        job_queue = JobQueue(parameters.get('job_queue', 'job_queue.db'), maxsize=parameters.get('queue_size', 100))
+    tracer = TraceRecorder(parameters['webtrace_dir'], clock=clock) if parameters.get('webtrace_dir') else None
+    history = None
+    if parameters.get('history', 'history'):
+        if history_available():
+            history = HistoryStore(parameters.get('history', 'history'), source=output_filename,
+                                   job_cache_path=parameters.get('job_cache', 'job_cache.db'),
+                                   interval=parameters.get('history_interval', 900))
+        else:
+            log.info("pyarrow is not installed, application history will not be compacted")
+    config_watcher = None
+    if config_path is not None and parameters.get('reload_config', True):
+        config_watcher = ConfigWatcher(config_path, load_config, parameters,
+                                       check_interval=parameters.get('config_check_interval', 5))
+    artifacts_dir = parameters.get('debug_artifacts', 'debug_artifacts')
+    artifacts = ArtifactStore(artifacts_dir,
+                              max_bytes=parameters.get('debug_artifacts_max_mb', 200) * 2 ** 20,
+                              sample_first=parameters.get('debug_sample_first', 3),
+                              sample_every=parameters.get('debug_sample_every', 20)) if artifacts_dir else None
+    rate_limiter = RateLimiter(min_interval=parameters.get('min_apply_interval', 0),
+                               max_per_hour=parameters.get('max_applications_per_hour'),
+                               sleep=lambda seconds: clock.sleep(seconds, "rate_limit", scale=False),
+                               now=clock.now)
+
+    return EasyApplyBot(parameters['username'],
+                        parameters['password'],
+                        parameters['phone_number'],
+                        parameters['salary'],
+                        parameters['rate'],
+                        uploads=uploads,
+                        filename=output_filename,
+                        blacklist=blacklist,
+                        blackListTitles=blackListTitles,
+                        experience_level=parameters.get('experience_level', []),
+                        max_applications=parameters.get('max_applications', 50),
+                        min_salary_yearly=parameters.get('min_salary_yearly', 60000),
+                        min_salary_hourly=parameters.get('min_salary_hourly', 32),
+                        send_recruiter_invites=parameters.get('send_recruiter_invites', True),
+                        skip_zero_experience=parameters.get('skip_zero_experience', True),
+                        use_linkedin_resume=parameters.get('use_linkedin_resume', True),
+                        metrics=metrics,
+                        job_cache=job_cache,
+                        html_parser=parameters.get('html_parser'),
+                        profile_path=parameters.get('profile_path') or None,
+                        qa_file=parameters.get('qa_file', 'qa.csv'),
+                        answers_flush_interval=parameters.get('answers_flush_interval', 60),
+                        rate_limiter=rate_limiter,
+                        command_timeout=parameters.get('command_timeout', 15),
+                        max_browser_rss_mb=parameters.get('max_browser_rss_mb', 3000),
+                        max_driver_failures=parameters.get('max_driver_failures', 3),
+                        corpus=corpus,
+                        rank_jobs=parameters.get('rank_jobs', True),
+                        rank_pages=parameters.get('rank_pages', 1),
+                        profile_keywords=parameters.get('profile_keywords') or [],
+                        clock=clock,
+                        tracer=tracer,
+                        job_queue=job_queue,
+                        apply_workers=parameters.get('apply_workers', 1),
+                        structured_data=parameters.get('structured_data', True),
+                        http_client=parameters.get('http_client', False),
+                        apply_deadline=parameters.get('apply_deadline', 180),
+                        apply_max_steps=parameters.get('apply_max_steps', 25),
+                        experience_profile=parameters.get('experience_profile'),
+                        artifacts=artifacts,
+                        history=history,
+                        config_watcher=config_watcher,
+                        upload_manager=upload_manager
+                        )
+
+
+def run(parameters, metrics=None, config_path=None) -> EasyApplyBot:
+    metrics = metrics if metrics is not None else BotMetrics()
+    exporter = None
+    if parameters.get('metrics_port') or parameters.get('metrics_textfile'):
+        exporter = MetricsExporter(metrics,
+                                   port=parameters.get('metrics_port'),
+                                   address=parameters.get('metrics_address', '127.0.0.1'),
+                                   textfile=parameters.get('metrics_textfile'),
+                                   interval=parameters.get('metrics_interval', 15))
+        exporter.start()
 
     locations: list = [l for l in parameters['locations'] if l is not None]
     positions: list = [p for p in parameters['positions'] if p is not None]
 
-    bot = EasyApplyBot(parameters['username'],
-                       parameters['password'],
-                       parameters['phone_number'],
-                       parameters['salary'],
-                       parameters['rate'], 
-                       uploads=uploads,
-                       filename=output_filename,
-                       blacklist=blacklist,
-                       blackListTitles=blackListTitles,
-                       experience_level=parameters.get('experience_level', []),
-                       max_applications=parameters.get('max_applications', 50),
-                       min_salary_yearly=parameters.get('min_salary_yearly', 60000),
-                       min_salary_hourly=parameters.get('min_salary_hourly', 32),
-                       send_recruiter_invites=parameters.get('send_recruiter_invites', True),
-                       skip_zero_experience=parameters.get('skip_zero_experience', True),
-                       use_linkedin_resume=parameters.get('use_linkedin_resume', True)
-                       )
-    bot.start_apply(positions, locations)
+    try:
+        bot = build_bot(parameters, metrics=metrics, config_path=config_path)
+        try:
+            bot.start_apply(positions, locations)
+        finally:
+            log.info(f"Pacing: {bot.clock.summary()}")
+            bot.clock.close()
+            bot.answers.close()
+            if bot.history is not None:
+                bot.history.compact()
+            if bot.upload_manager.uploaded or bot.upload_manager.reused:
+                log.info(f"Uploads: {bot.upload_manager.summary()}")
+            if bot.artifacts is not None:
+                log.info(f"Debug artifacts: {bot.artifacts.summary()}")
+                bot.artifacts.close()
+            if bot.job_queue is not None:
+                bot.job_queue.close()
+            if bot.corpus is not None:
+                bot.corpus.close()
+    finally:
+        if exporter is not None:
+            exporter.stop()
+    return bot
 
 
+if __name__ == '__main__':
+    run(load_config("config.yaml"), config_path="config.yaml")
@@ -0,0 +1,97 @@
+"""
+Job filters that only need text, shared by the live bot and offline tools.
+"""
+from __future__ import annotations
+
+import re
+
+# Patterns for yearly salary (£60,000, £60000, £60k)
+YEARLY_PATTERNS = [re.compile(p) for p in (
+    r'£\s*(\d{1,3}(?:,\d{3})*)\s*(?:per\s+year|annually|/year|p\.a\.)',
+    r'£\s*(\d{2,3})k\s*(?:per\s+year|annually|/year|p\.a\.)',
+    r'(\d{1,3}(?:,\d{3})*)\s*£\s*(?:per\s+year|annually|/year|p\.a\.)',
+    r'salary.*?£\s*(\d{1,3}(?:,\d{3})*)',
+    r'£\s*(\d{1,3}(?:,\d{3})*)\s*-\s*£\s*(\d{1,3}(?:,\d{3})*)',  # range
+)]
+
+# Patterns for hourly salary (£32/hour, £32 per hour)
+HOURLY_PATTERNS = [re.compile(p) for p in (
+    r'£\s*(\d{1,3}(?:\.\d{2})?)\s*(?:per\s+hour|/hour|hourly)',
+    r'(\d{1,3}(?:\.\d{2})?)\s*£\s*(?:per\s+hour|/hour|hourly)',
+)]
+
+
+def parse_salary(job_description) -> tuple:
+    """
+    Parse salary information from job description text.
+    Returns (yearly_salary, hourly_salary) or (None, None) if not found.
+    """
+    # Convert to lowercase for easier matching
+    text = job_description.lower()
+
+    # Check yearly patterns
+    for pattern in YEARLY_PATTERNS:
+        matches = pattern.findall(text)
+        if matches:
+            try:
+                if isinstance(matches[0], tuple):  # salary range
+                    # Take the lower bound of the range
+                    salary_str = matches[0][0]
+                else:
+                    salary_str = matches[0]
+
+                # Handle 'k' notation
+                if 'k' in text and salary_str.isdigit():
+                    yearly_salary = int(salary_str) * 1000
+                else:
+                    yearly_salary = int(salary_str.replace(',', ''))
+
+                return yearly_salary, None
+            except (ValueError, IndexError):
+                continue
+
+    # Check hourly patterns
+    for pattern in HOURLY_PATTERNS:
+        matches = pattern.findall(text)
+        if matches:
+            try:
+                hourly_salary = float(matches[0])
+                return None, hourly_salary
+            except (ValueError, IndexError):
+                continue
+
+    return None, None
+
+
+def meets_salary(yearly_salary, hourly_salary, min_salary_yearly, min_salary_hourly) -> bool:
+    """
+    True if the salary meets the minimums, or if no salary was found.
+    """
+    if yearly_salary is not None:
+        return yearly_salary >= min_salary_yearly
+    if hourly_salary is not None:
+        return hourly_salary >= min_salary_hourly
+    return True
+
+
+def title_blacklisted(title, matcher) -> bool:
+    """
+    True if `title` contains a phrase of the title blacklist, a matchers.Matcher.
+    """
+    return matcher.search(title) is not None
+
+
+def parse_card(card_text) -> tuple:
+    """
+    Returns (title, company, location) from the text of a search result card,
+    whose first lines are the title (sometimes repeated with " with
+    verification"), the company and the location. Missing parts are None.
+    """
+    lines = [line.strip() for line in card_text.splitlines() if line.strip()]
+    if not lines:
+        return None, None, None
+    title = lines[0]
+    rest = [line for line in lines[1:] if line != title and not line.startswith(title + " with")]
+    company = rest[0] if len(rest) > 0 else None
+    location = rest[1] if len(rest) > 1 else None
+    return title, company, location
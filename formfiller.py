@@ -0,0 +1,222 @@
+"""
+Batched Easy Apply form filling.
+
+Instead of querying the page several times per field, the form is read with a
+single script that returns every grouping (label text, input kind, options,
+current value, required and error state). Answers are resolved for all fields
+at once and written back with one more script; only typeahead inputs, which
+need real key events to show suggestions, are filled element by element.
+"""
+from __future__ import annotations
+
+import logging
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+from pacing import Clock
+
+log = logging.getLogger("easyapplybot.formfiller")
+
+GROUPING_SELECTOR = ".jobs-easy-apply-form-section__grouping"
+
+SNAPSHOT_JS = """
+const groups = document.querySelectorAll(arguments[0]);
+const labelFor = (g, input) => {
+    const label = input.id ? g.querySelector('label[for="' + CSS.escape(input.id) + '"]') : null;
+    return (label ? label.innerText : input.value).trim();
+};
+return Array.from(groups).map((g, index) => {
+    const radios = g.querySelectorAll("input[type='radio']");
+    const checkboxes = g.querySelectorAll("input[type='checkbox']");
+    const select = g.querySelector('select');
+    const typeahead = g.querySelector("[id*='text-entity-list-form-component']");
+    const text = g.querySelector("textarea, input.artdeco-text-input--input, input[type='text'], input:not([type])");
+    let kind = 'unknown', options = [], value = '';
+    if (radios.length) {
+        kind = 'radio';
+        options = Array.from(radios).map(r => ({value: r.value, label: labelFor(g, r)}));
+        const checked = Array.from(radios).find(r => r.checked);
+        value = checked ? checked.value : '';
+    } else if (select) {
+        kind = 'select';
+        options = Array.from(select.options).map(o => ({value: o.value, label: o.text.trim()}));
+        value = select.selectedIndex > 0 ? select.value : '';
+    } else if (checkboxes.length) {
+        kind = 'checkbox';
+        options = Array.from(checkboxes).map(c => ({value: c.value, label: labelFor(g, c)}));
+        value = Array.from(checkboxes).filter(c => c.checked).map(c => c.value).join(',');
+    } else if (typeahead) {
+        kind = 'typeahead';
+        value = typeahead.value || '';
+    } else if (text) {
+        kind = text.tagName === 'TEXTAREA' ? 'textarea' : 'text';
+        value = text.value || '';
+    }
+    const error = g.querySelector('.artdeco-inline-feedback__message');
+    return {
+        index: index,
+        label: g.innerText,
+        kind: kind,
+        options: options,
+        value: value,
+        required: !!g.querySelector('[required], [aria-required="true"]') || /\\bRequired\\b/.test(g.innerText),
+        error: error ? error.innerText.trim() : ''
+    };
+});
+"""
+
+APPLY_JS = """
+const groups = document.querySelectorAll(arguments[0]);
+const setValue = (el, value) => {
+    const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype
+        : el.tagName === 'SELECT' ? HTMLSelectElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.dispatchEvent(new Event('blur', {bubbles: true}));
+};
+const clickInput = (g, input) => {
+    const label = input.id ? g.querySelector('label[for="' + CSS.escape(input.id) + '"]') : null;
+    (label || input).click();
+};
+const failed = [];
+for (const fill of arguments[1]) {
+    const g = groups[fill.index];
+    try {
+        if (!g) throw 'missing';
+        if (fill.kind === 'radio' || fill.kind === 'checkbox') {
+            const input = Array.from(g.querySelectorAll("input[type='" + fill.kind + "']")).find(i => i.value === fill.value);
+            if (!input) throw 'no option';
+            if (!input.checked) clickInput(g, input);
+        } else if (fill.kind === 'select') {
+            setValue(g.querySelector('select'), fill.value);
+        } else {
+            setValue(g.querySelector("textarea, input.artdeco-text-input--input, input[type='text'], input:not([type])"), fill.value);
+        }
+    } catch (e) {
+        failed.push(fill.index);
+    }
+}
+return failed;
+"""
+
+TRUTHY = {"yes", "true", "1", "y"}
+
+
+def match_option(options, answer) -> str | None:
+    """
+    Returns the value of the option that best matches the answer, or None.
+    """
+    wanted = str(answer).strip().lower()
+    if not wanted:
+        return None
+    for option in options:
+        if wanted in (option["value"].strip().lower(), option["label"].strip().lower()):
+            return option["value"]
+    for option in options:
+        if option["label"].strip().lower().startswith(wanted):
+            return option["value"]
+    return None
+
+
+class FormReport:
+    def __init__(self):
+        self.fields = 0
+        self.filled = 0
+        self.already_set = 0
+        self.unanswered = 0
+        self.failed = 0
+        self.snapshot_seconds = 0.0
+        self.resolve_seconds = 0.0
+        self.apply_seconds = 0.0
+
+    @property
+    def total_seconds(self) -> float:
+        return self.snapshot_seconds + self.resolve_seconds + self.apply_seconds
+
+    def __str__(self) -> str:
+        return (f"{self.fields} fields: {self.filled} filled, {self.already_set} already set, "
+                f"{self.unanswered} unanswered, {self.failed} failed in {self.total_seconds:.2f}s "
+                f"(snapshot {self.snapshot_seconds * 1000:.0f} ms, answers {self.resolve_seconds * 1000:.0f} ms, "
+                f"apply {self.apply_seconds * 1000:.0f} ms)")
+
+
+class FormFiller:
+    """
+    Fills the currently open Easy Apply step.
+    `answer` is called with the lowercased field text and returns the answer.
+    Pauses go through `clock`, the bot's pacing.Clock.
+    """
+
+    def __init__(self, browser, answer, clock=None):
+        self.browser = browser
+        self.answer = answer
+        self.clock = clock if clock is not None else Clock()
+
+    def snapshot(self) -> list:
+        return self.browser.execute_script(SNAPSHOT_JS, GROUPING_SELECTOR) or []
+
+    def resolve(self, fields, report) -> list:
+        fills = []
+        for field in fields:
+            if field["kind"] == "unknown":
+                continue
+            if field["value"] and not field["error"]:
+                report.already_set += 1
+                continue
+            answer = self.answer(field["label"].lower())
+            if answer is None:
+                report.unanswered += 1
+                continue
+            value = str(answer)
+            if field["kind"] in ("radio", "select"):
+                value = match_option(field["options"], answer)
+            elif field["kind"] == "checkbox":
+                value = field["options"][0]["value"] if value.strip().lower() in TRUTHY else None
+            if value is None:
+                log.debug(f"No option matches '{answer}' for: {field['label'][:80]}")
+                report.unanswered += 1
+                continue
+            fills.append({"index": field["index"], "kind": field["kind"], "value": value})
+        return fills
+
+    def apply(self, fills) -> list:
+        batched = [fill for fill in fills if fill["kind"] != "typeahead"]
+        failed = self.browser.execute_script(APPLY_JS, GROUPING_SELECTOR, batched) if batched else []
+        typeahead = [fill for fill in fills if fill["kind"] == "typeahead"]
+        if typeahead:
+            groups = self.browser.find_elements(By.CSS_SELECTOR, GROUPING_SELECTOR)
+            for fill in typeahead:
+                try:
+                    field_input = groups[fill["index"]].find_element(
+                        By.XPATH, ".//*[contains(@id, 'text-entity-list-form-component')]")
+                    field_input.clear()
+                    field_input.send_keys(fill["value"])
+                    self.clock.sleep(1, "apply")
+                    field_input.send_keys(Keys.ARROW_DOWN, Keys.ENTER)
+                except Exception as e:
+                    log.debug(f"Typeahead fill failed: {e}")
+                    failed.append(fill["index"])
+        return failed
+
+    def fill(self) -> FormReport:
+        report = FormReport()
+
+        start = time.monotonic()
+        fields = self.snapshot()
+        report.fields = len(fields)
+        report.snapshot_seconds = time.monotonic() - start
+
+        start = time.monotonic()
+        fills = self.resolve(fields, report)
+        report.resolve_seconds = time.monotonic() - start
+
+        start = time.monotonic()
+        failed = self.apply(fills) if fills else []
+        report.apply_seconds = time.monotonic() - start
+
+        report.failed = len(failed)
+        report.filled = len(fills) - len(failed)
+        return report
@@ -0,0 +1,280 @@
+"""
+Columnar application history compacted from out.csv, and a fast analytics CLI.
+
+out.csv stays the bot's write path. Rows appended since the last compaction
+are cleaned and typed, joined with the job cache verdicts, and written as a
+new Parquet part in the history directory. Many small parts are merged into
+one. Queries read only the columns they need and aggregate them with Arrow
+compute kernels. Needs pyarrow (`pip install pyarrow`), which is optional:
+without it the bot just keeps writing out.csv.
+
+    python history.py compact [--output out.csv] [--job-cache job_cache.db]
+    python history.py summary | daily [--days 30] | companies [--top 20] | searches | rejections
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import glob
+import importlib.util
+import io
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from answers import file_lock
+
+# pyarrow is imported on first use, it is slow to import and the bot only needs it to compact
+pa = pc = pq = None
+
+log = logging.getLogger("easyapplybot.history")
+
+STATE_FILE = "_state.json"
+MAX_PARTS = 16
+# "(12) Title" tab titles used to leave "2) Title" in out.csv
+TITLE_PREFIX_RE = re.compile(r"^\(?\d+\)\s*")
+
+
+def available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _load_arrow() -> None:
+    global pa, pc, pq
+    if pa is None:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.parquet
+        pa, pc, pq = pyarrow, pyarrow.compute, pyarrow.parquet
+
+
+def clean_title(title) -> str | None:
+    title = TITLE_PREFIX_RE.sub("", title or "").strip()
+    return title or None
+
+
+def _verdicts(job_cache_path) -> dict:
+    if not job_cache_path or not os.path.isfile(job_cache_path):
+        return {}
+    conn = sqlite3.connect(job_cache_path, timeout=30)
+    try:
+        return dict(conn.execute("SELECT job_id, verdict FROM jobs WHERE verdict IS NOT NULL").fetchall())
+    except sqlite3.Error:
+        return {}
+    finally:
+        conn.close()
+
+
+def rows_to_table(rows, verdicts=None):
+    """
+    Builds a typed table from out.csv rows, skipping rows that do not parse.
+    """
+    _load_arrow()
+    verdicts = verdicts or {}
+    columns = {name: [] for name in ("timestamp", "job_id", "title", "company", "attempted", "applied",
+                                     "position", "location", "verdict")}
+    for row in rows:
+        if len(row) < 6 or not row[1].isdigit():
+            continue
+        position, _, location = row[6].rpartition(": ") if len(row) > 6 else ("", "", "")
+        columns["timestamp"].append(row[0])
+        columns["job_id"].append(int(row[1]))
+        columns["title"].append(clean_title(row[2]))
+        columns["company"].append(row[3].strip() or None)
+        columns["attempted"].append(row[4] == "True")
+        columns["applied"].append(row[5] == "True")
+        columns["position"].append(position or None)
+        columns["location"].append(location or None)
+        columns["verdict"].append(verdicts.get(row[1]))
+    timestamps = pc.strptime(pa.array(columns.pop("timestamp"), pa.string()), format="%Y-%m-%d %H:%M:%S",
+                             unit="s", error_is_null=True)
+    arrays = {"timestamp": timestamps,
+              "job_id": pa.array(columns.pop("job_id"), pa.int64()),
+              "attempted": pa.array(columns.pop("attempted"), pa.bool_()),
+              "applied": pa.array(columns.pop("applied"), pa.bool_())}
+    for name, values in columns.items():
+        arrays[name] = pa.array(values, pa.string()).dictionary_encode()
+    table = pa.table(arrays)
+    return table.filter(pc.is_valid(table["timestamp"]))
+
+
+class HistoryStore:
+    def __init__(self, directory="history", source="out.csv", job_cache_path="job_cache.db", interval=900):
+        if not available():
+            raise ImportError("the history store needs pyarrow: pip install pyarrow")
+        _load_arrow()
+        self.directory = directory
+        self.source = source
+        self.job_cache_path = job_cache_path
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._last = time.monotonic()
+        os.makedirs(directory, exist_ok=True)
+
+    def _state(self) -> dict:
+        path = os.path.join(self.directory, STATE_FILE)
+        if not os.path.exists(path):
+            return {"offset": 0, "next_part": 0}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_state(self, state) -> None:
+        path = os.path.join(self.directory, STATE_FILE)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(path + ".tmp", path)
+
+    def parts(self) -> list:
+        return sorted(glob.glob(os.path.join(self.directory, "part-*.parquet")))
+
+    def _write_part(self, table, state) -> None:
+        path = os.path.join(self.directory, f"part-{state['next_part']:06d}.parquet")
+        pq.write_table(table, path + ".tmp", compression="zstd")
+        os.replace(path + ".tmp", path)
+        state["next_part"] += 1
+
+    def maybe_compact(self) -> int:
+        if time.monotonic() - self._last < self.interval:
+            return 0
+        return self.compact()
+
+    def compact(self) -> int:
+        """
+        Moves the rows appended to out.csv since the last compaction into the
+        history, returning how many were added.
+        """
+        with self._lock, file_lock(os.path.join(self.directory, "_state")):
+            self._last = time.monotonic()
+            state = self._state()
+            if not os.path.isfile(self.source):
+                return 0
+            if os.path.getsize(self.source) < state["offset"]:
+                log.info(f"{self.source} was replaced, rebuilding the history")
+                for path in self.parts():
+                    os.remove(path)
+                state = {"offset": 0, "next_part": 0}
+            with open(self.source, "rb") as f:
+                f.seek(state["offset"])
+                data = f.read()
+            # only whole lines; a row being appended is picked up next time
+            data = data[:data.rfind(b"\n") + 1]
+            if not data:
+                return 0
+            rows = csv.reader(io.StringIO(data.decode("utf-8", errors="replace"), newline=""))
+            table = rows_to_table(rows, _verdicts(self.job_cache_path))
+            if table.num_rows:
+                self._write_part(table, state)
+            state["offset"] += len(data)
+            parts = self.parts()
+            if len(parts) > MAX_PARTS:
+                merged = pa.concat_tables([pq.read_table(p) for p in parts]).unify_dictionaries()
+                self._write_part(merged.combine_chunks(), state)
+                for path in parts:
+                    os.remove(path)
+            self._save_state(state)
+            log.debug(f"Compacted {table.num_rows} rows into the history")
+            return table.num_rows
+
+    def read(self, columns=None):
+        parts = self.parts()
+        if not parts:
+            return rows_to_table([]).select(columns) if columns else rows_to_table([])
+        return pa.concat_tables([pq.read_table(p, columns=columns) for p in parts]).unify_dictionaries()
+
+
+def _rate(table) -> object:
+    attempted = pc.cast(table["attempted"], pa.float64())
+    return pc.divide(pc.cast(table["applied"], pa.float64()), pc.if_else(pc.equal(attempted, 0), None, attempted))
+
+
+def applications_per_day(table, days=None):
+    daily = pa.table({"day": pc.cast(table["timestamp"], pa.date32()),
+                      "attempted": table["attempted"], "applied": table["applied"]})
+    result = daily.group_by("day").aggregate([("attempted", "sum"), ("applied", "sum")])
+    result = result.select(["day", "attempted_sum", "applied_sum"]).rename_columns(["day", "attempted", "applied"])
+    result = result.sort_by("day")
+    return result.slice(max(0, result.num_rows - days)) if days else result
+
+
+def by_group(table, keys, top=None, min_attempts=1):
+    grouped = table.select(keys + ["attempted", "applied"]).group_by(keys).aggregate(
+        [("applied", "count"), ("attempted", "sum"), ("applied", "sum")])
+    grouped = grouped.select(keys + ["applied_count", "attempted_sum", "applied_sum"]).rename_columns(
+        keys + ["jobs", "attempted", "applied"])
+    grouped = grouped.filter(pc.greater_equal(grouped["attempted"], min_attempts))
+    grouped = grouped.append_column("success_rate", _rate(grouped))
+    grouped = grouped.sort_by([("attempted", "descending")])
+    return grouped.slice(0, top) if top else grouped
+
+
+def rejections(table):
+    rejected = table.filter(pc.invert(table["applied"]))
+    verdict = pc.fill_null(pc.cast(rejected["verdict"], pa.string()), "unknown")
+    counts = pc.value_counts(verdict)
+    result = pa.table({"verdict": counts.field("values"), "jobs": counts.field("counts")})
+    return result.sort_by([("jobs", "descending")])
+
+
+def format_table(table) -> str:
+    names = table.column_names
+    rows = [[("-" if v is None else f"{v:.0%}" if isinstance(v, float) else str(v)) for v in row.values()]
+            for row in table.to_pylist()]
+    widths = [max([len(n)] + [len(r[i]) for r in rows]) for i, n in enumerate(names)]
+    lines = ["  ".join(n.ljust(w) for n, w in zip(names, widths))]
+    lines += ["  ".join(v.ljust(w) for v, w in zip(r, widths)) for r in rows]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Application history tools")
+    parser.add_argument("--history", default="history")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compact_parser = commands.add_parser("compact")
+    compact_parser.add_argument("--output", default="out.csv")
+    compact_parser.add_argument("--job-cache", default="job_cache.db")
+    commands.add_parser("summary")
+    daily_parser = commands.add_parser("daily")
+    daily_parser.add_argument("--days", type=int, default=30)
+    companies_parser = commands.add_parser("companies")
+    companies_parser.add_argument("--top", type=int, default=20)
+    companies_parser.add_argument("--min-attempts", type=int, default=1)
+    searches_parser = commands.add_parser("searches")
+    searches_parser.add_argument("--top", type=int, default=20)
+    commands.add_parser("rejections")
+    args = parser.parse_args()
+
+    if not available():
+        parser.error("pyarrow is not installed: pip install pyarrow")
+    store = HistoryStore(args.history, source=getattr(args, "output", "out.csv"),
+                         job_cache_path=getattr(args, "job_cache", None))
+    start = time.perf_counter()
+    if args.command == "compact":
+        added = store.compact()
+        print(f"Added {added} rows, history has {len(store.parts())} parts")
+    elif args.command == "summary":
+        table = store.read(["timestamp", "company", "attempted", "applied"])
+        if table.num_rows:
+            first, last = pc.min_max(table["timestamp"]).values()
+            print(f"{table.num_rows} jobs from {first} to {last}, {pc.sum(table['attempted'])} attempted, "
+                  f"{pc.sum(table['applied'])} applied, {pc.count_distinct(pc.cast(table['company'], pa.string()))} companies")
+        else:
+            print("history is empty, run `python history.py compact` first")
+    elif args.command == "daily":
+        print(format_table(applications_per_day(store.read(["timestamp", "attempted", "applied"]), args.days)))
+    elif args.command == "companies":
+        print(format_table(by_group(store.read(["company", "attempted", "applied"]), ["company"], args.top,
+                                    args.min_attempts)))
+    elif args.command == "searches":
+        print(format_table(by_group(store.read(["position", "location", "attempted", "applied"]),
+                                    ["position", "location"], args.top)))
+    elif args.command == "rejections":
+        print(format_table(rejections(store.read(["applied", "verdict"]))))
+    log.debug(f"{args.command} took {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
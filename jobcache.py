@@ -0,0 +1,95 @@
+"""
+Persistent per-job metadata cache.
+
+The same job IDs come back for different position/location combos and on
+different days. What was learned about a job the first time (title, company,
+parsed salary, whether it has an Easy Apply button and the verdict) is kept
+in a small SQLite file so later searches can skip known-ineligible jobs
+without opening them again.
+"""
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+
+log = logging.getLogger("easyapplybot.jobcache")
+
+# verdicts that are final for a job, whatever the filter settings are
+FINAL_VERDICTS = {"applied", "already_applied", "no_easy_apply"}
+# seconds a verdict holds when it can come from a page that had not finished loading
+VERDICT_TTL = {"no_easy_apply": 24 * 60 * 60}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    title TEXT,
+    company TEXT,
+    salary_yearly INTEGER,
+    salary_hourly REAL,
+    easy_apply INTEGER,
+    verdict TEXT,
+    checked_at REAL NOT NULL
+)
+"""
+
+FIELDS = ("title", "company", "salary_yearly", "salary_hourly", "easy_apply", "verdict")
+
+
+class JobCache:
+    def __init__(self, path="job_cache.db", ttl_days=7):
+        self.path = path
+        self.ttl = ttl_days * 24 * 60 * 60
+        self.hits = 0
+        # one connection shared by the pipeline threads, used under the lock
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(SCHEMA)
+        self.conn.commit()
+
+    def get(self, job_id) -> dict | None:
+        """
+        Returns the cached record for a job, or None if unknown or expired.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT title, company, salary_yearly, salary_hourly, easy_apply, verdict, checked_at "
+                "FROM jobs WHERE job_id = ?", (str(job_id),)).fetchone()
+        if row is None or time.time() - row[-1] > self.ttl:
+            return None
+        record = dict(zip(FIELDS, row[:-1]))
+        if time.time() - row[-1] > VERDICT_TTL.get(record["verdict"], self.ttl):
+            record["verdict"] = None
+        if record["easy_apply"] is not None:
+            record["easy_apply"] = bool(record["easy_apply"])
+        return record
+
+    def record(self, job_id, **fields) -> None:
+        """
+        Stores what is known about a job. Fields left out keep their cached value.
+        """
+        unknown = set(fields) - set(FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown job cache fields: {unknown}")
+        if "easy_apply" in fields and fields["easy_apply"] is not None:
+            fields["easy_apply"] = int(bool(fields["easy_apply"]))
+        columns = ["job_id", "checked_at"] + list(fields)
+        values = [str(job_id), time.time()] + list(fields.values())
+        updates = ", ".join(f"{c} = COALESCE(excluded.{c}, {c})" for c in ["checked_at"] + list(fields))
+        with self._lock:
+            self.conn.execute(
+                f"INSERT INTO jobs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+                f"ON CONFLICT(job_id) DO UPDATE SET {updates}", values)
+            self.conn.commit()
+
+    def prune(self) -> int:
+        with self._lock:
+            cursor = self.conn.execute("DELETE FROM jobs WHERE checked_at < ?", (time.time() - self.ttl,))
+            self.conn.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,168 @@
+"""
+Durable queue of candidate jobs between the search crawler and apply workers.
+
+With `pipeline: true` the search runs in its own browser and streams the jobs
+it keeps into this SQLite queue, while apply workers claim jobs from it in
+the order they were ranked. The crawler blocks while `queue_size` jobs are
+waiting (backpressure); a stop flag set once max_applications is reached ends
+both sides. Jobs left in the queue survive a restart, and jobs claimed by a
+worker that died are handed out again.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+log = logging.getLogger("easyapplybot.jobqueue")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS queue (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL UNIQUE,
+    card TEXT,
+    search TEXT,
+    state TEXT NOT NULL DEFAULT 'queued',
+    worker TEXT,
+    result TEXT,
+    enqueued_at REAL NOT NULL,
+    claimed_at REAL,
+    done_at REAL
+);
+CREATE INDEX IF NOT EXISTS queue_state ON queue (state, seq);
+CREATE TABLE IF NOT EXISTS flags (name TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+class JobQueue:
+    def __init__(self, path="job_queue.db", maxsize=100, poll_interval=0.5, sleep=time.sleep):
+        self.path = path
+        self.maxsize = maxsize
+        self.poll_interval = poll_interval
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def _flag(self, name) -> str | None:
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM flags WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def _set_flag(self, name, value) -> None:
+        with self._lock:
+            self.conn.execute("INSERT OR REPLACE INTO flags (name, value) VALUES (?, ?)", (name, value))
+
+    def start(self, stale_after=600) -> None:
+        """
+        Prepares the queue for a new run: clears the stop and crawl-finished
+        flags and re-queues jobs claimed over `stale_after` seconds ago.
+        """
+        with self._lock:
+            self.conn.execute("DELETE FROM flags WHERE name IN ('stopped', 'crawl_done')")
+            self.conn.execute("INSERT OR REPLACE INTO flags (name, value) VALUES ('started_at', ?)",
+                              (str(time.time()),))
+            requeued = self.conn.execute(
+                "UPDATE queue SET state = 'queued', worker = NULL WHERE state = 'claimed' AND claimed_at < ?",
+                (time.time() - stale_after,)).rowcount
+        if requeued:
+            log.info(f"Re-queued {requeued} jobs claimed by workers that did not finish them")
+
+    def stop(self) -> None:
+        self._set_flag("stopped", "1")
+
+    def stopped(self) -> bool:
+        return self._flag("stopped") is not None
+
+    def finish_crawl(self) -> None:
+        self._set_flag("crawl_done", "1")
+
+    def crawl_done(self) -> bool:
+        return self._flag("crawl_done") is not None
+
+    def waiting(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM queue WHERE state = 'queued'").fetchone()[0]
+
+    def put(self, job_id, card=None, search=None) -> bool:
+        """
+        Adds a job, blocking while the queue is full. Returns False if the job
+        was queued before or the queue was stopped while waiting.
+        """
+        waited = False
+        while self.waiting() >= self.maxsize:
+            if self.stopped():
+                return False
+            if not waited:
+                log.debug(f"Job queue full ({self.maxsize} waiting), crawler paused")
+                waited = True
+            self._sleep(self.poll_interval)
+        with self._lock:
+            added = self.conn.execute(
+                "INSERT OR IGNORE INTO queue (job_id, card, search, enqueued_at) VALUES (?, ?, ?, ?)",
+                (str(job_id), card, search, time.time())).rowcount
+        return bool(added)
+
+    def claim(self, worker="main") -> dict | None:
+        """
+        Atomically takes the oldest queued job for `worker`, or returns None.
+        """
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.conn.execute("SELECT seq, job_id, card, search FROM queue WHERE state = 'queued' "
+                                        "ORDER BY seq LIMIT 1").fetchone()
+                if row is not None:
+                    self.conn.execute("UPDATE queue SET state = 'claimed', worker = ?, claimed_at = ? WHERE seq = ?",
+                                      (worker, time.time(), row[0]))
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        return {"job_id": row[1], "card": row[2], "search": row[3]}
+
+    def get(self, worker="main", timeout=None) -> dict | None:
+        """
+        Claims the next job, waiting for the crawler if the queue is empty.
+        Returns None once stopped, or once the crawl is done and nothing is
+        left, or when `timeout` seconds pass.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.stopped():
+            job = self.claim(worker)
+            if job is not None:
+                return job
+            if self.crawl_done() and self.waiting() == 0:
+                return None
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            self._sleep(self.poll_interval)
+        return None
+
+    def done(self, job_id, result) -> None:
+        with self._lock:
+            self.conn.execute("UPDATE queue SET state = 'done', result = ?, done_at = ? WHERE job_id = ?",
+                              (str(result), time.time(), str(job_id)))
+
+    def applied(self) -> int:
+        """
+        Applications submitted by all workers since the run started.
+        """
+        started_at = float(self._flag("started_at") or 0)
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM queue WHERE result = 'applied' AND done_at >= ?",
+                                     (started_at,)).fetchone()[0]
+
+    def counts(self) -> dict:
+        with self._lock:
+            return dict(self.conn.execute("SELECT state, COUNT(*) FROM queue GROUP BY state").fetchall())
+
+    def close(self) -> None:
+        self.conn.close()
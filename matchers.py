@@ -0,0 +1,76 @@
+"""
+Blacklist matching for company names and job titles.
+
+A Matcher compiles a list of phrases into one regular expression. Matching
+ignores case. A phrase only matches whole words, so "Java" does not match
+"JavaScript" and "Oho" does not match "Ohoto". Hyphens, slashes and runs of
+whitespace count as one space, so "Front-End" also matches "front end". The
+phrases are merged into a trie before compiling. Matching a card therefore
+costs about the same with ten entries as with ten thousand.
+"""
+from __future__ import annotations
+
+import re
+
+SEPARATORS_RE = re.compile(r"[\s\-_/]+")
+
+
+def normalize(text) -> str:
+    return SEPARATORS_RE.sub(" ", str(text)).strip().casefold()
+
+
+def _trie_pattern(phrases) -> str:
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node) -> str | None:
+        if list(node) == [""]:
+            return None
+        branches, leaves = [], []
+        for char in sorted(k for k in node if k):
+            rest = build(node[char])
+            if rest is None:
+                leaves.append(re.escape(char))
+            else:
+                branches.append(re.escape(char) + rest)
+        if leaves:
+            branches.append(leaves[0] if len(leaves) == 1 else "[" + "".join(leaves) + "]")
+        pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            pattern = "(?:" + pattern + ")?"
+        return pattern
+
+    return build(trie) or ""
+
+
+class Matcher:
+    def __init__(self, phrases=()):
+        self.phrases = sorted({normalize(p) for p in phrases or [] if p and normalize(p)})
+        self._re = None
+        if self.phrases:
+            self._re = re.compile(r"(?<!\w)" + _trie_pattern(self.phrases) + r"(?!\w)")
+
+    def search(self, text) -> str | None:
+        """
+        Returns the first blacklisted phrase found in `text`, or None.
+        """
+        if self._re is None or not text:
+            return None
+        match = self._re.search(normalize(text))
+        return match.group(0) if match else None
+
+    def __contains__(self, text) -> bool:
+        return self.search(text) is not None
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+    def __bool__(self) -> bool:
+        return self._re is not None
+
+    def __repr__(self) -> str:
+        return f"Matcher({len(self.phrases)} phrases)"
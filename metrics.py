@@ -0,0 +1,276 @@
+"""
+Prometheus-style metrics for long-running bot processes.
+
+The bot records into a MetricsRegistry from its decision points, and an
+optional exporter publishes the registry either on a local HTTP /metrics
+endpoint or as a textfile that is rewritten periodically (for the node
+exporter textfile collector, or just `cat`).
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+log = logging.getLogger("easyapplybot.metrics")
+
+DEFAULT_BUCKETS = (0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+
+
+def _format_labels(labelnames, values, extra=None) -> str:
+    pairs = list(zip(labelnames, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    escaped = [(k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for k, v in pairs]
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> list:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+    def total(self):
+        """
+        Returns the sum over all label values.
+        """
+        with self._lock:
+            return sum(self._values.values())
+
+    def samples(self) -> list:
+        with self._lock:
+            items = sorted(self._values.items())
+        if not items and not self.labelnames:
+            items = [((), 0)]
+        return [f"{self.name}_total{_format_labels(self.labelnames, k)} {v}" for k, v in items]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> list:
+        with self._lock:
+            items = sorted(self._values.items())
+        if not items and not self.labelnames:
+            items = [((), 0)]
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {v}" for k, v in items]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total, observed = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[key] = (counts, total + value, observed + 1)
+
+    def time(self, **labels):
+        return _HistogramTimer(self, labels)
+
+    def samples(self) -> list:
+        with self._lock:
+            items = sorted((k, (list(c), s, n)) for k, (c, s, n) in self._values.items())
+        lines = []
+        for key, (counts, total, observed) in items:
+            for bound, count in zip(self.buckets, counts):
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, ('le', bound))} {count}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, ('le', '+Inf'))} {observed}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {round(total, 6)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {observed}")
+        return lines
+
+
+class _HistogramTimer:
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.monotonic()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.monotonic() - self.start, **self.labels)
+        return False
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = {}
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            return self._metrics[metric.name]
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        return "\n".join(m.render() for m in self._metrics.values()) + "\n"
+
+
+class BotMetrics(MetricsRegistry):
+    """
+    The metrics published by EasyApplyBot.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.jobs_seen = self.counter("easyapply_jobs_seen", "Job cards seen on search result pages")
+        self.jobs_filtered = self.counter("easyapply_jobs_filtered",
+                                          "Jobs skipped before applying, by reason", ["reason"])
+        self.applications = self.counter("easyapply_applications",
+                                         "Easy Apply attempts, by result", ["result"])
+        self.applications_count = self.gauge("easyapply_applications_count",
+                                             "Applications submitted in this run")
+        self.max_applications = self.gauge("easyapply_max_applications",
+                                           "Application budget for this run")
+        self.page_load_seconds = self.histogram("easyapply_page_load_seconds",
+                                                "Time spent in load_page, by page kind", ["page"])
+        self.apply_seconds = self.histogram("easyapply_apply_seconds",
+                                            "Time spent in apply_to_job", ["result"])
+        self.browser_recycles = self.counter("easyapply_browser_recycles",
+                                             "Times the Chrome instance was replaced by the health monitor")
+        self.form_fill_seconds = self.histogram("easyapply_form_fill_seconds",
+                                                "Time spent filling one Easy Apply form step",
+                                                buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30))
+        self.apply_overruns = self.counter("easyapply_apply_overruns",
+                                           "Applications abandoned over their time or step budget, by form stage",
+                                           ["stage"])
+        self.uploads = self.counter("easyapply_uploads",
+                                    "Resumes and cover letters sent, by whether they were uploaded or reused",
+                                    ["result"])
+        self.upload_bytes_saved = self.counter("easyapply_upload_bytes_saved",
+                                               "Bytes not uploaded because LinkedIn already had the document")
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = None
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        log.debug("metrics request: " + format % args)
+
+
+class MetricsExporter:
+    """
+    Publishes a registry on http://<address>:<port>/metrics and/or to a textfile.
+    Both run on daemon threads so they never keep the bot alive.
+    """
+
+    def __init__(self, registry, port=None, address="127.0.0.1", textfile=None, interval=15):
+        self.registry = registry
+        self.port = port
+        self.address = address
+        self.textfile = textfile
+        self.interval = interval
+        self._server = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        if self.port:
+            handler = type("Handler", (_MetricsHandler,), {"registry": self.registry})
+            self._server = ThreadingHTTPServer((self.address, int(self.port)), handler)
+            threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+            log.info(f"Metrics available on http://{self.address}:{self.port}/metrics")
+        if self.textfile:
+            threading.Thread(target=self._write_loop, name="metrics-textfile", daemon=True).start()
+            log.info(f"Writing metrics to {self.textfile} every {self.interval}s")
+
+    def write_textfile(self) -> None:
+        tmp = f"{self.textfile}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.registry.render())
+        os.replace(tmp, self.textfile)
+
+    def _write_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.write_textfile()
+            except OSError as e:
+                log.warning(f"Could not write metrics textfile: {e}")
+            self._stop.wait(self.interval)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self.textfile:
+            try:
+                self.write_textfile()
+            except OSError:
+                pass
@@ -0,0 +1,133 @@
+"""
+Pacing of the bot's deliberate sleeps through an injectable clock.
+
+Every human-like pause and fixed wait in the bot goes through a Clock, tagged
+with a category (search, scroll, apply, resume, question, ...). The clock scales
+the pause by the active pacing profile, keeps a per-category total, and can
+write a trace of the sleeps and application events. A VirtualClock advances
+time without blocking, which simulate.py uses to replay a trace, or a default
+flow model, under different profiles and project applications per hour.
+"""
+from __future__ import annotations
+
+import collections
+import json
+import logging
+import random
+import time
+
+log = logging.getLogger("easyapplybot.pacing")
+
+
+class PacingProfile:
+    """
+    Multiplies every pause by `scale`, without going under `floor` seconds.
+    """
+
+    def __init__(self, name, scale=1.0, floor=0.0):
+        self.name = name
+        self.scale = scale
+        self.floor = floor
+
+    def apply(self, seconds) -> float:
+        if seconds <= 0:
+            return 0.0
+        return max(seconds * self.scale, min(seconds, self.floor))
+
+    def __repr__(self) -> str:
+        return f"PacingProfile({self.name!r}, scale={self.scale}, floor={self.floor})"
+
+
+PROFILES = {
+    "cautious": PacingProfile("cautious", scale=1.5),
+    "default": PacingProfile("default"),
+    "brisk": PacingProfile("brisk", scale=0.6, floor=0.3),
+    "fast": PacingProfile("fast", scale=0.3, floor=0.2),
+}
+
+
+def get_profile(profile) -> PacingProfile:
+    if isinstance(profile, PacingProfile):
+        return profile
+    if profile is None:
+        return PROFILES["default"]
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown pacing profile {profile!r}, expected one of {sorted(PROFILES)}")
+    return PROFILES[profile]
+
+
+class Clock:
+    def __init__(self, profile=None, trace_path=None, rng=None):
+        self.profile = get_profile(profile)
+        self.slept = collections.Counter()
+        self.blocked_seconds = 0.0
+        self._rng = rng or random.Random()
+        self._trace = open(trace_path, "a", encoding="utf-8") if trace_path else None
+        self._start = self.now()
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def _block(self, seconds) -> None:
+        start = time.monotonic()
+        time.sleep(seconds)
+        self.blocked_seconds += time.monotonic() - start
+
+    def sleep(self, seconds, category="other", scale=True) -> float:
+        """
+        Sleeps for the profile's version of a `seconds` pause, or for exactly
+        `seconds` when scale is False. The unscaled value is what goes in the
+        trace, so a trace can be replayed under any profile. Returns the
+        seconds actually slept.
+        """
+        actual = self.profile.apply(seconds) if scale else max(0.0, seconds)
+        self._write("sleep", category=category, seconds=round(seconds, 3), actual=round(actual, 3))
+        self.slept[category] += actual
+        if actual > 0:
+            self._block(actual)
+        return actual
+
+    def pause(self, category, low, high) -> float:
+        return self.sleep(self._rng.uniform(low, high), category)
+
+    def mark(self, event, **fields) -> None:
+        self._write(event, **fields)
+
+    def _write(self, event, **fields) -> None:
+        if self._trace is None:
+            return
+        record = {"t": round(self.now() - self._start, 3), "event": event}
+        record.update(fields)
+        self._trace.write(json.dumps(record) + "\n")
+
+    def summary(self) -> str:
+        total = sum(self.slept.values())
+        parts = ", ".join(f"{c} {s:.0f}s" for c, s in self.slept.most_common())
+        return f"{total:.0f}s of deliberate sleep ({parts or 'none'}) with the {self.profile.name} profile"
+
+    def close(self) -> None:
+        if self._trace is not None:
+            self._trace.close()
+            self._trace = None
+
+
+class VirtualClock(Clock):
+    """
+    A clock whose sleeps only move its own time forward.
+    """
+
+    def __init__(self, profile=None, trace_path=None, rng=None):
+        self._now = 0.0
+        super().__init__(profile, trace_path, rng)
+
+    def now(self) -> float:
+        return self._now
+
+    def _block(self, seconds) -> None:
+        self._now += seconds
+
+    def advance(self, seconds) -> None:
+        """
+        Accounts for time spent on real work, such as page loads.
+        """
+        self._now += max(0.0, seconds)
@@ -0,0 +1,245 @@
+"""
+Lazy, scoped HTML parsing for pages loaded by the bot.
+
+load_page used to build a full BeautifulSoup tree after every navigation even
+though nothing read it. A LazyPage only fetches the page source when a
+consumer asks for it, only parses when a consumer needs a tree, and can parse
+just the job description subtree instead of the whole document.
+
+Backends are tried in order: selectolax, lxml.html, BeautifulSoup and finally
+the standard library html.parser, which only supports text extraction.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from html.parser import HTMLParser
+
+log = logging.getLogger("easyapplybot.pageparse")
+
+# start of the element holding the job description, most specific first
+DESCRIPTION_MARKERS = (
+    re.compile(r"""<(\w+)[^>]*\bid=["']job-details["']"""),
+    re.compile(r"""<(\w+)[^>]*\bclass=["'][^"']*\bjobs-description-content__text"""),
+    re.compile(r"""<(\w+)[^>]*\bclass=["'][^"']*\bjobs-description__content"""),
+    re.compile(r"""<(\w+)[^>]*\bclass=["'][^"']*\bdescription__text"""),
+)
+
+_SKIP_TEXT_TAGS = {"script", "style", "noscript", "template"}
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TEXT_TAGS:
+            self._skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TEXT_TAGS and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip and data.strip():
+            self.parts.append(data.strip())
+
+
+class _Backend:
+    name = None
+
+    def parse(self, html):
+        raise NotImplementedError
+
+    def text(self, tree) -> str:
+        raise NotImplementedError
+
+    def css_text(self, tree, selector) -> list:
+        raise NotImplementedError(f"{self.name} backend does not support CSS selectors")
+
+
+class _SelectolaxBackend(_Backend):
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.parser import HTMLParser as SelectolaxParser
+        self._parser = SelectolaxParser
+
+    def parse(self, html):
+        tree = self._parser(html)
+        tree.strip_tags(list(_SKIP_TEXT_TAGS))
+        return tree
+
+    def text(self, tree) -> str:
+        root = tree.body or tree.root
+        return root.text(separator="\n", strip=True) if root is not None else ""
+
+    def css_text(self, tree, selector) -> list:
+        return [node.text(separator="\n", strip=True) for node in tree.css(selector)]
+
+
+class _LxmlBackend(_Backend):
+    name = "lxml"
+
+    def __init__(self):
+        import lxml.html
+        self._html = lxml.html
+
+    def parse(self, html):
+        tree = self._html.fromstring(html)
+        for node in tree.xpath("//script|//style|//noscript|//template"):
+            node.drop_tree()
+        return tree
+
+    def text(self, tree) -> str:
+        return "\n".join(part.strip() for part in tree.itertext() if part.strip())
+
+    def css_text(self, tree, selector) -> list:
+        return ["\n".join(p.strip() for p in node.itertext() if p.strip()) for node in tree.cssselect(selector)]
+
+
+class _BeautifulSoupBackend(_Backend):
+    name = "bs4"
+
+    def __init__(self):
+        from bs4 import BeautifulSoup
+        self._soup = BeautifulSoup
+        try:
+            import lxml  # noqa: F401
+            self._features = "lxml"
+        except ImportError:
+            self._features = "html.parser"
+
+    def parse(self, html):
+        tree = self._soup(html, self._features)
+        for node in tree(list(_SKIP_TEXT_TAGS)):
+            node.decompose()
+        return tree
+
+    def text(self, tree) -> str:
+        return tree.get_text("\n", strip=True)
+
+    def css_text(self, tree, selector) -> list:
+        return [node.get_text("\n", strip=True) for node in tree.select(selector)]
+
+
+class _StdlibBackend(_Backend):
+    name = "html.parser"
+
+    def parse(self, html):
+        extractor = _TextExtractor()
+        extractor.feed(html)
+        extractor.close()
+        return extractor.parts
+
+    def text(self, tree) -> str:
+        return "\n".join(tree)
+
+
+BACKENDS = {
+    "selectolax": _SelectolaxBackend,
+    "lxml": _LxmlBackend,
+    "bs4": _BeautifulSoupBackend,
+    "html.parser": _StdlibBackend,
+}
+
+_backend_cache = {}
+
+
+def get_backend(preferred=None) -> _Backend:
+    """
+    Returns the first available backend, starting with `preferred` if given.
+    """
+    order = [preferred] if preferred else []
+    order += [name for name in BACKENDS if name != preferred]
+    for name in order:
+        if name in _backend_cache:
+            return _backend_cache[name]
+        try:
+            backend = BACKENDS[name]()
+        except ImportError:
+            continue
+        _backend_cache[name] = backend
+        return backend
+    raise RuntimeError("No HTML parser backend available")
+
+
+def element_fragment(html, marker) -> str | None:
+    """
+    Returns the markup of the first element whose start tag matches `marker`,
+    found by balancing that tag name, without parsing the rest of the page.
+    """
+    match = marker.search(html)
+    if match is None:
+        return None
+    tag = match.group(1)
+    start = match.start()
+    tokens = re.compile(r"<(/?)%s\b[^>]*?(/?)>" % re.escape(tag), re.IGNORECASE)
+    depth = 0
+    for token in tokens.finditer(html, start):
+        if token.group(1):
+            depth -= 1
+        elif not token.group(2):
+            depth += 1
+        if depth == 0:
+            return html[start:token.end()]
+    return html[start:]
+
+
+class LazyPage:
+    """
+    A page snapshot that is fetched and parsed only on demand.
+    `source` is either the HTML string or a callable returning it; the callable
+    is invoked at most once, the first time the HTML is needed.
+    """
+
+    def __init__(self, source, backend=None):
+        self._source = source
+        self._html = source if isinstance(source, str) else None
+        self._backend_name = backend
+        self._tree = None
+        self._description = None
+
+    @property
+    def html(self) -> str:
+        if self._html is None:
+            self._html = self._source() or ""
+        return self._html
+
+    @property
+    def backend(self) -> _Backend:
+        return get_backend(self._backend_name)
+
+    @property
+    def tree(self):
+        if self._tree is None:
+            self._tree = self.backend.parse(self.html)
+        return self._tree
+
+    def text(self) -> str:
+        return self.backend.text(self.tree)
+
+    def css_text(self, selector) -> list:
+        return self.backend.css_text(self.tree, selector)
+
+    def description(self) -> str:
+        """
+        Returns the job description text, parsing only the description subtree.
+        Falls back to the text of the whole page when no description is found.
+        """
+        if self._description is None:
+            for marker in DESCRIPTION_MARKERS:
+                fragment = element_fragment(self.html, marker)
+                if fragment is not None:
+                    backend = self.backend
+                    self._description = backend.text(backend.parse(fragment))
+                    break
+            else:
+                log.debug("No job description element found, using the whole page text")
+                self._description = self.text()
+        return self._description
+
+    def __contains__(self, needle) -> bool:
+        return needle in self.html
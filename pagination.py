@@ -0,0 +1,93 @@
+"""
+Result-aware pagination of a job search.
+
+LinkedIn shows 25 jobs per page and serves at most 1000 results per search.
+The result count is read once from the results header of the first page,
+the page offsets are planned from it, and offsets past the end are never
+loaded. Without a header every page LinkedIn can serve is planned. The plan also
+counts how each page was reached, so the log shows how many full navigations
+were avoided.
+"""
+from __future__ import annotations
+
+import re
+
+PAGE_SIZE = 25
+MAX_RESULTS = 1000
+
+# "1,234 results", "1.234 results", "1 result", "1,000+ results"
+RESULT_COUNT_RE = re.compile(r"(\d{1,3}(?:[,.\u00a0 ]\d{3})*|\d+)\+?\s*results?\b", re.IGNORECASE)
+
+# the results header above the job cards, e.g. "1,234 results"
+RESULT_COUNT_JS = """
+const header = document.querySelector(
+    '.jobs-search-results-list__subtitle, .jobs-search-results-list__text, [class*="results-context-header"]');
+return header ? header.innerText : null;
+"""
+
+
+def parse_result_count(text) -> int | None:
+    """
+    Returns the number of results a search page reports, or None if the page
+    does not say.
+    """
+    if not text:
+        return None
+    match = RESULT_COUNT_RE.search(text)
+    if match is None:
+        return None
+    return int(re.sub(r"\D", "", match.group(1)))
+
+
+class PagePlan:
+    def __init__(self, page_size=PAGE_SIZE, max_results=MAX_RESULTS):
+        self.page_size = page_size
+        self.max_results = max_results
+        self.total = None
+        self.full_loads = 0
+        self.in_page = 0
+
+    def set_total(self, total) -> None:
+        self.total = total
+
+    @property
+    def last_offset(self) -> int:
+        """
+        Offset of the last page worth loading. Until the total is known, every
+        page LinkedIn can serve is planned.
+        """
+        results = self.max_results if self.total is None else min(self.total, self.max_results)
+        return max(0, (results - 1) // self.page_size * self.page_size)
+
+    def offsets(self) -> list:
+        return list(range(0, self.last_offset + 1, self.page_size))
+
+    def next_offset(self, current=None) -> int | None:
+        """
+        Returns the offset to load after `current` (the first page when None),
+        or None once the results are exhausted.
+        """
+        offset = 0 if current is None else current + self.page_size
+        if offset > self.last_offset or (self.total == 0 and offset > 0):
+            return None
+        return offset
+
+    def record(self, in_page) -> None:
+        if in_page:
+            self.in_page += 1
+        else:
+            self.full_loads += 1
+
+    @property
+    def skipped(self) -> int:
+        """
+        Pages past the end of the results that paging blindly would have loaded.
+        """
+        return (self.max_results - self.last_offset) // self.page_size - 1
+
+    def summary(self) -> str:
+        total = "unknown" if self.total is None else self.total
+        return (f"{total} results, {len(self.offsets())} pages planned, "
+                f"{self.full_loads + self.in_page} visited ({self.full_loads} full loads, {self.in_page} in-page), "
+                f"{self.in_page + self.skipped} navigations avoided "
+                f"({self.skipped} pages past the end skipped)")
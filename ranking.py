@@ -0,0 +1,97 @@
+"""
+Relevance ranking of candidate jobs before applying.
+
+The application budget usually runs out before the end of the results, so
+jobs collected from one or more search pages are ordered by how well their
+card text matches a profile built from the configured positions, optional
+profile keywords and the titles of past successful applications in out.csv.
+The score is TF-IDF cosine similarity plus a bonus for configured positions
+that appear verbatim in the card.
+"""
+from __future__ import annotations
+
+import collections
+import logging
+import math
+import re
+
+import csvstore
+
+log = logging.getLogger("easyapplybot.ranking")
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+STOPWORDS = frozenset("""a an and at for in of on or the to with by from is are be this that
+our your you we ltd limited inc llc plc remote hybrid on-site full time part""".split())
+
+PHRASE_BONUS = 0.5
+
+
+def tokenize(text) -> list:
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def _tf(tokens) -> dict:
+    counts = collections.Counter(tokens)
+    return {term: 1 + math.log(count) for term, count in counts.items()}
+
+
+def _normalize(vector) -> dict:
+    norm = math.sqrt(sum(w * w for w in vector.values()))
+    return {t: w / norm for t, w in vector.items()} if norm else vector
+
+
+def past_success_titles(filename) -> list:
+    """
+    Titles of jobs in an output file that were applied to successfully.
+    """
+    try:
+        return [row['job'] for row in csvstore.iter_results(filename) if row['result'] == 'True' and row['job']]
+    except OSError:
+        return []
+
+
+class JobRanker:
+    def __init__(self, positions, history_titles=(), keywords=()):
+        self.phrases = [p.lower() for p in positions if p]
+        self.profile_docs = [tokenize(text) for text in list(positions) + list(history_titles) + list(keywords) if text]
+        self.profile_tf = collections.Counter()
+        for doc in self.profile_docs:
+            self.profile_tf.update(doc)
+
+    @classmethod
+    def from_config(cls, positions, output_filename, keywords=()):
+        titles = past_success_titles(output_filename)
+        log.debug(f"Ranking profile built from {len(positions)} positions and {len(titles)} past applications")
+        return cls(positions, titles, keywords)
+
+    def score(self, texts) -> list:
+        """
+        Returns one relevance score per text. IDF is computed over the texts
+        being ranked plus the profile, so terms every card shares carry no weight.
+        """
+        docs = [tokenize(text) for text in texts]
+        n_docs = len(docs) + len(self.profile_docs)
+        df = collections.Counter()
+        for doc in docs + self.profile_docs:
+            df.update(set(doc))
+        idf = {term: math.log((1 + n_docs) / (1 + count)) + 1 for term, count in df.items()}
+
+        profile = _normalize({t: (1 + math.log(c)) * idf[t] for t, c in self.profile_tf.items()})
+        scores = []
+        for text, doc in zip(texts, docs):
+            vector = _normalize({t: w * idf[t] for t, w in _tf(doc).items()})
+            similarity = sum(w * profile.get(t, 0.0) for t, w in vector.items())
+            lowered = text.lower()
+            bonus = PHRASE_BONUS if any(phrase in lowered for phrase in self.phrases) else 0.0
+            scores.append(similarity + bonus)
+        return scores
+
+    def rank(self, cards) -> list:
+        """
+        Orders {jobID: card text} by descending score; returns [(jobID, score)].
+        Ties keep the page order.
+        """
+        job_ids = list(cards)
+        scores = self.score([cards[j] for j in job_ids])
+        order = sorted(range(len(job_ids)), key=lambda i: -scores[i])
+        return [(job_ids[i], scores[i]) for i in order]
@@ -0,0 +1,71 @@
+"""
+Per-account application rate limits.
+"""
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+import time
+
+log = logging.getLogger("easyapplybot.ratelimit")
+
+
+class RateLimiter:
+    """
+    Enforces a minimum interval between applications and an optional cap on
+    applications in any sliding hour. `wait` blocks until the next application
+    is allowed, `record` is called once an application was submitted.
+
+    Pipeline workers share one limiter. `wait` reserves its slot under a lock
+    before sleeping, so workers waiting at the same time get successive slots.
+    `record` moves the calling thread's slot to the submit time. A slot that
+    was never recorded is released by that thread's next `wait`.
+    """
+
+    def __init__(self, min_interval=0, max_per_hour=None, sleep=time.sleep, now=time.monotonic):
+        self.min_interval = min_interval or 0
+        self.max_per_hour = max_per_hour
+        self._sleep = sleep
+        self._now = now
+        self._recent = []  # sorted application and reserved slot times
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    def delay(self) -> float:
+        """
+        Returns how many seconds to wait before the next application.
+        """
+        with self._lock:
+            now = self._now()
+            while self._recent and now - self._recent[0] >= 3600:
+                self._recent.pop(0)
+            delay = 0.0
+            if self._recent and self.min_interval:
+                delay = max(delay, self._recent[-1] + self.min_interval - now)
+            if self.max_per_hour and len(self._recent) >= self.max_per_hour:
+                delay = max(delay, self._recent[-self.max_per_hour] + 3600 - now)
+            return delay
+
+    def _release(self) -> float | None:
+        slot = getattr(self._local, "slot", None)
+        self._local.slot = None
+        if slot is not None and slot in self._recent:
+            self._recent.remove(slot)
+        return slot
+
+    def wait(self) -> float:
+        with self._lock:
+            self._release()
+            delay = self.delay()
+            self._local.slot = self._now() + delay
+            bisect.insort(self._recent, self._local.slot)
+        if delay > 0:
+            log.info(f"Rate limit: waiting {delay:.0f}s before the next application")
+            self._sleep(delay)
+        return delay
+
+    def record(self) -> None:
+        with self._lock:
+            self._release()
+            bisect.insort(self._recent, self._now())
@@ -0,0 +1,191 @@
+"""
+Experience and skill requirements read from job descriptions.
+
+Finds "5+ years of Python", "at least three years' commercial experience"
+and similar requirements, plus the skills listed under a description's
+requirements heading. These are compared with the experience profile in
+config.yaml. A number of years only counts as a requirement when something
+marks it as one, such as "experience", "at least" or "5+". A job whose
+requirements are clearly not met is skipped before the Easy Apply button is
+clicked. The patterns are compiled once per profile.
+"""
+from __future__ import annotations
+
+import re
+
+WORD_NUMBERS = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8,
+                "nine": 9, "ten": 10, "twelve": 12, "fifteen": 15}
+NUMBER = r"(\d{1,2}|" + "|".join(WORD_NUMBERS) + ")"
+
+YEARS_RE = re.compile(
+    r"(?:(?P<minimum>at\s+least|minimum(?:\s+of)?|min\.?|more\s+than)|over)?\s*"
+    + r"(?P<years>" + NUMBER + r")\s*(?P<plus>\+|plus)?\s*(?:(?:-|–|to)\s*\d{1,2}\s*\+?\s*)?(?:years?|yrs?)['’]?"
+    r"(?P<rest>(?:[^.;\n]|\.(?=\w)){0,80})",
+    re.IGNORECASE)
+EXPERIENCE_RE = re.compile(r"\bexperience\b|\bexperienced\b", re.IGNORECASE)
+# words that make "N years" a requirement rather than e.g. a company's age
+REQUIREMENT_CUE_RE = re.compile(
+    r"\b(?:experienced?|required|requirements?|minimum|at\s+least|proven|track\s+record|hands[- ]on|"
+    r"commercial|professional)\b", re.IGNORECASE)
+# "Python: 3 years" and "Java (7 years)" list a skill with its years
+SKILL_LIST_RE = re.compile(r"[\w+#.]\s*[:(–-]\s*$")
+
+REQUIRED_HEADING_RE = re.compile(
+    r"^\W*(requirements?|required|must[- ]haves?|essential|what you(?:['’]ll)? need|what we(?:['’]re)? looking for|"
+    r"you (?:will )?have|qualifications|about you|skills(?: and experience)?)\b", re.IGNORECASE)
+OPTIONAL_HEADING_RE = re.compile(
+    r"^\W*(nice[- ]to[- ]haves?|desirable|bonus|preferred|beneficial|what we offer|benefits|perks|"
+    r"about us|(?:it['’]s )?a plus)\b", re.IGNORECASE)
+
+# skill -> spellings, matched as whole words in any case. Skills that are also
+# common English words (go, rust, swift, spark, spring, react, node) are only
+# recognised in a skill-like spelling such as "golang" or "React.js".
+SKILLS = {
+    "python": ["python"], "java": ["java"], "javascript": ["javascript", "js", "ecmascript"],
+    "typescript": ["typescript"], "go": ["golang"], "rust": ["rustlang", "rust-lang"], "c++": ["c++", "cpp"],
+    "c#": ["c#", ".net", "dotnet"], "ruby": ["ruby", "rails", "ruby on rails"], "php": ["php"],
+    "scala": ["scala"], "kotlin": ["kotlin"], "swift": ["swiftui"], "sql": ["sql"],
+    "postgresql": ["postgresql", "postgres"], "mysql": ["mysql"], "mongodb": ["mongodb", "mongo"],
+    "redis": ["redis"], "kafka": ["kafka"], "spark": ["apache spark", "pyspark", "spark sql"],
+    "airflow": ["airflow"], "django": ["django"], "flask": ["flask"], "fastapi": ["fastapi"],
+    "spring": ["spring boot", "spring framework"],
+    "react": ["react.js", "reactjs"], "angular": ["angular"], "vue": ["vue", "vue.js"],
+    "node.js": ["node.js", "nodejs"], "aws": ["aws", "amazon web services"], "gcp": ["gcp", "google cloud"],
+    "azure": ["azure"], "docker": ["docker"], "kubernetes": ["kubernetes", "k8s"], "terraform": ["terraform"],
+    "linux": ["linux"], "machine learning": ["machine learning", "ml"], "pytorch": ["pytorch"],
+    "tensorflow": ["tensorflow"], "graphql": ["graphql"], "microservices": ["microservices"],
+}
+
+
+def _number(text) -> int:
+    text = text.lower()
+    return WORD_NUMBERS[text] if text in WORD_NUMBERS else int(text)
+
+
+class Requirement:
+    def __init__(self, years, skill, text):
+        self.years = years
+        self.skill = skill  # None for a general experience requirement
+        self.text = text
+
+    def __repr__(self) -> str:
+        return f"Requirement({self.years}, {self.skill!r})"
+
+
+class Analysis:
+    def __init__(self, requirements, required_skills, unmet):
+        self.requirements = requirements
+        self.required_skills = required_skills
+        self.unmet = unmet
+
+    @property
+    def met(self) -> bool:
+        return not self.unmet
+
+    def __str__(self) -> str:
+        return "; ".join(self.unmet) if self.unmet else "requirements met"
+
+
+class RequirementsAnalyzer:
+    """
+    `years` is total professional experience and `skills` maps skills to years
+    of experience. A skill listed with no years counts as known, but its years
+    are not checked, and neither are the years of skills the profile does not
+    list. Requirements up to `slack` years above the profile still
+    pass. When `min_skill_coverage` is set and a description lists at least
+    three required skills, that share of them must be in the profile.
+    """
+
+    def __init__(self, years=None, skills=None, slack=0, min_skill_coverage=0, vocabulary=SKILLS):
+        self.years = years
+        self.slack = slack or 0
+        self.min_skill_coverage = min_skill_coverage or 0
+        vocabulary = {k: list(v) for k, v in vocabulary.items()}
+        self.skills = {}
+        for skill, skill_years in (skills or {}).items():
+            skill = str(skill).lower()
+            canonical = next((k for k, v in vocabulary.items() if skill == k or skill in v), skill)
+            vocabulary.setdefault(canonical, [canonical])
+            self.skills[canonical] = skill_years
+        self._canonical = {spelling.lower(): skill for skill, spellings in vocabulary.items()
+                           for spelling in spellings}
+        spellings = sorted(self._canonical, key=len, reverse=True)
+        self._skill_re = re.compile(r"(?<![\w+#.])(" + "|".join(re.escape(s) for s in spellings) + r")(?![\w+#])",
+                                    re.IGNORECASE)
+
+    @classmethod
+    def from_config(cls, profile):
+        """
+        Builds the analyzer from the `experience_profile` config block, or
+        returns None when the block is missing.
+        """
+        if not profile:
+            return None
+        skills = profile.get("skills") or {}
+        if isinstance(skills, list):
+            skills = dict.fromkeys(skills)
+        return cls(years=profile.get("years"), skills=skills, slack=profile.get("slack", 0),
+                   min_skill_coverage=profile.get("min_skill_coverage", 0))
+
+    def find_skills(self, text) -> list:
+        return [self._canonical[m.group(1).lower()] for m in self._skill_re.finditer(text)]
+
+    def extract(self, description) -> tuple:
+        """
+        Returns ([Requirement], set of required skills) found in a description.
+        """
+        requirements = []
+        for match in YEARS_RE.finditer(description):
+            years = _number(match.group("years"))
+            if years > 20:
+                continue
+            rest = match.group("rest")
+            line_start = description.rfind("\n", 0, match.start()) + 1
+            before = description[max(line_start, match.start() - 40):match.start()]
+            before = re.split(r"[.;]\s", before)[-1]
+            skills = self.find_skills(rest)
+            if not skills:
+                # "Python (3+ years)" and "Python: 3 years" name the skill first
+                skills = self.find_skills(before)[-1:]
+            cued = (match.group("minimum") or match.group("plus") or REQUIREMENT_CUE_RE.search(rest)
+                    or REQUIREMENT_CUE_RE.search(before) or (skills and SKILL_LIST_RE.search(before)))
+            if not cued:
+                continue
+            if skills:
+                text = match.group(0).strip()
+                requirements.extend(Requirement(years, skill, text) for skill in dict.fromkeys(skills))
+            elif EXPERIENCE_RE.search(rest) or EXPERIENCE_RE.search(before):
+                requirements.append(Requirement(years, None, match.group(0).strip()))
+
+        required = set()
+        in_required = False
+        for line in description.splitlines():
+            if OPTIONAL_HEADING_RE.match(line):
+                in_required = False
+            elif REQUIRED_HEADING_RE.match(line):
+                in_required = True
+            if in_required:
+                required.update(self.find_skills(line))
+        required.update(r.skill for r in requirements if r.skill is not None)
+        return requirements, required
+
+    def analyze(self, description) -> Analysis:
+        requirements, required = self.extract(description or "")
+        unmet = []
+        for requirement in requirements:
+            if requirement.skill is None:
+                have = self.years
+            elif requirement.skill in self.skills:
+                have = self.skills[requirement.skill]
+                have = self.years if have is None else have
+            else:
+                # the profile says nothing about this skill, min_skill_coverage covers missing skills
+                have = None
+            if have is not None and have + self.slack < requirement.years:
+                subject = requirement.skill or "experience"
+                unmet.append(f"{requirement.years} years of {subject} required, {have} in profile")
+        if self.min_skill_coverage and len(required) >= 3:
+            covered = sum(1 for skill in required if skill in self.skills)
+            if covered / len(required) < self.min_skill_coverage:
+                unmet.append(f"{covered} of {len(required)} required skills in profile")
+        return Analysis(requirements, required, list(dict.fromkeys(unmet)))
@@ -0,0 +1,210 @@
+"""
+Project applications per hour under different pacing profiles, without a browser.
+
+A run is described as a sequence of sleep and application events, either
+recorded by a live run with `pacing_trace` set in config.yaml or generated by
+a default flow model that mirrors the sleeps in easyapplybot.py. Each profile
+replays the same events on a VirtualClock: work between events keeps its
+recorded duration, sleeps are rescaled by the profile, and the application
+rate limits from the config are applied as in a live run.
+
+    python simulate.py [--trace run.jsonl ...] [--config config.yaml]
+                       [--profiles cautious default brisk fast] [--jobs 200]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+
+from pacing import PROFILES, VirtualClock
+from ratelimit import RateLimiter
+
+SCROLL_STEPS = 8  # load_page scrolls to 4000px in steps of 500
+
+
+def load_trace(path) -> list:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class _FlowRecorder:
+    """
+    Builds a trace from the default flow model, at the default profile.
+    """
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.t = 0.0
+        self.events = []
+
+    def work(self, seconds) -> None:
+        self.t += seconds
+
+    def sleep(self, seconds, category) -> None:
+        self.events.append({"t": round(self.t, 3), "event": "sleep", "category": category,
+                            "seconds": seconds, "actual": seconds})
+        self.t += seconds
+
+    def pause(self, category, low, high) -> None:
+        self.sleep(self.rng.uniform(low, high), category)
+
+    def mark(self, event, **fields) -> None:
+        self.events.append(dict({"t": round(self.t, 3), "event": event}, **fields))
+
+    def load_page(self, sleep) -> None:
+        self.work(self.rng.uniform(1.0, 3.0))
+        for _ in range(SCROLL_STEPS):
+            self.sleep(sleep, "scroll")
+        if sleep != 1:
+            self.sleep(sleep, "scroll")
+
+
+def default_flow(jobs=200, seed=0, jobs_per_page=10, easy_apply_rate=0.7, success_rate=0.8,
+                 question_rate=0.5, recruiter_invites=False) -> list:
+    """
+    Generates the events of a run that opens `jobs` job pages, `jobs_per_page`
+    of them per results page.
+    """
+    rng = random.Random(seed)
+    flow = _FlowRecorder(rng)
+    for job in range(jobs):
+        if job % jobs_per_page == 0:
+            flow.load_page(1)  # next_jobs_page
+            flow.pause("search", 2.0, 4.5)
+            flow.load_page(0.5)
+            flow.work(1.0)  # reading the job cards
+        flow.mark("job", job=str(job))
+        flow.load_page(0.5)  # get_job_page
+        flow.pause("apply", 1.5, 3.0)
+        flow.work(0.5)
+        if rng.random() >= easy_apply_rate:
+            continue
+        flow.mark("submit", job=str(job))
+        flow.work(0.5)
+        flow.pause("apply", 1.5, 2.5)
+        flow.work(1.0)  # fill_out_fields
+        for step in range(rng.randint(1, 3)):
+            flow.sleep(1, "resume")
+            flow.work(0.5)
+            if rng.random() < question_rate:
+                flow.sleep(5, "resume")
+                flow.sleep(1, "question")
+                flow.work(0.3)
+        if rng.random() < success_rate:
+            flow.mark("applied", job=str(job))
+            if recruiter_invites:
+                flow.pause("apply", 2, 4)
+                flow.work(3.0)
+                flow.pause("recruiter", 3, 6)
+        else:
+            flow.sleep(2, "resume")
+    return flow.events
+
+
+class Projection:
+    def __init__(self, profile, seconds, jobs, applications, slept, application_times):
+        self.profile = profile
+        self.seconds = seconds
+        self.jobs = jobs
+        self.applications = applications
+        self.slept = slept
+        self.application_times = application_times
+
+    @property
+    def per_hour(self) -> float:
+        return self.applications / self.seconds * 3600 if self.seconds else 0.0
+
+    @property
+    def sleep_share(self) -> float:
+        return sum(self.slept.values()) / self.seconds if self.seconds else 0.0
+
+    @property
+    def median_gap(self) -> float | None:
+        times = self.application_times
+        if len(times) < 2:
+            return None
+        return statistics.median(b - a for a, b in zip(times, times[1:]))
+
+    @property
+    def busiest_hour(self) -> int:
+        times, best, start = self.application_times, 0, 0
+        for end in range(len(times)):
+            while times[end] - times[start] >= 3600:
+                start += 1
+            best = max(best, end - start + 1)
+        return best
+
+
+def replay(events, profile, min_apply_interval=0, max_per_hour=None) -> Projection:
+    clock = VirtualClock(profile)
+    limiter = RateLimiter(min_interval=min_apply_interval, max_per_hour=max_per_hour,
+                          sleep=lambda seconds: clock.sleep(seconds, "rate_limit", scale=False),
+                          now=clock.now)
+    jobs, applications = 0, []
+    previous_end = None
+    for event in events:
+        if previous_end is not None:
+            # time between two events that was not a sleep is real page work
+            clock.advance(event["t"] - previous_end)
+        previous_end = event["t"] + (event.get("actual", 0.0) if event["event"] == "sleep" else 0.0)
+        if event["event"] == "sleep":
+            # rate limit waits are recomputed with this run's limits
+            if event["category"] != "rate_limit":
+                clock.sleep(event["seconds"], event["category"])
+        elif event["event"] == "job":
+            jobs += 1
+        elif event["event"] == "submit":
+            limiter.wait()
+        elif event["event"] == "applied":
+            limiter.record()
+            applications.append(clock.now())
+    return Projection(clock.profile.name, clock.now(), jobs, len(applications), clock.slept, applications)
+
+
+def format_projections(projections) -> str:
+    lines = [f"{'profile':10s} {'hours':>6s} {'jobs':>5s} {'applied':>7s} {'per hour':>8s} "
+             f"{'asleep':>6s} {'median gap':>10s} {'max in 1h':>9s}"]
+    for p in projections:
+        gap = f"{p.median_gap:.0f}s" if p.median_gap is not None else "-"
+        lines.append(f"{p.profile:10s} {p.seconds / 3600:6.2f} {p.jobs:5d} {p.applications:7d} {p.per_hour:8.1f} "
+                     f"{p.sleep_share:6.0%} {gap:>10s} {p.busiest_hour:9d}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Project applications per hour under pacing profiles")
+    parser.add_argument("--trace", action="append", default=[], help="trace recorded with pacing_trace")
+    parser.add_argument("--config", default=None, help="config.yaml to take the rate limits from")
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES))
+    parser.add_argument("--jobs", type=int, default=200, help="job pages in the default flow model")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    parameters = {}
+    if args.config:
+        import yaml
+        with open(args.config) as stream:
+            parameters = yaml.safe_load(stream) or {}
+    limits = {"min_apply_interval": parameters.get("min_apply_interval", 0),
+              "max_per_hour": parameters.get("max_applications_per_hour")}
+
+    if args.trace:
+        events = []
+        for path in args.trace:
+            trace = load_trace(path)
+            offset = events[-1]["t"] + events[-1].get("actual", 0.0) if events else 0.0
+            events.extend(dict(e, t=e["t"] + offset) for e in trace)
+        source = f"{len(args.trace)} recorded traces"
+    else:
+        events = default_flow(args.jobs, args.seed,
+                              recruiter_invites=parameters.get("send_recruiter_invites", False))
+        source = f"default flow model, {args.jobs} jobs"
+
+    print(f"Replaying {len(events)} events from the {source}")
+    print(format_projections([replay(events, PROFILES[name], **limits) for name in args.profiles]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+Job data from the structured payloads pages carry, instead of the rendered DOM.
+
+Job pages include a JSON-LD JobPosting block, and search and job pages embed
+the data they were rendered from as JSON inside <code> elements. One pass over
+the page source pulls the job list (IDs, titles, companies, locations) and the
+job details (salary, Easy Apply, description) out of them. Every function
+returns None when the payloads are missing or do not parse, and callers then
+use the DOM path.
+
+JobDataClient fetches the same pages over HTTP with the browser's session
+cookies through a pooled connection, so a job can be checked without being
+rendered at all.
+"""
+from __future__ import annotations
+
+import html as htmllib
+import json
+import logging
+import re
+
+import pageparse
+
+log = logging.getLogger("easyapplybot.structured")
+
+JSON_LD_RE = re.compile(r"""<script[^>]*type=["']application/ld\+json["'][^>]*>(.*?)</script>""",
+                        re.IGNORECASE | re.DOTALL)
+CODE_RE = re.compile(r"<code[^>]*>\s*(\{.*?\})\s*</code>", re.DOTALL)
+JOB_URN_RE = re.compile(r"urn:li:(?:fsd_|fs_)?(?:jobPosting|normalized_jobPosting|jobPostingCard):(?:\()?(\d+)")
+
+EASY_APPLY_TYPES = ("ComplexOnsiteApply", "SimpleOnsiteApply", "OnsiteApply")
+
+
+def json_ld(html) -> list:
+    """
+    Returns every JSON-LD object on the page, with @graph lists flattened.
+    """
+    objects = []
+    for block in JSON_LD_RE.findall(html):
+        try:
+            data = json.loads(block.strip())
+        except ValueError:
+            continue
+        stack = data if isinstance(data, list) else [data]
+        for item in stack:
+            if isinstance(item, dict):
+                objects.extend(item["@graph"] if isinstance(item.get("@graph"), list) else [item])
+    return objects
+
+
+def embedded_json(html) -> list:
+    """
+    Returns the objects listed under "included" in the JSON payloads embedded
+    in <code> elements.
+    """
+    objects = []
+    for block in CODE_RE.findall(html):
+        try:
+            data = json.loads(htmllib.unescape(block))
+        except ValueError:
+            continue
+        included = data.get("included") if isinstance(data, dict) else None
+        if isinstance(included, list):
+            objects.extend(item for item in included if isinstance(item, dict))
+    return objects
+
+
+def _text(value) -> str | None:
+    if isinstance(value, dict):
+        value = value.get("text") or value.get("name")
+    return value.strip() if isinstance(value, str) and value.strip() else None
+
+
+def _location(value) -> str | None:
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        address = value.get("address", value)
+        if isinstance(address, dict):
+            parts = [address.get(k) for k in ("addressLocality", "addressRegion", "addressCountry")]
+            parts = [_text(p) if isinstance(p, dict) else p for p in parts]
+            return ", ".join(p for p in parts if isinstance(p, str) and p) or None
+    return _text(value)
+
+
+def _salary(value) -> tuple:
+    """
+    Returns (yearly, hourly) from a schema.org MonetaryAmount; the lower bound
+    of a range, as parse_salary does. The salary filters are in pounds, so
+    amounts in another currency are ignored.
+    """
+    if not isinstance(value, dict):
+        return None, None
+    currency = str(value.get("currency") or "GBP").upper()
+    if currency != "GBP":
+        return None, None
+    amount = value.get("value", value)
+    if isinstance(amount, dict):
+        unit = str(amount.get("unitText") or value.get("unitText") or "").upper()
+        number = amount.get("minValue", amount.get("value"))
+    else:
+        unit = str(value.get("unitText") or "").upper()
+        number = amount
+    try:
+        number = float(number)
+    except (TypeError, ValueError):
+        return None, None
+    if unit == "HOUR":
+        return None, number
+    if unit in ("YEAR", ""):
+        return int(number), None
+    return None, None
+
+
+def _job_id(value) -> str | None:
+    if isinstance(value, dict):
+        value = value.get("value")
+    if isinstance(value, (int, str)) and str(value).isdigit():
+        return str(value)
+    match = JOB_URN_RE.search(str(value or ""))
+    return match.group(1) if match else None
+
+
+def _easy_apply(item) -> bool | None:
+    apply_method = item.get("applyMethod")
+    kind = None
+    if isinstance(apply_method, dict):
+        kind = apply_method.get("$type") or next(iter(apply_method), None)
+    elif isinstance(apply_method, str):
+        kind = apply_method
+    if kind is None:
+        return None
+    return any(t in kind for t in EASY_APPLY_TYPES)
+
+
+def _job_records(html) -> dict:
+    """
+    Merges what the embedded payloads say about each job into one record per job ID.
+    """
+    records = {}
+    for item in embedded_json(html):
+        job_id = None
+        for key in ("entityUrn", "jobPostingUrn", "*jobPosting", "jobPosting", "preDashNormalizedJobPostingUrn"):
+            job_id = _job_id(item.get(key))
+            if job_id:
+                break
+        if not job_id:
+            continue
+        record = records.setdefault(job_id, {"job_id": job_id})
+        title = _text(item.get("title")) or _text(item.get("jobPostingTitle"))
+        company = (_text(item.get("companyName")) or _text(item.get("primaryDescription"))
+                   or _text((item.get("companyDetails") or {}).get("companyName")))
+        location = _text(item.get("formattedLocation")) or _text(item.get("secondaryDescription"))
+        for key, value in (("title", title), ("company", company), ("location", location)):
+            if value and not record.get(key):
+                record[key] = value
+        easy_apply = _easy_apply(item)
+        if easy_apply is not None:
+            record["easy_apply"] = easy_apply
+        description = _text(item.get("description"))
+        if description and not record.get("description"):
+            record["description"] = description
+    return records
+
+
+def job_cards(html) -> dict | None:
+    """
+    Returns {job_id: card text} for the jobs listed on a search page, with the
+    title, company and location on separate lines like a rendered card, or
+    None if the page carries no job list.
+    """
+    cards = {}
+    for job_id, record in _job_records(html).items():
+        if record.get("title"):
+            cards[job_id] = "\n".join(record[k] for k in ("title", "company", "location") if record.get(k))
+    return cards or None
+
+
+def job_details(html, job_id=None) -> dict | None:
+    """
+    Returns {"job_id", "title", "company", "location", "salary_yearly",
+    "salary_hourly", "easy_apply", "description"} for a job page, from its
+    JSON-LD JobPosting and embedded payloads, or None if neither is present.
+    Fields the payloads do not carry are None.
+    """
+    details = dict.fromkeys(("job_id", "title", "company", "location", "salary_yearly", "salary_hourly",
+                             "easy_apply", "description"))
+    details["job_id"] = None if job_id is None else str(job_id)
+    found = False
+    for item in json_ld(html):
+        if item.get("@type") != "JobPosting":
+            continue
+        posting_id = _job_id(item.get("identifier"))
+        if details["job_id"] and posting_id and posting_id != details["job_id"]:
+            continue
+        found = True
+        details["title"] = _text(item.get("title"))
+        details["company"] = _text(item.get("hiringOrganization"))
+        details["location"] = _location(item.get("jobLocation"))
+        details["salary_yearly"], details["salary_hourly"] = _salary(item.get("baseSalary"))
+        if isinstance(item.get("directApply"), bool):
+            details["easy_apply"] = item["directApply"]
+        description = item.get("description")
+        if isinstance(description, str) and description:
+            details["description"] = pageparse.get_backend().text(
+                pageparse.get_backend().parse(htmllib.unescape(description)))
+        details["job_id"] = details["job_id"] or posting_id
+        break
+    records = _job_records(html)
+    record = records.get(details["job_id"]) if details["job_id"] else None
+    # a page with one embedded job only stands in for an unidentified job,
+    # otherwise it could be another job's record
+    if details["job_id"] is None and len(records) == 1:
+        record = next(iter(records.values()))
+    if record is not None:
+        found = True
+        for key in ("job_id", "title", "company", "location", "easy_apply", "description"):
+            if details[key] is None and record.get(key) is not None:
+                details[key] = record[key]
+    return details if found else None
+
+
+class JobDataClient:
+    """
+    Fetches job pages over HTTP with the browser's LinkedIn session, reusing
+    pooled connections. urllib3 comes with selenium.
+    """
+
+    def __init__(self, cookies, user_agent=None, pool_size=4, timeout=10):
+        import urllib3
+
+        jar = "; ".join(f"{c['name']}={c['value']}" for c in cookies if c.get("name"))
+        csrf = next((c["value"].strip('"') for c in cookies if c.get("name") == "JSESSIONID"), None)
+        self.headers = {"cookie": jar, "accept": "text/html,application/xhtml+xml",
+                        "user-agent": user_agent or "Mozilla/5.0"}
+        if csrf:
+            self.headers["csrf-token"] = csrf
+        self.timeout = timeout
+        self.pool = urllib3.PoolManager(num_pools=2, maxsize=pool_size, retries=False)
+        self.fetched = 0
+        self.failed = 0
+
+    @classmethod
+    def from_browser(cls, browser, **kwargs):
+        user_agent = None
+        try:
+            user_agent = browser.execute_script("return navigator.userAgent")
+        except Exception:
+            pass
+        return cls(browser.get_cookies(), user_agent=user_agent, **kwargs)
+
+    def fetch(self, url) -> str | None:
+        try:
+            response = self.pool.request("GET", url, headers=self.headers, timeout=self.timeout, redirect=False)
+        except Exception as e:
+            self.failed += 1
+            log.debug(f"Fetching {url} failed: {e}")
+            return None
+        if response.status != 200:
+            self.failed += 1
+            log.debug(f"Fetching {url} returned HTTP {response.status}")
+            return None
+        self.fetched += 1
+        return response.data.decode("utf-8", errors="replace")
+
+    def fetch_job(self, job_id, base_url="https://www.linkedin.com") -> dict | None:
+        page = self.fetch(f"{base_url}/jobs/view/{job_id}/")
+        return job_details(page, job_id) if page else None
+
+    def fetch_cards(self, search_url) -> dict | None:
+        page = self.fetch(search_url)
+        return job_cards(page) if page else None
@@ -0,0 +1,218 @@
+"""
+Run the bot for several accounts on one host.
+
+Reads an accounts file listing one profile per candidate. Each profile has its
+own config.yaml-style block (inline or as a path), qa.csv, output file, job
+cache and Chrome user-data-dir, so the browsers never share state. Profiles
+run in a process pool whose size is bounded by CPU count and available RAM,
+each with its own application rate limit, and the supervisor prints a
+combined status table while they run.
+
+    python supervisor.py [accounts.yaml]
+
+accounts.yaml:
+
+    max_concurrency: 3            # optional upper bound
+    memory_per_browser_mb: 1500   # RAM reserved per running account
+    status_interval: 30           # seconds between status tables
+    status_file: accounts_status.json
+    accounts:
+      - name: alice
+        config: accounts/alice/config.yaml   # or an inline mapping
+        qa_file: accounts/alice/qa.csv
+        output_filename: accounts/alice/out.csv
+        profile_path: accounts/alice/chrome
+        min_apply_interval: 90
+        max_applications_per_hour: 20
+"""
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import yaml
+
+log = logging.getLogger("easyapplybot.supervisor")
+
+# account keys that override the account's config block
+ACCOUNT_OVERRIDES = ("qa_file", "output_filename", "profile_path", "job_cache", "corpus", "upload_registry",
+                     "job_queue", "history", "debug_artifacts", "min_apply_interval", "max_applications_per_hour",
+                     "metrics_port", "metrics_textfile", "max_applications")
+
+
+def available_memory_mb() -> float | None:
+    try:
+        import psutil
+        return psutil.virtual_memory().available / 2 ** 20
+    except ImportError:
+        pass
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def plan_concurrency(accounts, max_concurrency=None, memory_per_browser_mb=1500) -> int:
+    """
+    One Chrome per account needs roughly a core and `memory_per_browser_mb` of
+    RAM; run as many accounts at once as both allow, and at least one.
+    """
+    limits = [len(accounts), os.cpu_count() or 1]
+    if max_concurrency:
+        limits.append(max_concurrency)
+    memory = available_memory_mb()
+    if memory is not None and memory_per_browser_mb:
+        limits.append(int(memory // memory_per_browser_mb))
+    return max(1, min(limits))
+
+
+def account_parameters(account, base_dir=".") -> dict:
+    """
+    Builds the bot parameters for one account from its config block and the
+    per-account overrides.
+    """
+    config = account.get("config", {})
+    if isinstance(config, str):
+        path = config if os.path.isabs(config) else os.path.join(base_dir, config)
+        with open(path, "r") as stream:
+            config = yaml.safe_load(stream)
+    parameters = dict(config)
+    for key in ACCOUNT_OVERRIDES:
+        if key in account:
+            parameters[key] = account[key]
+    name = account["name"]
+    parameters.setdefault("qa_file", os.path.join("accounts", name, "qa.csv"))
+    parameters.setdefault("output_filename", os.path.join("accounts", name, "out.csv"))
+    parameters.setdefault("profile_path", os.path.join("accounts", name, "chrome"))
+    parameters.setdefault("job_cache", os.path.join("accounts", name, "job_cache.db"))
+    parameters.setdefault("corpus", os.path.join("accounts", name, "corpus"))
+    parameters.setdefault("upload_registry", os.path.join("accounts", name, "upload_registry.json"))
+    parameters.setdefault("job_queue", os.path.join("accounts", name, "job_queue.db"))
+    parameters.setdefault("history", os.path.join("accounts", name, "history"))
+    parameters.setdefault("debug_artifacts", os.path.join("accounts", name, "debug_artifacts"))
+    return parameters
+
+
+def _report(status, name, bot_metrics, state) -> None:
+    status[name] = {
+        "state": state,
+        "applications": bot_metrics.applications_count.value(),
+        "max_applications": bot_metrics.max_applications.value(),
+        "jobs_seen": bot_metrics.jobs_seen.value(),
+        "jobs_filtered": bot_metrics.jobs_filtered.total(),
+        "failed": bot_metrics.applications.value(result="failed"),
+        "updated": time.time(),
+    }
+
+
+def run_account(name, parameters, status, report_interval=5) -> int:
+    """
+    Runs one account in a worker process and returns its application count.
+    """
+    import easyapplybot
+    from metrics import BotMetrics
+
+    for key in ("qa_file", "output_filename", "profile_path", "job_cache", "job_queue"):
+        directory = os.path.dirname(str(parameters.get(key) or ""))
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    bot_metrics = BotMetrics()
+    stop = threading.Event()
+
+    def report_loop():
+        while not stop.wait(report_interval):
+            _report(status, name, bot_metrics, "running")
+
+    _report(status, name, bot_metrics, "starting")
+    threading.Thread(target=report_loop, name=f"status-{name}", daemon=True).start()
+    try:
+        easyapplybot.validate_config(parameters)
+        easyapplybot.run(parameters, metrics=bot_metrics)
+    except BaseException as e:
+        stop.set()
+        _report(status, name, bot_metrics, f"failed: {e}")
+        raise
+    stop.set()
+    _report(status, name, bot_metrics, "done")
+    return bot_metrics.applications_count.value()
+
+
+def format_status(status) -> str:
+    lines = [f"{'account':16s} {'state':12s} {'applied':>9s} {'seen':>6s} {'filtered':>8s} {'failed':>6s}"]
+    totals = [0, 0, 0, 0]
+    for name in sorted(status):
+        row = status[name]
+        applied = f"{row['applications']}/{row['max_applications']}"
+        lines.append(f"{name:16s} {row['state'][:12]:12s} {applied:>9s} {row['jobs_seen']:6d} "
+                     f"{row['jobs_filtered']:8d} {row['failed']:6d}")
+        totals = [a + b for a, b in zip(totals, [row['applications'], row['jobs_seen'],
+                                                  row['jobs_filtered'], row['failed']])]
+    lines.append(f"{'total':16s} {'':12s} {totals[0]:9d} {totals[1]:6d} {totals[2]:8d} {totals[3]:6d}")
+    return "\n".join(lines)
+
+
+def supervise(accounts_file="accounts.yaml") -> dict:
+    with open(accounts_file, "r") as stream:
+        settings = yaml.safe_load(stream)
+    accounts = [a for a in settings.get("accounts", []) if a]
+    if not accounts:
+        raise Exception(f"No accounts listed in {accounts_file}")
+    names = [a.get("name") for a in accounts]
+    if None in names or len(set(names)) != len(names):
+        raise Exception("Every account needs a unique name")
+
+    base_dir = os.path.dirname(os.path.abspath(accounts_file))
+    workers = plan_concurrency(accounts, settings.get("max_concurrency"),
+                               settings.get("memory_per_browser_mb", 1500))
+    interval = settings.get("status_interval", 30)
+    status_file = settings.get("status_file")
+    log.info(f"Running {len(accounts)} accounts, {workers} at a time")
+
+    manager = multiprocessing.Manager()
+    status = manager.dict()
+    for name in names:
+        status[name] = {"state": "queued", "applications": 0, "max_applications": 0,
+                        "jobs_seen": 0, "jobs_filtered": 0, "failed": 0, "updated": time.time()}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_account, a["name"], account_parameters(a, base_dir), status): a["name"]
+                   for a in accounts}
+        while True:
+            snapshot = dict(status)
+            log.info("\n" + format_status(snapshot))
+            if status_file:
+                with open(status_file + ".tmp", "w") as f:
+                    json.dump(snapshot, f, indent=2)
+                os.replace(status_file + ".tmp", status_file)
+            if all(future.done() for future in futures):
+                break
+            time.sleep(interval)
+
+    results = {}
+    for future, name in futures.items():
+        try:
+            results[name] = future.result()
+        except BaseException as e:
+            log.error(f"Account {name} failed: {e}")
+            results[name] = None
+    return results
+
+
+if __name__ == '__main__':
+    import easyapplybot  # noqa: F401  importing it sets up the console and file logs
+    results = supervise(sys.argv[1] if len(sys.argv) > 1 else "accounts.yaml")
+    log.info(f"Applications per account: {results}")
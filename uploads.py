@@ -0,0 +1,175 @@
+"""
+Resume and cover letter variants, and reuse of documents LinkedIn already has.
+
+The `uploads` in config.yaml are the default documents of each kind.
+`upload_variants` adds named alternatives, and `position_uploads` says which
+variant to send for a search position. Documents are identified by the
+SHA-256 of their content. The registry file remembers which contents have
+been uploaded to the account, under which file name, and how long the upload
+took. When the Easy Apply form lists a previously uploaded document with the
+chosen file name, and the registry says that content was uploaded, the bot
+selects it instead of uploading the file again. Editing a file changes its
+hash, so the new version is uploaded. A file name that was uploaded with more
+than one content is always uploaded afresh, because the form cannot show
+which card holds which version. Give variants distinct file names.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+log = logging.getLogger("easyapplybot.uploads")
+
+# weight of the newest upload time in a document's running average
+UPLOAD_SECONDS_WEIGHT = 0.3
+
+
+def file_digest(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class Document:
+    def __init__(self, kind, name, path, digest, size):
+        self.kind = kind
+        self.name = name
+        self.path = path
+        self.filename = os.path.basename(path)
+        self.digest = digest
+        self.size = size
+
+    def __repr__(self) -> str:
+        return f"Document({self.kind!r}, {self.name!r}, {self.filename!r}, {self.digest[:12]})"
+
+
+class UploadManager:
+    def __init__(self, uploads=None, variants=None, positions=None, registry_path="upload_registry.json"):
+        """
+        `uploads` is {kind: path}, `variants` {kind: {name: path}} and
+        `positions` {position: variant name, or {kind: variant name}}.
+        Without a `registry_path` the registry only lives for this run.
+        """
+        self.paths = {}
+        for kind, path in (uploads or {}).items():
+            self.paths.setdefault(kind, {})["default"] = path
+        for kind, named in (variants or {}).items():
+            for name, path in (named or {}).items():
+                self.paths.setdefault(kind, {})[str(name)] = path
+        self.positions = {}
+        for position, choice in (positions or {}).items():
+            choice = choice if isinstance(choice, dict) else {kind: choice for kind in self.paths}
+            for kind, name in choice.items():
+                if str(name) not in self.paths.get(kind, {}):
+                    raise ValueError(f"position_uploads: {position} uses unknown {kind} variant {name!r}")
+            self.positions[position.strip().casefold()] = {kind: str(name) for kind, name in choice.items()}
+        self.registry_path = registry_path
+        self.registry = self._load()
+        self._lock = threading.Lock()
+        self._digests = {}
+        self.uploaded = 0
+        self.reused = 0
+        self.seconds_saved = 0.0
+        self.bytes_saved = 0
+
+    def _load(self) -> dict:
+        if not self.registry_path or not os.path.isfile(self.registry_path):
+            return {}
+        try:
+            with open(self.registry_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring the upload registry {self.registry_path}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        if not self.registry_path:
+            return
+        with open(self.registry_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self.registry, f, indent=1, sort_keys=True)
+        os.replace(self.registry_path + ".tmp", self.registry_path)
+
+    def has(self, kind) -> bool:
+        return kind in self.paths
+
+    def document(self, kind, name="default") -> Document | None:
+        """
+        Returns a variant with its content hash, hashing the file again only
+        when its size or modification time changed.
+        """
+        path = self.paths.get(kind, {}).get(name)
+        if not path:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            log.warning(f"{kind} {name} cannot be read: {e}")
+            return None
+        signature = (path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            digest = self._digests.get(signature)
+        if digest is None:
+            digest = file_digest(path)
+            with self._lock:
+                self._digests[signature] = digest
+        return Document(kind, name, path, digest, stat.st_size)
+
+    def choose(self, kind, position=None) -> Document | None:
+        """
+        Returns the document of `kind` to send for a search position.
+        """
+        name = self.positions.get((position or "").strip().casefold(), {}).get(kind, "default")
+        document = self.document(kind, name)
+        if document is None and name != "default":
+            document = self.document(kind)
+        return document
+
+    def known(self, document) -> bool:
+        """
+        True if this content was uploaded to the account under the same file
+        name, and no other uploaded content has that name. LinkedIn's list of
+        previous uploads only shows file names, so two contents with one name
+        cannot be told apart.
+        """
+        with self._lock:
+            entry = self.registry.get(document.digest)
+            if entry is None or entry["filename"] != document.filename:
+                return False
+            others = [digest for digest, other in self.registry.items()
+                      if other["filename"] == document.filename and digest != document.digest]
+        if others:
+            log.debug(f"Not reusing {document.filename}: {len(others)} other uploaded documents have that name")
+        return not others
+
+    def record_upload(self, document, seconds) -> None:
+        with self._lock:
+            entry = self.registry.get(document.digest)
+            if entry is None or entry["filename"] != document.filename:
+                entry = self.registry[document.digest] = {
+                    "kind": document.kind, "name": document.name, "filename": document.filename,
+                    "size": document.size, "first_uploaded": round(time.time()), "uploads": 0, "reuses": 0,
+                    "upload_seconds": seconds}
+            previous = entry["upload_seconds"]
+            entry["upload_seconds"] = round(previous + UPLOAD_SECONDS_WEIGHT * (seconds - previous), 3)
+            entry["uploads"] += 1
+            self.uploaded += 1
+            self._save()
+
+    def record_reuse(self, document) -> None:
+        with self._lock:
+            entry = self.registry[document.digest]
+            entry["reuses"] += 1
+            self.reused += 1
+            self.seconds_saved += entry["upload_seconds"]
+            self.bytes_saved += document.size
+            self._save()
+
+    def summary(self) -> str:
+        return (f"{self.uploaded} uploaded, {self.reused} reused, saving about {self.seconds_saved:.0f}s "
+                f"and {self.bytes_saved / 2 ** 20:.1f} MiB")
@@ -0,0 +1,367 @@
+"""
+Record and replay of the WebDriver commands behind each application.
+
+In record mode (`webtrace_dir` in config.yaml) every WebDriver command issued
+while the bot is inside a traced flow (apply_to_job, send_resume,
+process_questions, find_recruiter_info) is captured with its parameters,
+response and latency. Page sources are kept once per distinct DOM snapshot.
+Each application is saved as one compressed trace, together with the bot
+settings and saved answers it ran with.
+
+Replay runs the same bot code against a ReplayDriver that answers every
+command from the trace, without a browser, and compares the commands and
+latency of each flow with its budget:
+
+    python webtrace.py check [traces] [--budgets webtrace_budgets.yaml] [--tolerance 0.25]
+    python webtrace.py show TRACE
+
+`check` exits with status 1 when a flow goes over budget. Without a budgets
+file, the budget of a flow is what it cost when recorded, plus the tolerance.
+Budgets files map flow names to per-application limits:
+
+    send_resume: {commands: 120, seconds: 20}
+"""
+from __future__ import annotations
+
+import argparse
+import collections
+import copy
+import functools
+import glob
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+log = logging.getLogger("easyapplybot.webtrace")
+
+# bot settings a trace is replayed with, by EasyApplyBot keyword
+REPLAY_CONTEXT = ("phone_number", "salary", "rate", "uploads", "blacklist", "blackListTitles",
+                  "experience_level", "min_salary_yearly", "min_salary_hourly", "send_recruiter_invites",
+                  "skip_zero_experience", "use_linkedin_resume", "apply_deadline", "apply_max_steps",
+                  "experience_profile")
+
+SNAPSHOT_COMMANDS = {"getPageSource"}
+
+
+class FlowStats:
+    """
+    Commands and latency per flow name. A command counts towards every flow it
+    was issued under, so apply_to_job includes its send_resume. The latency of
+    a flow is its WebDriver command time plus the time spent in the bot's own
+    code, leaving out deliberate pacing sleeps.
+    """
+
+    def __init__(self):
+        self.commands = collections.Counter()
+        self.command_seconds = collections.Counter()
+        self.local_seconds = collections.Counter()
+
+    def add_command(self, path, seconds) -> None:
+        for name in set(path):
+            self.commands[name] += 1
+            self.command_seconds[name] += seconds
+
+    def to_dict(self) -> dict:
+        names = sorted(set(self.commands) | set(self.local_seconds))
+        return {name: {"commands": self.commands[name],
+                       "seconds": round(self.command_seconds[name] + self.local_seconds[name], 3)}
+                for name in names}
+
+
+class TraceRecorder:
+    """
+    Wraps a driver's execute() to capture commands issued inside traced flows.
+    When `directory` is None the traces are only kept in memory, in `finished`.
+    """
+
+    def __init__(self, directory=None, context=None, clock=None):
+        self.directory = directory
+        self.context = context
+        self.clock = clock
+        self._execute_seconds = 0.0
+        self.finished = []
+        self._stack = []
+        self._trace = None
+        self._stats = None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def attach(self, browser) -> None:
+        execute = getattr(browser, "_untraced_execute", browser.execute)
+
+        def traced_execute(driver_command, params=None):
+            if not self._stack:
+                return execute(driver_command, params)
+            start = time.perf_counter()
+            try:
+                response = execute(driver_command, params)
+            except Exception as e:
+                self._record(browser, driver_command, params, start, error=e)
+                raise
+            finally:
+                self._execute_seconds += time.perf_counter() - start
+            self._record(browser, driver_command, params, start, response=response)
+            return response
+
+        browser._untraced_execute = execute
+        browser.execute = traced_execute
+
+    def _record(self, browser, command, params, start, response=None, error=None) -> None:
+        # a replayed command reports the latency it had when recorded
+        seconds = getattr(browser, "replayed_seconds", None)
+        if seconds is None:
+            seconds = time.perf_counter() - start
+        path = tuple(self._stack)
+        self._stats.add_command(path, seconds)
+        entry = {"flow": "/".join(path), "command": command,
+                 "params": _jsonable(browser, {k: v for k, v in (params or {}).items() if k != "sessionId"}),
+                 "seconds": round(seconds, 4)}
+        if error is not None:
+            entry["error"] = [type(error).__name__, str(error).splitlines()[0] if str(error) else ""]
+        else:
+            value = _jsonable(browser, (response or {}).get("value"))
+            if command in SNAPSHOT_COMMANDS and isinstance(value, str):
+                digest = hashlib.sha1(value.encode("utf-8")).hexdigest()
+                self._trace["snapshots"].setdefault(digest, value)
+                value = {"$snapshot": digest}
+            entry["value"] = value
+        self._trace["commands"].append(entry)
+
+    @contextmanager
+    def flow(self, name, key=None):
+        root = not self._stack
+        if root:
+            self._trace = {"key": None if key is None else str(key), "recorded_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                           "context": self.context() if self.context else {}, "commands": [], "snapshots": {}}
+            self._stats = FlowStats()
+        self._stack.append(name)
+        start = (time.perf_counter(), self._execute_seconds, self._blocked())
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            if name not in self._stack:
+                wall = time.perf_counter() - start[0]
+                local = wall - (self._execute_seconds - start[1]) - (self._blocked() - start[2])
+                self._stats.local_seconds[name] += max(0.0, local)
+            if root:
+                self._finish()
+
+    def _blocked(self) -> float:
+        return self.clock.blocked_seconds if self.clock is not None else 0.0
+
+    def _finish(self) -> None:
+        self._trace["stats"] = self._stats.to_dict()
+        self.finished.append(self._trace)
+        if self.directory:
+            name = f"{time.strftime('%Y%m%d-%H%M%S')}-{self._trace['key'] or 'flow'}.json.gz"
+            path = os.path.join(self.directory, name)
+            try:
+                with gzip.open(path, "wt", encoding="utf-8") as f:
+                    json.dump(self._trace, f, ensure_ascii=False)
+                log.debug(f"Saved WebDriver trace {path}: {self._trace['stats']}")
+            except OSError as e:
+                log.error(f"Could not save WebDriver trace {path}: {e}")
+            self.finished = []
+        self._trace = None
+
+
+def traced(name):
+    """
+    Marks a bot method as a traced flow; the first argument, if any, names the trace.
+    """
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            tracer = getattr(self, "tracer", None)
+            if tracer is None:
+                return method(self, *args, **kwargs)
+            with tracer.flow(name, key=args[0] if args else None):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _jsonable(browser, value):
+    wrap = getattr(browser, "_wrap_value", None)
+    value = wrap(value) if wrap is not None else value
+    return json.loads(json.dumps(value, default=str))
+
+
+def _key(command, params) -> str:
+    return command + " " + json.dumps(params, sort_keys=True)
+
+
+def load_trace(path) -> dict:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _replay_driver_class():
+    from selenium.common import exceptions
+    from selenium.webdriver import ChromeOptions
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+    class ReplayDriver(WebDriver):
+        """
+        A WebDriver that answers commands from a recorded trace. A command is
+        matched on its name and parameters; repeated commands get the recorded
+        responses in order, then the last one again. Commands the trace never
+        saw get an empty answer and are counted as unmatched.
+        """
+
+        def __init__(self, trace):
+            self.snapshots = trace["snapshots"]
+            self.responses = collections.defaultdict(collections.deque)
+            self.latency = collections.defaultdict(list)
+            for entry in trace["commands"]:
+                self.responses[_key(entry["command"], entry["params"])].append(entry)
+                self.latency[entry["command"]].append(entry["seconds"])
+            self.matched = 0
+            self.unmatched = collections.Counter()
+            self.replayed_seconds = 0.0
+            self._last_page = next(iter(self.snapshots.values()), "")
+            # the executor is never contacted, every command is answered by execute()
+            super().__init__(command_executor="http://127.0.0.1:9", options=ChromeOptions())
+
+        def execute(self, driver_command, params=None):
+            if driver_command == "newSession":
+                return {"value": {"sessionId": "replay", "capabilities": {"browserName": "chrome"}}}
+            params = self._wrap_value({k: v for k, v in (params or {}).items() if k != "sessionId"})
+            queue = self.responses.get(_key(driver_command, json.loads(json.dumps(params, default=str))))
+            if not queue:
+                self.unmatched[driver_command] += 1
+                seconds = self.latency.get(driver_command)
+                self.replayed_seconds = sorted(seconds)[len(seconds) // 2] if seconds else 0.0
+                return {"value": self._unmatched_value(driver_command)}
+            entry = queue.popleft() if len(queue) > 1 else queue[0]
+            self.matched += 1
+            self.replayed_seconds = entry["seconds"]
+            if "error" in entry:
+                error, message = entry["error"]
+                raise getattr(exceptions, error, exceptions.WebDriverException)(message)
+            value = entry.get("value")
+            if isinstance(value, dict) and "$snapshot" in value:
+                value = self._last_page = self.snapshots[value["$snapshot"]]
+            return {"value": self._unwrap_value(copy.deepcopy(value))}
+
+        def _unmatched_value(self, command):
+            if command == "findElement":
+                raise exceptions.NoSuchElementException("not in the recorded trace")
+            if command == "findElements":
+                return []
+            if command == "getPageSource":
+                return self._last_page
+            return None
+
+    return ReplayDriver
+
+
+def replay_trace(trace, workdir) -> tuple:
+    """
+    Runs apply_to_job for a recorded trace against a ReplayDriver. Returns
+    (replayed FlowStats as a dict, driver).
+    """
+    import csvstore
+    from easyapplybot import EasyApplyBot
+    from jobcache import JobCache
+    from pacing import VirtualClock
+    from ratelimit import RateLimiter
+
+    driver = _replay_driver_class()(trace)
+    qa_file = os.path.join(workdir, "qa.csv")
+    csvstore.ensure_file(qa_file, header=csvstore.QA_COLUMNS)
+    for question, answer in (trace["context"].get("answers") or {}).items():
+        csvstore.append_row(qa_file, [question, answer])
+    context = {k: v for k, v in trace["context"].items() if k in REPLAY_CONTEXT}
+    clock = VirtualClock()
+    recorder = TraceRecorder(clock=clock)
+    bot = EasyApplyBot("", "", context.pop("phone_number"), context.pop("salary"), context.pop("rate"),
+                       filename=os.path.join(workdir, "out.csv"),
+                       job_cache=JobCache(os.path.join(workdir, "job_cache.db")),
+                       qa_file=qa_file, corpus=None, rank_jobs=False, max_applications=10 ** 6,
+                       clock=clock,
+                       rate_limiter=RateLimiter(sleep=lambda s: clock.sleep(s, "rate_limit", scale=False),
+                                                now=clock.now),
+                       browser=driver, tracer=recorder, **context)
+    try:
+        bot.apply_to_job(trace["key"])
+    except Exception as e:
+        log.warning(f"Replay of {trace['key']} raised {type(e).__name__}: {e}")
+    finally:
+        bot.answers.close()
+        bot.job_cache.close()
+    stats = recorder.finished[-1]["stats"] if recorder.finished else {}
+    return stats, driver
+
+
+def check(paths, budgets=None, tolerance=0.25) -> int:
+    """
+    Replays every trace and prints each flow's cost against its budget.
+    Returns the number of flows over budget.
+    """
+    failures = 0
+    print(f"{'trace':32s} {'flow':20s} {'commands':>15s} {'seconds':>17s}")
+    for path in paths:
+        trace = load_trace(path)
+        with tempfile.TemporaryDirectory() as workdir:
+            replayed, driver = replay_trace(trace, workdir)
+        for flow, recorded in sorted(trace["stats"].items()):
+            got = replayed.get(flow, {"commands": 0, "seconds": 0.0})
+            limit = (budgets or {}).get(flow) or {
+                "commands": int(recorded["commands"] * (1 + tolerance)) + 1,
+                "seconds": recorded["seconds"] * (1 + tolerance) + 0.5,
+            }
+            over = got["commands"] > limit["commands"] or got["seconds"] > limit["seconds"]
+            failures += over
+            print(f"{os.path.basename(path)[:32]:32s} {flow:20s} "
+                  f"{got['commands']:6d} / {limit['commands']:<6d} {got['seconds']:7.2f} / {limit['seconds']:<7.2f}"
+                  f"{'  OVER BUDGET' if over else ''}")
+        if driver.unmatched:
+            print(f"{'':32s} {sum(driver.unmatched.values())} commands not in the trace: {dict(driver.unmatched)}")
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Record/replay performance checks for WebDriver flows")
+    commands = parser.add_subparsers(dest="command", required=True)
+    check_parser = commands.add_parser("check")
+    check_parser.add_argument("traces", nargs="?", default="traces")
+    check_parser.add_argument("--budgets", default=None)
+    check_parser.add_argument("--tolerance", type=float, default=0.25)
+    show_parser = commands.add_parser("show")
+    show_parser.add_argument("trace")
+    args = parser.parse_args()
+
+    if args.command == "show":
+        trace = load_trace(args.trace)
+        print(f"{trace['key']} recorded {trace['recorded_at']}: {len(trace['commands'])} commands, "
+              f"{len(trace['snapshots'])} DOM snapshots")
+        for flow, stats in trace["stats"].items():
+            print(f"  {flow:20s} {stats['commands']:6d} commands {stats['seconds']:8.2f}s")
+        by_command = collections.Counter(entry["command"] for entry in trace["commands"])
+        for command, count in by_command.most_common():
+            print(f"  {command:32s} {count}")
+        return
+
+    paths = sorted(glob.glob(os.path.join(args.traces, "*.json.gz"))) if os.path.isdir(args.traces) else [args.traces]
+    if not paths:
+        sys.exit(f"No traces in {args.traces}")
+    budgets = None
+    if args.budgets:
+        import yaml
+        with open(args.budgets) as stream:
+            budgets = yaml.safe_load(stream)
+    failures = check(paths, budgets, args.tolerance)
+    print(f"{failures} flows over budget in {len(paths)} traces")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()